@@ -0,0 +1,212 @@
+"""
+Implementa o Algoritmo A* (A-estrela) para caminho mais curto entre
+um par de nós (s, t), como variante do Algoritmo de Dijkstra.
+
+A fila de prioridade é ordenada por g(v) + h(v), onde g(v) é a distância
+conhecida de 's' até 'v' e h(v) é uma estimativa (heurística) da distância
+de 'v' até 't'. Com h admissível (nunca superestima) e consistente
+(h(x) <= w(xy) + h(y)), o resultado é idêntico ao do Dijkstra, porém
+expandindo menos nós. Com h = 0, o A* é exatamente o Dijkstra.
+
+Heurísticas prontas (a partir das coordenadas dos nós):
+- heuristica_euclidiana
+- heuristica_manhattan
+- heuristica_haversine (coordenadas geográficas em graus)
+"""
+
+import heapq
+import math
+
+from algoritmo_dijkstra import reconstruir_caminho
+
+
+def heuristica_nula(no, destino):
+    """
+    Heurística h = 0. Com ela o A* se comporta como o Dijkstra, o que
+    serve de referência para medir o ganho das outras heurísticas.
+    """
+    return 0
+
+
+def heuristica_euclidiana(coordenadas, escala=1.0):
+    """
+    Cria a heurística de distância euclidiana (linha reta).
+
+    Entrada:
+    - coordenadas (dict): {no: (x, y)}.
+    - escala (float): Fator multiplicativo. Para ser admissível, todo
+      peso w(uv) deve ser >= escala * distância euclidiana(u, v).
+
+    Saída:
+    - (function): h(no, destino).
+    """
+    def h(no, destino):
+        x1, y1 = coordenadas[no]
+        x2, y2 = coordenadas[destino]
+        return escala * math.hypot(x1 - x2, y1 - y2)
+    return h
+
+
+def heuristica_manhattan(coordenadas, escala=1.0):
+    """
+    Cria a heurística de distância de Manhattan (|dx| + |dy|), adequada
+    a grades onde só há movimentos horizontais e verticais.
+
+    Entrada:
+    - coordenadas (dict): {no: (x, y)}.
+    - escala (float): Fator multiplicativo (ver 'heuristica_euclidiana').
+
+    Saída:
+    - (function): h(no, destino).
+    """
+    def h(no, destino):
+        x1, y1 = coordenadas[no]
+        x2, y2 = coordenadas[destino]
+        return escala * (abs(x1 - x2) + abs(y1 - y2))
+    return h
+
+
+def heuristica_haversine(coordenadas, raio=6371.0):
+    """
+    Cria a heurística de distância de grande círculo (fórmula de haversine),
+    para nós com coordenadas geográficas.
+
+    Entrada:
+    - coordenadas (dict): {no: (latitude, longitude)} em graus.
+    - raio (float): Raio da esfera, na mesma unidade dos pesos
+      (padrão: raio médio da Terra em km).
+
+    Saída:
+    - (function): h(no, destino).
+    """
+    def h(no, destino):
+        lat1, lon1 = map(math.radians, coordenadas[no])
+        lat2, lon2 = map(math.radians, coordenadas[destino])
+        a = (math.sin((lat2 - lat1) / 2) ** 2
+             + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+        return 2 * raio * math.asin(min(1.0, math.sqrt(a)))
+    return h
+
+
+def a_estrela(grafo, no_inicial, no_final, heuristica=heuristica_nula,
+              depurar=False, estatisticas=None):
+    """
+    Executa o A* de 'no_inicial' até 'no_final'.
+
+    Entrada:
+    - grafo (dict): O grafo direcionado (lista de adjacência).
+    - no_inicial (int): O nó de origem (s).
+    - no_final (int): O nó de destino (t).
+    - heuristica (function): h(no, destino), estimativa admissível da
+      distância de 'no' até 'destino'.
+    - depurar (bool): Se True, verifica a consistência da heurística em
+      cada aresta relaxada e lança ValueError se ela for violada.
+    - estatisticas (dict): Se fornecido, recebe os contadores da consulta:
+      'nos_expandidos' e 'insercoes_heap'.
+
+    Saída:
+    - (dict): Distâncias {no: distancia} dos nós fixados.
+    - (dict): Predecessores {no: predecessor} dos nós fixados.
+      Se 'no_final' for inalcançável, ele não aparece nos dicionários.
+    """
+    if depurar and heuristica(no_final, no_final) != 0:
+        raise ValueError("Heurística inconsistente: h(destino) deve ser 0")
+
+    nos_expandidos = 0
+    insercoes_heap = 1
+
+    provisorias = {no_inicial: 0}
+    pred_provisorios = {no_inicial: None}
+    distancias = {}
+    predecessores = {}
+
+    # Entradas (f = g + h, -g, nó): em empates de f, expande primeiro
+    # o nó mais distante da origem (mais próximo do destino)
+    fila = [(heuristica(no_inicial, no_final), 0, no_inicial)]
+
+    while fila:
+        _, menos_dist_x, x = heapq.heappop(fila)
+        dist_x = -menos_dist_x
+
+        if x in distancias or dist_x > provisorias[x]:
+            continue
+
+        distancias[x] = dist_x
+        predecessores[x] = pred_provisorios[x]
+        nos_expandidos += 1
+
+        if x == no_final:
+            break
+
+        h_x = heuristica(x, no_final) if depurar else None
+
+        for y, peso_xy in grafo.get(x, {}).items():
+            h_y = None
+            if depurar:
+                h_y = heuristica(y, no_final)
+                if h_x > peso_xy + h_y + 1e-9:
+                    raise ValueError(
+                        f"Heurística inconsistente na aresta ({x}, {y}): "
+                        f"h({x})={h_x} > w={peso_xy} + h({y})={h_y}")
+
+            if y in distancias:
+                continue
+            nova_distancia = dist_x + peso_xy
+            if nova_distancia < provisorias.get(y, math.inf):
+                provisorias[y] = nova_distancia
+                pred_provisorios[y] = x
+                if h_y is None:
+                    h_y = heuristica(y, no_final)
+                heapq.heappush(fila, (nova_distancia + h_y, -nova_distancia, y))
+                insercoes_heap += 1
+
+    if estatisticas is not None:
+        estatisticas['nos_expandidos'] = nos_expandidos
+        estatisticas['insercoes_heap'] = insercoes_heap
+
+    return distancias, predecessores
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+
+    # Grade 30x30 com coordenadas; pesos horizontais/verticais = 1
+    lado = 30
+    coordenadas = {}
+    grade = {}
+    for i in range(lado):
+        for j in range(lado):
+            no = i * lado + j
+            coordenadas[no] = (i, j)
+            grade[no] = {}
+            if i + 1 < lado:
+                grade[no][no + lado] = 1
+            if i > 0:
+                grade[no][no - lado] = 1
+            if j + 1 < lado:
+                grade[no][no + 1] = 1
+            if j > 0:
+                grade[no][no - 1] = 1
+
+    no_de_inicio = 0
+    no_de_fim = lado * lado - 1
+
+    print(f"Executando A* em uma grade {lado}x{lado} "
+          f"de (s={no_de_inicio}) para (fim={no_de_fim})...")
+
+    heuristicas = [
+        ("Nula (Dijkstra)", heuristica_nula),
+        ("Euclidiana", heuristica_euclidiana(coordenadas)),
+        ("Manhattan", heuristica_manhattan(coordenadas)),
+    ]
+
+    for nome, h in heuristicas:
+        estatisticas = {}
+        dist, pred = a_estrela(grade, no_de_inicio, no_de_fim, h,
+                               depurar=True, estatisticas=estatisticas)
+        caminho = reconstruir_caminho(pred, no_de_inicio, no_de_fim)
+        print(f"\n  Heurística: {nome}")
+        print(f"  Custo:             {dist[no_de_fim]}")
+        print(f"  Arestas:           {len(caminho) - 1}")
+        print(f"  Nós expandidos:    {estatisticas['nos_expandidos']}")
+        print(f"  Inserções no heap: {estatisticas['insercoes_heap']}")
@@ -0,0 +1,941 @@
+"""
+Manutenção dinâmica de uma Árvore Geradora Mínima (AGM).
+
+Em vez de executar novamente o Kruskal ou o Prim a cada mudança no custo
+de um enlace, a classe AGMDinamica parte de uma AGM já calculada (por
+exemplo, a saída de 'kruskal') e a mantém sob inserções, mudanças de
+peso e remoções de arestas.
+
+A floresta é guardada em uma link-cut tree (Sleator e Tarjan, 1983) em
+que cada aresta da árvore também é um nó, com o seu peso como valor; os
+vértices têm valor -inf. Assim, a aresta de maior peso no caminho entre
+dois vértices sai de uma consulta de máximo no caminho, em O(log V)
+amortizado.
+
+As arestas do grafo ficam em duas partes:
+
+- E_D: as arestas presentes na última reconstrução, guardadas na
+  estrutura de níveis de Holm, de Lichtenberg e Thorup (2001) sobre
+  florestas de passeios de Euler. Ela só aceita remoções e mantém a
+  floresta geradora mínima F_D de E_D: removida uma aresta de F_D, a
+  substituta é procurada nível a nível a partir do lado menor do corte,
+  em O(log² V) amortizado.
+- B: as arestas inseridas (ou com peso alterado, que saem de E_D) desde
+  a última reconstrução.
+
+Como AGM(E_D ∪ B) = AGM(F_D ∪ B), só as arestas de F_D e de B disputam
+a AGM, e as que estão fora dela são no máximo 2|B|. Essas candidatas
+ficam em um heap binário (heapq) com remoção preguiçosa, como no motor
+'heap' do Dijkstra: cada entrada tem uma marca, e entradas cuja marca
+não é mais a da aresta são descartadas quando aparecem no topo. Quando
+|B| passa de max(16, √E), a estrutura de níveis é reconstruída com
+todas as arestas, tendo a AGM atual como floresta (sem recalcular a
+AGM), e B se esvazia. Com E arestas:
+
+- Inserção (ou diminuição de peso) da aresta u - v: se u e v estão em
+  árvores diferentes, a aresta entra; senão, ela substitui a aresta mais
+  pesada do caminho u ~ v, se for mais leve que ela. O(log V + log E).
+- Remoção ou aumento de peso de uma aresta: a remoção em E_D custa
+  O(log² V) amortizado. Se a aresta era da AGM, a reconexão mais barata
+  é a primeira candidata do heap, em ordem de peso, cujos extremos estão
+  em árvores diferentes: O(√E (log V + log E)) no pior caso.
+- Reconstrução: O(E log V), a cada √E inserções em B, somada ao
+  potencial da estrutura de níveis (cada aresta sobe no máximo log2 V
+  níveis entre reconstruções).
+
+No total, cada atualização custa O(√E log² V) amortizado. Não é
+polilogarítmico: isso exigiria a redução de Holm, de Lichtenberg e
+Thorup do caso só com remoções para o totalmente dinâmico, que não está
+implementada aqui; o limite vem de manter B pequeno.
+"""
+
+import heapq
+import math
+import random
+from itertools import count
+
+from algoritmo_kruskal import kruskal_direcionado
+from grafo_csr import GrafoCSR
+
+
+class _LinkCutTree:
+    """
+    Link-cut tree com nós numerados 0..n-1 em listas paralelas, máximo
+    do caminho e reversão preguiçosa (para 'tornar_raiz').
+    """
+
+    def __init__(self):
+        self.esq = []
+        self.dir = []
+        self.pai = []
+        self.inv = []
+        self.valor = []
+        self.maximo = []  # nó de maior valor na subárvore da splay
+
+    def novo_no(self, valor):
+        no = len(self.valor)
+        self.esq.append(-1)
+        self.dir.append(-1)
+        self.pai.append(-1)
+        self.inv.append(False)
+        self.valor.append(valor)
+        self.maximo.append(no)
+        return no
+
+    def reiniciar_no(self, no, valor):
+        self.esq[no] = self.dir[no] = self.pai[no] = -1
+        self.inv[no] = False
+        self.valor[no] = valor
+        self.maximo[no] = no
+
+    def _eh_raiz(self, x):
+        # Raiz da sua árvore splay (o pai, se houver, é só um "path-parent")
+        p = self.pai[x]
+        return p == -1 or (self.esq[p] != x and self.dir[p] != x)
+
+    def _atualizar(self, x):
+        valor, maximo = self.valor, self.maximo
+        m = x
+        for filho in (self.esq[x], self.dir[x]):
+            if filho != -1 and valor[maximo[filho]] > valor[m]:
+                m = maximo[filho]
+        maximo[x] = m
+
+    def _empurrar(self, x):
+        if self.inv[x]:
+            esq, dir = self.esq[x], self.dir[x]
+            self.esq[x], self.dir[x] = dir, esq
+            if esq != -1:
+                self.inv[esq] = not self.inv[esq]
+            if dir != -1:
+                self.inv[dir] = not self.inv[dir]
+            self.inv[x] = False
+
+    def _rotacionar(self, x):
+        esq, dir, pai = self.esq, self.dir, self.pai
+        p = pai[x]
+        g = pai[p]
+        p_era_raiz = self._eh_raiz(p)
+        if esq[p] == x:
+            b = dir[x]
+            esq[p] = b
+            dir[x] = p
+        else:
+            b = esq[x]
+            dir[p] = b
+            esq[x] = p
+        if b != -1:
+            pai[b] = p
+        if not p_era_raiz:
+            if esq[g] == p:
+                esq[g] = x
+            else:
+                dir[g] = x
+        pai[x] = g
+        pai[p] = x
+        self._atualizar(p)
+        self._atualizar(x)
+
+    def _splay(self, x):
+        # Aplica as reversões pendentes de cima para baixo antes de girar
+        caminho = [x]
+        y = x
+        while not self._eh_raiz(y):
+            y = self.pai[y]
+            caminho.append(y)
+        for y in reversed(caminho):
+            self._empurrar(y)
+
+        esq, pai = self.esq, self.pai
+        while not self._eh_raiz(x):
+            p = pai[x]
+            if not self._eh_raiz(p):
+                g = pai[p]
+                if (esq[g] == p) == (esq[p] == x):
+                    self._rotacionar(p)
+                else:
+                    self._rotacionar(x)
+            self._rotacionar(x)
+
+    def acessar(self, x):
+        """Torna o caminho da raiz até x o caminho preferido; x fica na raiz da splay."""
+        ultimo = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.dir[y] = ultimo
+            self._atualizar(y)
+            ultimo = y
+            y = self.pai[y]
+        self._splay(x)
+
+    def tornar_raiz(self, x):
+        self.acessar(x)
+        self.inv[x] = not self.inv[x]
+
+    def raiz(self, x):
+        self.acessar(x)
+        while True:
+            self._empurrar(x)
+            if self.esq[x] == -1:
+                break
+            x = self.esq[x]
+        self._splay(x)
+        return x
+
+    def ligar(self, x, y):
+        """Liga x (de outra árvore) como filho de y."""
+        self.tornar_raiz(x)
+        self.pai[x] = y
+
+    def cortar(self, x, y):
+        """Corta a aresta entre os nós adjacentes x e y."""
+        self.tornar_raiz(x)
+        self.acessar(y)
+        self.esq[y] = -1
+        self.pai[x] = -1
+        self._atualizar(y)
+
+    def maximo_caminho(self, x, y):
+        """Nó de maior valor no caminho x ~ y (que devem estar conectados)."""
+        self.tornar_raiz(x)
+        self.acessar(y)
+        return self.maximo[y]
+
+    def definir_valor(self, x, valor):
+        self.acessar(x)
+        self.valor[x] = valor
+        self._atualizar(x)
+
+
+class _FlorestaEuler:
+    """
+    Floresta de passeios de Euler (Henzinger e King, 1999) em treaps com
+    ponteiro para o pai. Os vértices são os nós 0..n-1; cada aresta da
+    floresta tem dois nós de arco (i -> j e j -> i). A sequência de uma
+    árvore é o seu passeio de Euler, visto como circular, e a raiz da
+    treap identifica a árvore.
+
+    Cada nó agrega sobre a sua subárvore da treap: 'tam' (nós de vértice),
+    'melhor' (nó de vértice de menor 'chave') e 'marcado' (se há arco com
+    'marca').
+    """
+
+    def __init__(self, num_vertices, semente=0):
+        self._sorteio = random.Random(semente)
+        self.esq = [-1] * num_vertices
+        self.dir = [-1] * num_vertices
+        self.pai = [-1] * num_vertices
+        self.prioridade = [self._sorteio.random() for _ in range(num_vertices)]
+        self.eh_vertice = [1] * num_vertices
+        self.tam = [1] * num_vertices
+        self.chave = [None] * num_vertices
+        self.melhor = [-1] * num_vertices
+        self.marca = [None] * num_vertices
+        self.marcado = [False] * num_vertices
+        self._livres = []  # nós de arco reutilizáveis
+
+    def _novo_arco(self):
+        if self._livres:
+            no = self._livres.pop()
+            self.esq[no] = self.dir[no] = self.pai[no] = -1
+            self.marca[no] = None
+            self.marcado[no] = False
+            return no
+        self.esq.append(-1)
+        self.dir.append(-1)
+        self.pai.append(-1)
+        self.prioridade.append(self._sorteio.random())
+        self.eh_vertice.append(0)
+        self.tam.append(0)
+        self.chave.append(None)
+        self.melhor.append(-1)
+        self.marca.append(None)
+        self.marcado.append(False)
+        return len(self.esq) - 1
+
+    def _atualizar(self, x):
+        chave, melhor, marcado = self.chave, self.melhor, self.marcado
+        tam = self.eh_vertice[x]
+        m = x if chave[x] is not None else -1
+        tem_marca = self.marca[x] is not None
+        for filho in (self.esq[x], self.dir[x]):
+            if filho != -1:
+                tam += self.tam[filho]
+                outro = melhor[filho]
+                if outro != -1 and (m == -1 or chave[outro] < chave[m]):
+                    m = outro
+                tem_marca = tem_marca or marcado[filho]
+        self.tam[x] = tam
+        melhor[x] = m
+        marcado[x] = tem_marca
+
+    def _subir(self, x):
+        while x != -1:
+            self._atualizar(x)
+            x = self.pai[x]
+
+    def raiz(self, x):
+        pai = self.pai
+        while pai[x] != -1:
+            x = pai[x]
+        return x
+
+    def _juntar(self, a, b):
+        # Concatena as sequências das treaps de raízes a e b
+        if a == -1:
+            return b
+        if b == -1:
+            return a
+        if self.prioridade[a] > self.prioridade[b]:
+            filho = self._juntar(self.dir[a], b)
+            self.dir[a] = filho
+            self.pai[filho] = a
+            self._atualizar(a)
+            return a
+        filho = self._juntar(a, self.esq[b])
+        self.esq[b] = filho
+        self.pai[filho] = b
+        self._atualizar(b)
+        return b
+
+    def _dividir(self, x):
+        """Divide a sequência de x em (antes de x, de x em diante)."""
+        esq, dir, pai = self.esq, self.dir, self.pai
+        antes = esq[x]
+        if antes != -1:
+            pai[antes] = -1
+            esq[x] = -1
+        self._atualizar(x)
+        depois = x
+        filho, p = x, pai[x]
+        while p != -1:
+            acima = pai[p]
+            if dir[p] == filho:
+                dir[p] = antes
+                if antes != -1:
+                    pai[antes] = p
+                self._atualizar(p)
+                antes = p
+            else:
+                esq[p] = depois
+                pai[depois] = p
+                self._atualizar(p)
+                depois = p
+            filho, p = p, acima
+        if antes != -1:
+            pai[antes] = -1
+        pai[depois] = -1
+        return antes, depois
+
+    def _sem_primeiro(self, r):
+        """Tira o primeiro nó da treap de raiz r e devolve a nova raiz."""
+        x = r
+        while self.esq[x] != -1:
+            x = self.esq[x]
+        filho, p = self.dir[x], self.pai[x]
+        if filho != -1:
+            self.pai[filho] = p
+        self.dir[x] = self.pai[x] = -1
+        if p == -1:
+            return filho
+        self.esq[p] = filho
+        self._subir(p)
+        return r
+
+    def _reenraizar(self, v):
+        antes, depois = self._dividir(v)
+        return self._juntar(depois, antes)
+
+    def ligar(self, i, j):
+        """Liga os vértices i e j (de árvores diferentes); devolve os dois arcos."""
+        arco_ij, arco_ji = self._novo_arco(), self._novo_arco()
+        self._atualizar(arco_ij)
+        self._atualizar(arco_ji)
+        lado_i = self._juntar(self._reenraizar(i), arco_ij)
+        lado_j = self._juntar(self._reenraizar(j), arco_ji)
+        self._juntar(lado_i, lado_j)
+        return arco_ij, arco_ji
+
+    def cortar(self, arco_ij, arco_ji):
+        """Corta a aresta dos arcos dados, que voltam a ficar livres."""
+        antes, resto = self._dividir(arco_ij)
+        if self.raiz(arco_ji) == resto:
+            meio, fim = self._dividir(arco_ji)
+            self._sem_primeiro(meio)
+            self._juntar(antes, self._sem_primeiro(fim))
+        else:
+            inicio, meio = self._dividir(arco_ji)
+            self._sem_primeiro(meio)
+            self._juntar(inicio, self._sem_primeiro(resto))
+        self._livres.append(arco_ij)
+        self._livres.append(arco_ji)
+
+    def conectados(self, i, j):
+        return self.raiz(i) == self.raiz(j)
+
+    def tamanho(self, v):
+        return self.tam[self.raiz(v)]
+
+    def menor(self, v):
+        """Vértice de menor chave na árvore de v, ou -1 se nenhum tem chave."""
+        return self.melhor[self.raiz(v)]
+
+    def definir_chave(self, v, chave):
+        self.chave[v] = chave
+        self._subir(v)
+
+    def definir_marca(self, arco, marca):
+        self.marca[arco] = marca
+        self._subir(arco)
+
+    def marcas(self, v):
+        """Marcas de todos os arcos marcados da árvore de v."""
+        encontradas = []
+        pilha = [self.raiz(v)]
+        while pilha:
+            x = pilha.pop()
+            if self.marca[x] is not None:
+                encontradas.append(self.marca[x])
+            for filho in (self.esq[x], self.dir[x]):
+                if filho != -1 and self.marcado[filho]:
+                    pilha.append(filho)
+        return encontradas
+
+
+class _FlorestaDecremental:
+    """
+    Floresta geradora mínima sob remoções de arestas, pela estrutura de
+    níveis de Holm, de Lichtenberg e Thorup (2001).
+
+    Cada aresta tem um nível entre 0 e log2(V), que só aumenta. As arestas
+    da floresta de nível >= i formam F_i, guardada na floresta de Euler
+    do nível i, e valem os invariantes:
+
+    - cada árvore de F_i tem no máximo V / 2^i vértices;
+    - os extremos de uma aresta de nível i fora da floresta estão na mesma
+      árvore de F_i;
+    - a aresta mais pesada de um ciclo tem o menor nível do ciclo.
+
+    Removida uma aresta da floresta de nível l, a substituta é procurada
+    do nível l para baixo, pelo lado menor do corte: as arestas de nível i
+    da árvore desse lado sobem para i + 1, e as arestas de nível i fora da
+    floresta que incidem nele são examinadas em ordem de peso. As que não
+    cruzam o corte também sobem; a primeira que cruza é a substituta.
+    Pelo terceiro invariante, ela é a mais leve de todas as que cruzam.
+    Cada subida custa O(log V) e cada aresta sobe no máximo log2(V) vezes,
+    então a remoção custa O(log² V) amortizado.
+    """
+
+    def __init__(self, num_vertices, arvore, fora):
+        """
+        Args:
+            num_vertices: Os vértices são 0..num_vertices-1
+            arvore: Chaves (i, j) das arestas de uma floresta geradora mínima
+            fora: Tuplas (peso, i, j) das demais arestas
+        """
+        self._num_vertices = num_vertices
+        self._florestas = []
+        self._nivel = {}       # chave -> nível
+        self._arcos = {}       # chave da floresta -> [arcos no nível 0, 1, ...]
+        self._peso = {}        # chave fora da floresta -> (peso, ordem)
+        self._incidentes = {}  # (nível, vértice) -> heap de (peso, ordem, chave)
+
+        for chave in arvore:
+            self._ligar(chave, 0)
+        # A ordem desempata pesos iguais; as arestas da floresta ficam
+        # implicitamente antes das de fora com o mesmo peso
+        ordem = count()
+        for peso, i, j in fora:
+            chave = (i, j)
+            self._peso[chave] = (peso, next(ordem))
+            self._incluir_fora(chave, 0)
+
+    def __contains__(self, chave):
+        return chave in self._nivel
+
+    def na_floresta(self, chave):
+        return chave in self._arcos
+
+    def _floresta(self, nivel):
+        while len(self._florestas) <= nivel:
+            self._florestas.append(_FlorestaEuler(self._num_vertices, len(self._florestas)))
+        return self._florestas[nivel]
+
+    def _ligar(self, chave, nivel):
+        # A aresta entra em F_0..F_nivel e fica marcada no próprio nível
+        self._nivel[chave] = nivel
+        arcos = self._arcos[chave] = [self._floresta(i).ligar(*chave)
+                                      for i in range(nivel + 1)]
+        self._florestas[nivel].definir_marca(arcos[nivel][0], chave)
+
+    def _subir_arvore(self, chave):
+        nivel = self._nivel[chave]
+        arcos = self._arcos[chave]
+        self._florestas[nivel].definir_marca(arcos[nivel][0], None)
+        floresta = self._floresta(nivel + 1)
+        arcos.append(floresta.ligar(*chave))
+        floresta.definir_marca(arcos[nivel + 1][0], chave)
+        self._nivel[chave] = nivel + 1
+
+    def _incluir_fora(self, chave, nivel):
+        self._nivel[chave] = nivel
+        entrada = self._peso[chave] + (chave,)
+        floresta = self._floresta(nivel)
+        for v in chave:
+            heap = self._incidentes.setdefault((nivel, v), [])
+            heapq.heappush(heap, entrada)
+            if heap[0] is entrada:
+                floresta.definir_chave(v, entrada)
+
+    def _atualizar_vertice(self, nivel, v):
+        # Descarta as entradas que perderam a validade (aresta removida,
+        # na floresta ou em outro nível) e refaz a chave do vértice
+        heap = self._incidentes.get((nivel, v))
+        if heap is None:
+            return
+        while heap and (heap[0][2] not in self._peso or self._nivel[heap[0][2]] != nivel):
+            heapq.heappop(heap)
+        topo = heap[0] if heap else None
+        if not heap:
+            del self._incidentes[(nivel, v)]
+        floresta = self._florestas[nivel]
+        if floresta.chave[v] is not topo:
+            floresta.definir_chave(v, topo)
+
+    def remover(self, chave):
+        """
+        Remove a aresta 'chave'.
+
+        Returns:
+            Chave da aresta que entrou na floresta no lugar dela, ou None
+        """
+        nivel = self._nivel.pop(chave)
+        if chave in self._peso:
+            del self._peso[chave]
+            for v in chave:
+                self._atualizar_vertice(nivel, v)
+            return None
+
+        arcos = self._arcos.pop(chave)
+        self._florestas[nivel].definir_marca(arcos[nivel][0], None)
+        for i, (arco_ij, arco_ji) in enumerate(arcos):
+            self._florestas[i].cortar(arco_ij, arco_ji)
+        for i in range(nivel, -1, -1):
+            substituta = self._procurar(i, *chave)
+            if substituta is not None:
+                return substituta
+        return None
+
+    def _procurar(self, nivel, u, v):
+        floresta = self._florestas[nivel]
+        if floresta.tamanho(u) > floresta.tamanho(v):
+            u, v = v, u
+
+        # O lado de u tem no máximo metade dos vértices: as suas arestas
+        # de nível 'nivel' podem subir sem quebrar o primeiro invariante
+        for chave in floresta.marcas(u):
+            self._subir_arvore(chave)
+
+        while True:
+            x = floresta.menor(u)
+            if x == -1:
+                return None
+            chave = floresta.chave[x][2]
+            i, j = chave
+            if floresta.conectados(j if i == x else i, u):
+                # Não cruza o corte: sobe junto com o lado de u
+                self._incluir_fora(chave, nivel + 1)
+            else:
+                del self._peso[chave]
+                self._ligar(chave, nivel)
+            self._atualizar_vertice(nivel, i)
+            self._atualizar_vertice(nivel, j)
+            if chave in self._arcos:
+                return chave
+
+
+class AGMDinamica:
+    """
+    Árvore (ou floresta) geradora mínima de um grafo não direcionado,
+    mantida sob mudanças nas arestas.
+
+    Atributos:
+        custo_total: Soma dos pesos das arestas da AGM
+    """
+
+    def __init__(self, grafo, agm=None):
+        """
+        Args:
+            grafo: Dicionário {u: {v: peso}} ou GrafoCSR, tratado como não
+                   direcionado (com arestas repetidas, vale o menor peso).
+                   O grafo original não é alterado
+            agm: Lista de arestas (u, v, peso) de uma AGM já calculada
+                 (ex: a saída de 'kruskal'). Se None, é calculada com
+                 'kruskal_direcionado'
+
+        Raises:
+            ValueError: Se 'agm' tiver um ciclo ou uma aresta fora do grafo
+        """
+        if isinstance(grafo, GrafoCSR):
+            grafo = grafo.para_dict()
+        if agm is None:
+            agm, _ = kruskal_direcionado(grafo)
+
+        self._rotulos = {}    # nó do vértice na link-cut tree -> rótulo
+        self._indice = {}
+        self._lct = _LinkCutTree()
+        # (i, j) com i < j -> [peso, nó da aresta ou None, marca, está em E_D]
+        self._arestas = {}
+        # Heap de (peso, marca, i, j) das arestas de F_D e de B fora da AGM
+        self._fora = []
+        self._num_fora = 0    # entradas válidas em '_fora'
+        self._marcas = count()
+        self._livres = []     # nós de aresta reutilizáveis
+        self._no_aresta = {}  # nó de aresta na link-cut tree -> (i, j)
+        self._estrutura = None  # _FlorestaDecremental com as arestas de E_D
+        self._novas = 0       # |B|
+        self._limite = 0      # |B| que dispara a reconstrução
+        self.custo_total = 0
+
+        for u, vizinhos in grafo.items():
+            i = self._indice_de(u)
+            for v, peso in vizinhos.items():
+                j = self._indice_de(v)
+                if i == j:
+                    continue
+                chave = (i, j) if i < j else (j, i)
+                if chave not in self._arestas or peso < self._arestas[chave][0]:
+                    self._arestas[chave] = [peso, None, None, True]
+
+        for u, v, _ in agm:
+            chave = self._chave(u, v)
+            if chave not in self._arestas:
+                raise ValueError(f"A aresta {u} - {v} da AGM não existe no grafo")
+            i, j = chave
+            if self._lct.raiz(i) == self._lct.raiz(j):
+                raise ValueError(f"A aresta {u} - {v} fecha um ciclo na AGM")
+            self._ligar(chave)
+        self._reconstruir()
+
+    def _indice_de(self, v):
+        i = self._indice.get(v)
+        if i is None:
+            i = self._lct.novo_no(-math.inf)
+            self._indice[v] = i
+            self._rotulos[i] = v
+        return i
+
+    def _chave(self, u, v):
+        i, j = self._indice.get(u), self._indice.get(v)
+        if i is None or j is None:
+            return None
+        return (i, j) if i < j else (j, i)
+
+    def _aresta(self, chave):
+        i, j = chave
+        return self._rotulos[i], self._rotulos[j], self._arestas[chave][0]
+
+    def _ligar(self, chave):
+        # A aresta vira um nó entre os seus extremos: i - no - j
+        dados = self._arestas[chave]
+        if self._livres:
+            no = self._livres.pop()
+            self._lct.reiniciar_no(no, dados[0])
+        else:
+            no = self._lct.novo_no(dados[0])
+        self._lct.ligar(chave[0], no)
+        self._lct.ligar(no, chave[1])
+        dados[1] = no
+        self._no_aresta[no] = chave
+        self.custo_total += dados[0]
+
+    def _cortar(self, chave):
+        dados = self._arestas[chave]
+        no = dados[1]
+        self._lct.cortar(chave[0], no)
+        self._lct.cortar(no, chave[1])
+        dados[1] = None
+        del self._no_aresta[no]
+        self._livres.append(no)
+        self.custo_total -= dados[0]
+
+    def _reconstruir(self):
+        """
+        Recria a estrutura de níveis com todas as arestas, tendo a AGM
+        atual como floresta, e esvazia B e o heap de candidatas.
+        """
+        fora = []
+        for chave, dados in self._arestas.items():
+            dados[2] = None
+            dados[3] = True
+            if dados[1] is None:
+                fora.append((dados[0],) + chave)
+        # Os índices dos vértices são nós da link-cut tree, intercalados com
+        # os nós de aresta
+        self._estrutura = _FlorestaDecremental(len(self._lct.valor), self._no_aresta.values(),
+                                               fora)
+        self._fora = []
+        self._num_fora = 0
+        self._novas = 0
+        self._limite = max(16, math.isqrt(len(self._arestas)))
+
+    def _tirar(self, chave):
+        # Tira a aresta de E_D ou de B. A substituta que a estrutura de
+        # níveis achar entra em F_D e passa a ser candidata à reconexão
+        dados = self._arestas[chave]
+        if not dados[3]:
+            self._novas -= 1
+            return
+        dados[3] = False
+        substituta = self._estrutura.remover(chave)
+        if substituta is not None:
+            self._empilhar_fora(substituta)
+
+    def _entrada_valida(self, entrada):
+        dados = self._arestas.get(entrada[2:])
+        return dados is not None and dados[2] == entrada[1]
+
+    def _compactar_fora(self):
+        # Descarta de uma vez as entradas obsoletas do heap
+        self._fora = [entrada for entrada in self._fora if self._entrada_valida(entrada)]
+        heapq.heapify(self._fora)
+
+    def _empilhar_fora(self, chave):
+        dados = self._arestas[chave]
+        dados[2] = next(self._marcas)
+        heapq.heappush(self._fora, (dados[0], dados[2]) + chave)
+        self._num_fora += 1
+
+    def _retirar_fora(self, chave):
+        # Remoção preguiçosa: a entrada fica no heap, mas perde a validade
+        self._arestas[chave][2] = None
+        self._num_fora -= 1
+        if len(self._fora) > 2 * self._num_fora + 64:
+            self._compactar_fora()
+
+    def _inserir(self, chave):
+        """
+        Trata 'chave' (fora da árvore e fora de '_fora') como uma aresta
+        nova: entra na árvore se reduzir o custo.
+
+        Returns:
+            Chave da aresta que saiu da árvore, ou None
+        """
+        i, j = chave
+        peso = self._arestas[chave][0]
+        lct = self._lct
+        if lct.raiz(i) != lct.raiz(j):
+            self._ligar(chave)
+            return None
+
+        no_maximo = lct.maximo_caminho(i, j)
+        if peso < lct.valor[no_maximo]:
+            saiu = self._no_aresta[no_maximo]
+            self._cortar(saiu)
+            self._ligar(chave)
+            self._empilhar_fora(saiu)
+            return saiu
+
+        self._empilhar_fora(chave)
+        return None
+
+    def _reconectar(self):
+        """
+        Procura, em ordem de peso, a primeira candidata do heap que liga
+        duas árvores diferentes e a coloca na árvore. As candidatas válidas
+        examinadas antes dela voltam ao heap; como são no máximo 2|B|, a
+        busca custa O(√E (log V + log E)) no pior caso.
+
+        Returns:
+            Chave da aresta que entrou, ou None
+        """
+        raiz = self._lct.raiz
+        fora = self._fora
+        examinadas = []
+        encontrada = None
+        while fora:
+            entrada = heapq.heappop(fora)
+            if not self._entrada_valida(entrada):
+                continue
+            _, _, i, j = entrada
+            if raiz(i) != raiz(j):
+                encontrada = (i, j)
+                break
+            examinadas.append(entrada)
+
+        for entrada in examinadas:
+            heapq.heappush(fora, entrada)
+        if encontrada is None:
+            return None
+
+        self._retirar_fora(encontrada)
+        self._ligar(encontrada)
+        return encontrada
+
+    def peso(self, u, v):
+        """Peso atual da aresta u - v, ou None se ela não existe."""
+        chave = self._chave(u, v)
+        dados = self._arestas.get(chave)
+        return dados[0] if dados is not None else None
+
+    def pertence(self, u, v):
+        """Indica se a aresta u - v faz parte da AGM."""
+        dados = self._arestas.get(self._chave(u, v))
+        return dados is not None and dados[1] is not None
+
+    def conectados(self, u, v):
+        """Indica se u e v estão na mesma árvore da floresta."""
+        i, j = self._indice.get(u), self._indice.get(v)
+        if i is None or j is None:
+            return u == v
+        return self._lct.raiz(i) == self._lct.raiz(j)
+
+    def maior_aresta(self, u, v):
+        """
+        Aresta de maior peso no caminho u ~ v da AGM.
+
+        Returns:
+            Tupla (x, y, peso), ou None se u e v não estão conectados
+            (ou se u == v)
+        """
+        if u == v or not self.conectados(u, v):
+            return None
+        no = self._lct.maximo_caminho(self._indice[u], self._indice[v])
+        return self._aresta(self._no_aresta[no])
+
+    def arestas(self):
+        """Lista de arestas (u, v, peso) da AGM."""
+        return [self._aresta(chave) for chave in self._no_aresta.values()]
+
+    def atualizar_aresta(self, u, v, peso):
+        """
+        Define o peso da aresta u - v (inserindo-a se não existir) e
+        repara a AGM.
+
+        Args:
+            u: Um extremo da aresta
+            v: O outro extremo
+            peso: Novo peso
+
+        Returns:
+            Tupla (saiu, entrou) com as arestas (u, v, peso) que saíram e
+            entraram na AGM (None quando nenhuma)
+
+        Raises:
+            ValueError: Se u == v
+        """
+        if u == v:
+            raise ValueError(f"Laço {u} - {v} não pode fazer parte de uma AGM")
+        i, j = self._indice_de(u), self._indice_de(v)
+        chave = (i, j) if i < j else (j, i)
+        dados = self._arestas.get(chave)
+
+        if dados is None:
+            self._arestas[chave] = [peso, None, None, False]
+            self._novas += 1
+            saiu = self._inserir(chave)
+            entrou = chave if self._arestas[chave][1] is not None else None
+            mudanca = (self._aresta(saiu) if saiu is not None else None,
+                       self._aresta(entrou) if entrou is not None else None)
+        elif peso != dados[0]:
+            # Com o peso novo, a aresta passa de E_D para B
+            self._tirar(chave)
+            self._novas += 1
+            mudanca = self._mudar_peso(chave, peso)
+        else:
+            return None, None
+
+        if self._novas > self._limite:
+            self._reconstruir()
+        return mudanca
+
+    def _mudar_peso(self, chave, peso):
+        dados = self._arestas[chave]
+        anterior, no = dados[0], dados[1]
+        if no is None:
+            if dados[2] is not None:
+                self._retirar_fora(chave)
+            dados[0] = peso
+            if peso > anterior:
+                # Ficou mais cara e já não estava na árvore
+                self._empilhar_fora(chave)
+                return None, None
+            saiu = self._inserir(chave)
+            if saiu is None:
+                return None, None
+            return self._aresta(saiu), self._aresta(chave)
+
+        if peso < anterior:
+            # Aresta da árvore mais barata: a árvore continua mínima
+            dados[0] = peso
+            self._lct.definir_valor(no, peso)
+            self.custo_total += peso - anterior
+            return None, None
+
+        # Aresta da árvore mais cara: corta e procura a reconexão mais
+        # barata, que pode ser ela mesma
+        self._cortar(chave)
+        dados[0] = peso
+        self._empilhar_fora(chave)
+        entrou = self._reconectar()
+        if entrou == chave:
+            return None, None
+        return self._aresta(chave), (self._aresta(entrou) if entrou is not None else None)
+
+    def remover_aresta(self, u, v):
+        """
+        Remove a aresta u - v e repara a AGM.
+
+        Returns:
+            Tupla (saiu, entrou) como em 'atualizar_aresta'
+
+        Raises:
+            KeyError: Se a aresta não existir
+        """
+        chave = self._chave(u, v)
+        if chave not in self._arestas:
+            raise KeyError((u, v))
+
+        removida = self._aresta(chave)
+        self._tirar(chave)
+        if self._arestas[chave][1] is None:
+            if self._arestas[chave][2] is not None:
+                self._retirar_fora(chave)
+            del self._arestas[chave]
+            return None, None
+
+        self._cortar(chave)
+        del self._arestas[chave]
+        entrou = self._reconectar()
+        return removida, (self._aresta(entrou) if entrou is not None else None)
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    from grafos import grafo_direcionado
+    from algoritmo_kruskal import formatar_resultado
+
+    print("AGM DINÂMICA")
+    print()
+
+    agm, custo = kruskal_direcionado(grafo_direcionado)
+    dinamica = AGMDinamica(grafo_direcionado, agm)
+    print(f"Inicial (Kruskal): custo {dinamica.custo_total}")
+
+    def _mostrar(titulo, mudanca):
+        saiu, entrou = mudanca
+        print(f"{titulo}: saiu {saiu}, entrou {entrou}, custo {dinamica.custo_total}")
+
+    u, v, peso = max(dinamica.arestas(), key=lambda aresta: aresta[2])
+    _mostrar(f"Aresta {u} - {v} mais cara", dinamica.atualizar_aresta(u, v, peso + 50))
+
+    x, y, peso_maximo = dinamica.maior_aresta(1, 15)
+    _mostrar(f"Nova aresta 1 - 15 (maior no caminho: {x} - {y}, {peso_maximo})",
+             dinamica.atualizar_aresta(1, 15, 0))
+
+    u, v, _ = dinamica.arestas()[0]
+    _mostrar(f"Aresta {u} - {v} removida", dinamica.remover_aresta(u, v))
+
+    print()
+    print(formatar_resultado(dinamica.arestas(), dinamica.custo_total))
@@ -0,0 +1,355 @@
+"""
+Implementa o ALT (A*, Landmarks e desigualdade Triangular) para consultas
+repetidas de caminho mais curto sobre um grafo fixo.
+
+Pré-processamento: escolhe K marcos (landmarks) L e guarda, para cada um,
+as distâncias d(L, v) (busca para frente) e d(v, L) (busca no grafo
+reverso). Pela desigualdade triangular, para qualquer par (v, t):
+
+    d(v, t) >= d(L, t) - d(L, v)
+    d(v, t) >= d(v, L) - d(t, L)
+
+O maior desses limites inferiores é usado como heurística do A*.
+
+O índice pode ser salvo em disco e recarregado, de modo que o
+pré-processamento é pago uma única vez por versão do grafo.
+"""
+
+import hashlib
+import math
+import pickle
+import random
+from array import array
+
+from algoritmo_dijkstra import algoritmo_dijkstra, construir_grafo_reverso, reconstruir_caminho
+from algoritmo_a_estrela import a_estrela
+
+# Versão do formato de arquivo gerado por IndiceALT.salvar
+VERSAO_FORMATO_ALT = 1
+
+
+def assinatura_grafo(grafo):
+    """
+    Calcula uma assinatura do grafo, independente da ordem das arestas.
+
+    Usada para garantir que um índice salvo só seja carregado para a
+    mesma versão do grafo.
+
+    Args:
+        grafo: Dicionário {u: {v: peso}}
+
+    Returns:
+        String hexadecimal com a assinatura
+    """
+    acumulado = 0
+    for u, vizinhos in grafo.items():
+        acumulado += int.from_bytes(hashlib.sha1(repr(('v', u)).encode()).digest()[:16], 'big')
+        for v, peso in vizinhos.items():
+            digest = hashlib.sha1(repr((u, v, peso)).encode()).digest()
+            acumulado += int.from_bytes(digest[:16], 'big')
+    return f"{acumulado % (1 << 128):032x}"
+
+
+def _extrair_vertices(grafo):
+    vertices = set(grafo.keys())
+    for u in grafo:
+        vertices.update(grafo[u].keys())
+    return vertices
+
+
+class IndiceALT:
+    """
+    Índice de marcos do ALT.
+
+    Atributos:
+        marcos: Lista de vértices escolhidos como marcos
+        rotulos: Lista de vértices; a posição é o índice denso do vértice
+        indice: Dicionário {vértice: índice denso}
+        dist_de_marco: Lista (um por marco) de array('d') com d(L, v)
+        dist_ate_marco: Lista (um por marco) de array('d') com d(v, L)
+        assinatura: Assinatura do grafo usado no pré-processamento
+    """
+
+    def __init__(self, marcos, rotulos, dist_de_marco, dist_ate_marco, assinatura=None):
+        self.marcos = list(marcos)
+        self.rotulos = list(rotulos)
+        self.indice = {v: i for i, v in enumerate(self.rotulos)}
+        self.dist_de_marco = dist_de_marco
+        self.dist_ate_marco = dist_ate_marco
+        self.assinatura = assinatura
+
+    def limite_inferior(self, no, destino):
+        """
+        Limite inferior de d(no, destino) pela desigualdade triangular.
+
+        Termos com distância infinita são ignorados (continuam válidos,
+        apenas menos informativos).
+        """
+        i = self.indice[no]
+        j = self.indice[destino]
+        melhor = 0
+        for de_marco, ate_marco in zip(self.dist_de_marco, self.dist_ate_marco):
+            d_l_v, d_l_t = de_marco[i], de_marco[j]
+            if d_l_v != math.inf and d_l_t != math.inf and d_l_t - d_l_v > melhor:
+                melhor = d_l_t - d_l_v
+            d_v_l, d_t_l = ate_marco[i], ate_marco[j]
+            if d_v_l != math.inf and d_t_l != math.inf and d_v_l - d_t_l > melhor:
+                melhor = d_v_l - d_t_l
+        return melhor
+
+    def heuristica_para(self, destino):
+        """
+        Cria a heurística h(no, destino) do A* para um destino fixo,
+        pré-calculando as distâncias dos marcos até/desde o destino.
+        """
+        j = self.indice[destino]
+        termos = []
+        for de_marco, ate_marco in zip(self.dist_de_marco, self.dist_ate_marco):
+            termos.append((de_marco, de_marco[j], ate_marco, ate_marco[j]))
+        indice = self.indice
+
+        def h(no, _destino):
+            i = indice[no]
+            melhor = 0
+            for de_marco, d_l_t, ate_marco, d_t_l in termos:
+                d_l_v = de_marco[i]
+                if d_l_t != math.inf and d_l_v != math.inf and d_l_t - d_l_v > melhor:
+                    melhor = d_l_t - d_l_v
+                d_v_l = ate_marco[i]
+                if d_v_l != math.inf and d_t_l != math.inf and d_v_l - d_t_l > melhor:
+                    melhor = d_v_l - d_t_l
+            return melhor
+        return h
+
+    def consultar(self, grafo, origem, destino, estatisticas=None):
+        """
+        Consulta de caminho mais curto com A* guiado pelos marcos.
+
+        Args:
+            grafo: O mesmo grafo {u: {v: peso}} usado no pré-processamento
+            origem: Vértice de origem
+            destino: Vértice de destino
+            estatisticas: Dicionário opcional para os contadores do A*
+
+        Returns:
+            Tupla (custo, caminho); (math.inf, None) se não houver caminho
+        """
+        distancias, predecessores = a_estrela(
+            grafo, origem, destino, self.heuristica_para(destino),
+            estatisticas=estatisticas)
+        if destino not in distancias:
+            return math.inf, None
+        return distancias[destino], reconstruir_caminho(predecessores, origem, destino)
+
+    def salvar(self, caminho):
+        """
+        Salva o índice em disco.
+
+        Args:
+            caminho: Caminho do arquivo de saída
+        """
+        dados = {
+            'formato': 'IndiceALT',
+            'versao': VERSAO_FORMATO_ALT,
+            'assinatura': self.assinatura,
+            'marcos': self.marcos,
+            'rotulos': self.rotulos,
+            'dist_de_marco': [d.tobytes() for d in self.dist_de_marco],
+            'dist_ate_marco': [d.tobytes() for d in self.dist_ate_marco],
+        }
+        with open(caminho, 'wb') as arquivo:
+            pickle.dump(dados, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def carregar(cls, caminho, grafo=None):
+        """
+        Carrega um índice salvo com 'salvar'.
+
+        Args:
+            caminho: Caminho do arquivo
+            grafo: Grafo opcional; se fornecido, verifica se o índice foi
+                   gerado para esta mesma versão do grafo
+
+        Returns:
+            IndiceALT carregado
+
+        Raises:
+            ValueError: Se o arquivo não for um índice ALT compatível ou
+                        se o grafo não corresponder à assinatura salva
+        """
+        with open(caminho, 'rb') as arquivo:
+            dados = pickle.load(arquivo)
+
+        if not isinstance(dados, dict) or dados.get('formato') != 'IndiceALT':
+            raise ValueError(f"{caminho} não contém um índice ALT")
+        if dados['versao'] != VERSAO_FORMATO_ALT:
+            raise ValueError(f"Versão de formato ALT não suportada: {dados['versao']}")
+        if grafo is not None and assinatura_grafo(grafo) != dados['assinatura']:
+            raise ValueError("O índice ALT foi gerado para outra versão do grafo")
+
+        def _para_array(bruto):
+            valores = array('d')
+            valores.frombytes(bruto)
+            return valores
+
+        return cls(
+            dados['marcos'],
+            dados['rotulos'],
+            [_para_array(b) for b in dados['dist_de_marco']],
+            [_para_array(b) for b in dados['dist_ate_marco']],
+            dados['assinatura'],
+        )
+
+
+def _distancias_densas(grafo, vertices, rotulos, origem):
+    """Distâncias a partir de 'origem' como array('d') na ordem de 'rotulos'."""
+    distancias, predecessores = algoritmo_dijkstra(grafo, vertices, origem, modo='heap')
+    return array('d', (distancias[v] for v in rotulos)), predecessores
+
+
+def _escolher_farthest(distancias_minimas, rotulos, marcos):
+    """Vértice com a maior distância mínima até o conjunto de marcos."""
+    melhor_i, melhor_valor = None, -1
+    for i, valor in enumerate(distancias_minimas):
+        if rotulos[i] not in marcos and valor > melhor_valor:
+            melhor_i, melhor_valor = i, valor
+    return None if melhor_i is None else rotulos[melhor_i]
+
+
+def _escolher_avoid(grafo, vertices, rotulos, parcial, aleatorio):
+    """
+    Seleção 'avoid' (Goldberg e Werneck): a partir de uma raiz r,
+    procura a região da árvore de caminhos mínimos de r cujos limites
+    inferiores atuais são piores, evitando subárvores que já têm marco.
+    """
+    raiz = aleatorio.choice(rotulos)
+    dist_raiz, pred_raiz = algoritmo_dijkstra(grafo, vertices, raiz, modo='heap')
+
+    # Filhos na árvore de caminhos mínimos
+    filhos = {v: [] for v in rotulos}
+    alcancados = []
+    for v in rotulos:
+        if dist_raiz[v] != math.inf:
+            alcancados.append(v)
+            if pred_raiz[v] is not None and v != raiz:
+                filhos[pred_raiz[v]].append(v)
+
+    # peso(v) = d(r, v) - limite_inferior(r, v)
+    peso = {v: dist_raiz[v] - (parcial.limite_inferior(raiz, v) if parcial else 0)
+            for v in alcancados}
+
+    # Ordem de cima para baixo na árvore (pais antes dos filhos)
+    ordem = [raiz]
+    for v in ordem:
+        ordem.extend(filhos[v])
+
+    # Tamanhos calculados de baixo para cima
+    tamanho = {}
+    tem_marco = {}
+    marcos = set(parcial.marcos) if parcial else set()
+    for v in reversed(ordem):
+        tem_marco[v] = v in marcos or any(tem_marco[f] for f in filhos[v])
+        tamanho[v] = 0 if tem_marco[v] else peso[v] + sum(tamanho[f] for f in filhos[v])
+
+    if tamanho.get(raiz, 0) == 0:
+        return None
+
+    # Desce sempre pelo filho de maior tamanho até uma folha
+    atual = raiz
+    while True:
+        candidatos = [f for f in filhos[atual] if tamanho[f] > 0]
+        if not candidatos:
+            return atual
+        atual = max(candidatos, key=lambda f: tamanho[f])
+
+
+def preprocessar_alt(grafo, num_marcos, estrategia='farthest', semente=None):
+    """
+    Escolhe os marcos e calcula as distâncias do índice ALT.
+
+    Estratégias de seleção:
+    - 'farthest': cada novo marco é o vértice mais distante dos marcos já
+      escolhidos (considerando as duas direções).
+    - 'avoid': prioriza regiões onde os limites inferiores atuais são
+      ruins, evitando subárvores que já contêm um marco.
+
+    Args:
+        grafo: Dicionário {u: {v: peso}} com pesos não negativos
+        num_marcos: Quantidade K de marcos
+        estrategia: 'farthest' ou 'avoid'
+        semente: Semente opcional do gerador aleatório
+
+    Returns:
+        IndiceALT com os marcos e as distâncias
+    """
+    if estrategia not in ('farthest', 'avoid'):
+        raise ValueError(f"Estratégia desconhecida: {estrategia!r} (use 'farthest' ou 'avoid')")
+
+    aleatorio = random.Random(semente)
+    vertices = _extrair_vertices(grafo)
+    rotulos = list(vertices)
+    reverso = construir_grafo_reverso(grafo)
+    assinatura = assinatura_grafo(grafo)
+
+    num_marcos = min(num_marcos, len(rotulos))
+    marcos = []
+    dist_de_marco = []
+    dist_ate_marco = []
+    distancias_minimas = [math.inf] * len(rotulos)
+
+    def _adicionar_marco(marco):
+        de_marco, _ = _distancias_densas(grafo, vertices, rotulos, marco)
+        ate_marco, _ = _distancias_densas(reverso, vertices, rotulos, marco)
+        marcos.append(marco)
+        dist_de_marco.append(de_marco)
+        dist_ate_marco.append(ate_marco)
+        for i in range(len(rotulos)):
+            distancia = min(de_marco[i], ate_marco[i])
+            if distancia < distancias_minimas[i]:
+                distancias_minimas[i] = distancia
+
+    if num_marcos > 0:
+        # Primeiro marco: o vértice mais distante de um vértice aleatório
+        inicial = aleatorio.choice(rotulos)
+        de_inicial, _ = _distancias_densas(grafo, vertices, rotulos, inicial)
+        finitos = [i for i, d in enumerate(de_inicial) if d != math.inf]
+        _adicionar_marco(rotulos[max(finitos, key=lambda i: de_inicial[i])])
+
+    while len(marcos) < num_marcos:
+        marco = None
+        if estrategia == 'avoid':
+            parcial = IndiceALT(marcos, rotulos, dist_de_marco, dist_ate_marco)
+            marco = _escolher_avoid(grafo, vertices, rotulos, parcial, aleatorio)
+        if marco is None or marco in marcos:
+            marco = _escolher_farthest(distancias_minimas, rotulos, set(marcos))
+        if marco is None:
+            break
+        _adicionar_marco(marco)
+
+    return IndiceALT(marcos, rotulos, dist_de_marco, dist_ate_marco, assinatura)
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    from grafos import grafo_direcionado
+
+    no_de_inicio = 1
+    no_de_fim = 15
+
+    print("Pré-processando ALT (3 marcos, estratégia 'avoid')...")
+    indice_alt = preprocessar_alt(grafo_direcionado, 3, estrategia='avoid', semente=0)
+    print(f"  Marcos: {indice_alt.marcos}")
+
+    estatisticas_alt = {}
+    custo, caminho = indice_alt.consultar(grafo_direcionado, no_de_inicio, no_de_fim,
+                                          estatisticas_alt)
+    estatisticas_dijkstra = {}
+    a_estrela(grafo_direcionado, no_de_inicio, no_de_fim, estatisticas=estatisticas_dijkstra)
+
+    print("\n--- 🏁 Resultado do Caminho Mais Curto (ALT) ---")
+    print(f"  Origem:  {no_de_inicio}")
+    print(f"  Destino: {no_de_fim}")
+    print(f"  Custo:   {custo}")
+    print(f"  Caminho: {' -> '.join(map(str, caminho))}")
+    print(f"  Nós expandidos (ALT):      {estatisticas_alt['nos_expandidos']}")
+    print(f"  Nós expandidos (Dijkstra): {estatisticas_dijkstra['nos_expandidos']}")
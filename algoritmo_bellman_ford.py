@@ -11,8 +11,381 @@ Complexidade: O(|V| * |E|) onde V é o conjunto de vértices e E é o conjunto d
 Autor: Ianco
 """
 
+import random
+from collections import deque
 
-def bellman_ford(grafo, origem, vertices=None):
+from grafo_csr import GrafoCSR
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional (usado apenas no modo 'numpy')
+    np = None
+
+
+def _relaxar_classico(arestas, n, distancias, predecessores, completo=False, estatisticas=None):
+    """
+    Passos 2 e 3 do Bellman-Ford clássico: |V|-1 passadas sobre a lista
+    de arestas e uma passada final (a |V|-ésima) de detecção de ciclo
+    negativo.
+    
+    Args:
+        arestas: Lista de tuplas (u, v, peso)
+        n: Número de vértices
+        distancias: Distâncias iniciais (alteradas no lugar)
+        predecessores: Predecessores iniciais (alterados no lugar)
+        completo: Se False, a passada final para na primeira aresta que
+                  ainda relaxa. Se True, ela relaxa todas as arestas e
+                  registra todos os vértices relaxados (usados para
+                  extrair o ciclo e propagar -inf)
+        estatisticas: Dicionário opcional; recebe 'passadas', o número de
+                      passadas de relaxamento executadas
+        
+    Returns:
+        Lista dos vértices relaxados na passada final; vazia se não existe
+        ciclo de peso negativo acessível da origem
+    """
+    inf = float('inf')
+    passadas = 0
+    
+    # Passo 2: Relaxamento das arestas (|V| - 1 iterações)
+    for i in range(n - 1):
+        atualizado = False  # Flag para otimização: parar se não houver mudanças
+        passadas += 1
+        
+        for u, v, peso in arestas:
+            # Relaxamento: verifica se passar por u melhora o caminho para v
+            if distancias[u] != inf and distancias[v] > distancias[u] + peso:
+                distancias[v] = distancias[u] + peso
+                predecessores[v] = u
+                atualizado = True
+        
+        # Otimização: se não houve atualização, já convergiu
+        if not atualizado:
+            break
+    
+    if estatisticas is not None:
+        estatisticas['passadas'] = passadas
+    
+    # Passo 3: Detecção de ciclo negativo
+    relaxados = []
+    for u, v, peso in arestas:
+        if distancias[u] != inf and distancias[v] > distancias[u] + peso:
+            if not completo:
+                return [v]
+            distancias[v] = distancias[u] + peso
+            predecessores[v] = u
+            relaxados.append(v)
+    
+    return relaxados
+
+
+def _extrair_ciclo(predecessores, relaxados):
+    """
+    Extrai um ciclo negativo seguindo os predecessores a partir dos
+    vértices relaxados na |V|-ésima passada.
+    
+    Todo ciclo no grafo de predecessores tem peso negativo. Cada vértice é
+    visitado no máximo uma vez no total (caminhadas que encontram um
+    vértice de uma caminhada anterior são abandonadas), então o custo é
+    O(|V|).
+    
+    Returns:
+        Lista [c1, c2, ..., ck, c1] com as arestas do ciclo na ordem em que
+        são percorridas, ou None se nenhum ciclo for encontrado
+    """
+    marca = {}
+    for numero, inicio in enumerate(relaxados):
+        atual = inicio
+        while atual is not None and atual not in marca:
+            marca[atual] = numero
+            atual = predecessores[atual]
+        
+        if atual is not None and marca[atual] == numero:
+            # 'atual' está no ciclo: percorre-o de volta até ele mesmo
+            ciclo = [atual]
+            v = predecessores[atual]
+            while v != atual:
+                ciclo.append(v)
+                v = predecessores[v]
+            ciclo.append(atual)
+            ciclo.reverse()
+            return ciclo
+    
+    return None
+
+
+def _propagar_menos_infinito(vizinhos, distancias, relaxados):
+    """
+    Marca com -inf a distância de todo vértice alcançável a partir dos
+    vértices relaxados na |V|-ésima passada (busca em largura, O(V+E)).
+    """
+    fila = deque(relaxados)
+    for v in relaxados:
+        distancias[v] = float('-inf')
+    
+    while fila:
+        u = fila.popleft()
+        for v, _ in vizinhos(u):
+            if distancias[v] != float('-inf'):
+                distancias[v] = float('-inf')
+                fila.append(v)
+
+
+def _relaxar_yen(vizinhos, ordem, n, distancias, predecessores, estatisticas=None):
+    """
+    Bellman-Ford com a melhoria de Yen (1970) na ordem das arestas.
+    
+    Dada uma ordem dos vértices, as arestas são separadas em "para frente"
+    (u antes de v na ordem) e "para trás" (u depois de v). Cada passada
+    relaxa as arestas para frente percorrendo os vértices na ordem e, em
+    seguida, as arestas para trás na ordem inversa. Como qualquer caminho
+    alterna entre trechos para frente e para trás, um caminho mínimo com k
+    arestas fica pronto em no máximo ceil((k+1)/2) passadas, cerca de
+    metade das |V|-1 do algoritmo clássico. Se a ordem for uma permutação
+    aleatória (Bannister e Eppstein, 2012), o número esperado de passadas
+    cai ainda mais, para cerca de |V|/3.
+    
+    Args:
+        vizinhos: Função vizinhos(u) que itera sobre (v, peso)
+        ordem: Lista com todos os vértices na ordem desejada
+        n: Número de vértices
+        distancias: Distâncias iniciais (alteradas no lugar)
+        predecessores: Predecessores iniciais (alterados no lugar)
+        estatisticas: Dicionário opcional; recebe 'passadas', o número de
+                      passadas de relaxamento executadas
+        
+    Returns:
+        Um vértice cuja distância mudou na última passada e cuja aresta de
+        saída continua violada, se existe ciclo de peso negativo acessível
+        da origem; None caso contrário. Cada relaxamento numa metade de
+        passada usa um vértice alterado na mesma metade ou na anterior, e
+        as 2 * (|V|//2 + 1) > |V| metades garantem que a cadeia de
+        predecessores desse vértice tem |V| arestas, logo entra num ciclo
+    """
+    inf = float('inf')
+    posicao = {v: i for i, v in enumerate(ordem)}
+    
+    # Arestas já na ordem em que cada metade da passada as percorre
+    para_frente = []
+    for u in ordem:
+        i = posicao[u]
+        para_frente.extend((u, v, peso) for v, peso in vizinhos(u) if posicao[v] > i)
+    para_tras = []
+    for u in reversed(ordem):
+        i = posicao[u]
+        para_tras.extend((u, v, peso) for v, peso in vizinhos(u) if posicao[v] <= i)
+    
+    passadas = 0
+    limite = n // 2 + 1
+    while passadas < limite:
+        atualizado = False
+        passadas += 1
+        
+        for arestas in (para_frente, para_tras):
+            for u, v, peso in arestas:
+                if distancias[u] != inf and distancias[v] > distancias[u] + peso:
+                    distancias[v] = distancias[u] + peso
+                    predecessores[v] = u
+                    atualizado = True
+        
+        if not atualizado:
+            break
+    
+    if estatisticas is not None:
+        estatisticas['passadas'] = passadas
+    
+    if not atualizado:
+        return None
+    
+    # Passou do limite sem convergir: confere se ainda há aresta violada
+    for arestas in (para_frente, para_tras):
+        for u, v, peso in arestas:
+            if distancias[u] != inf and distancias[v] > distancias[u] + peso:
+                return u
+    return None
+
+
+def _relaxar_spfa(vizinhos, origem, n, distancias, predecessores, slf=False, lll=False,
+                   estatisticas=None):
+    """
+    Bellman-Ford baseado em fila (SPFA - Shortest Path Faster Algorithm).
+    
+    Só as arestas de saída de vértices cuja distância mudou são relaxadas.
+    Cada vértice guarda quantas arestas tem o caminho que produziu sua
+    distância atual (relaxamentos encadeados desde a origem); se algum
+    chegar a |V| arestas, o caminho repete um vértice e o ciclo repetido
+    é necessariamente negativo.
+    
+    Heurísticas opcionais de ordenação da fila:
+    - SLF (Small Label First): um vértice cuja distância é menor que a do
+      início da fila entra no início, e não no fim.
+    - LLL (Large Label Last): enquanto o vértice do início tiver distância
+      maior que a média da fila, ele é movido para o fim.
+    
+    Args:
+        vizinhos: Função vizinhos(u) que itera sobre (v, peso)
+        origem: Vértice de origem
+        n: Número de vértices
+        distancias: Distâncias iniciais (alteradas no lugar)
+        predecessores: Predecessores iniciais (alterados no lugar)
+        slf: Ativa a heurística Small Label First
+        lll: Ativa a heurística Large Label Last
+        estatisticas: Dicionário opcional; recebe 'remocoes_fila' (vértices
+                      retirados da fila) e 'passadas', o equivalente em
+                      passadas completas (remoções / |V|, arredondado para
+                      cima)
+        
+    Returns:
+        O vértice cujo caminho chegou a |V| arestas, se existe ciclo de
+        peso negativo acessível da origem (o ciclo está na sua cadeia de
+        predecessores); None caso contrário
+    """
+    fila = deque([origem])
+    na_fila = {origem}
+    arestas_no_caminho = {origem: 0}
+    soma_fila = distancias[origem]  # Usada pela média do LLL
+    remocoes = 0
+    
+    def _registrar():
+        if estatisticas is not None:
+            estatisticas['remocoes_fila'] = remocoes
+            estatisticas['passadas'] = -(-remocoes // n)
+    
+    while fila:
+        if lll:
+            media = soma_fila / len(fila)
+            for _ in range(len(fila)):
+                if distancias[fila[0]] <= media:
+                    break
+                fila.rotate(-1)
+        
+        u = fila.popleft()
+        na_fila.discard(u)
+        soma_fila -= distancias[u]
+        remocoes += 1
+        
+        for v, peso in vizinhos(u):
+            nova_distancia = distancias[u] + peso
+            if nova_distancia < distancias[v]:
+                if v in na_fila:
+                    soma_fila += nova_distancia - distancias[v]
+                distancias[v] = nova_distancia
+                predecessores[v] = u
+                
+                arestas_no_caminho[v] = arestas_no_caminho[u] + 1
+                if arestas_no_caminho[v] >= n:
+                    _registrar()
+                    return v
+                
+                if v not in na_fila:
+                    if slf and fila and nova_distancia < distancias[fila[0]]:
+                        fila.appendleft(v)
+                    else:
+                        fila.append(v)
+                    na_fila.add(v)
+                    soma_fila += nova_distancia
+    
+    _registrar()
+    return None
+
+
+def _relaxar_numpy(origens, destinos, pesos, n, origem, completo=False, estatisticas=None):
+    """
+    Bellman-Ford vetorizado com NumPy sobre três arrays de arestas.
+    
+    As arestas são ordenadas uma única vez pelo destino. Em cada passada,
+    os candidatos distancia[u] + peso de todas as arestas são calculados de
+    uma vez e o mínimo por destino é obtido com np.minimum.reduceat (um
+    "scatter-min" segmentado). A passada usa as distâncias da passada
+    anterior, e o laço para assim que nada muda.
+    
+    Args:
+        origens, destinos, pesos: Arrays NumPy com as arestas (índices densos)
+        n: Número de vértices
+        origem: Índice denso da origem
+        completo: Se True, a passada final também relaxa as arestas
+                  violadas (ver '_relaxar_classico')
+        estatisticas: Dicionário opcional; recebe 'passadas', o número de
+                      passadas de relaxamento executadas
+        
+    Returns:
+        Tupla (distancias, predecessores, relaxados) com arrays NumPy;
+        predecessor -1 indica ausência de predecessor e 'relaxados' contém
+        os vértices que ainda melhoraram na passada final
+    """
+    distancias = np.full(n, np.inf)
+    distancias[origem] = 0.0
+    predecessores = np.full(n, -1, dtype=np.int64)
+    
+    if estatisticas is not None:
+        estatisticas['passadas'] = 0
+    if len(origens) == 0:
+        return distancias, predecessores, np.empty(0, dtype=np.int64)
+    
+    ordem = np.argsort(destinos, kind='stable')
+    origens = origens[ordem]
+    destinos = destinos[ordem]
+    pesos = pesos[ordem].astype(np.float64)
+    
+    # Início de cada grupo de arestas com o mesmo destino
+    inicio_grupos = np.flatnonzero(np.r_[True, destinos[1:] != destinos[:-1]])
+    destinos_grupos = destinos[inicio_grupos]
+    
+    # |V|-1 passadas de relaxamento e a passada final de detecção
+    for passada in range(n):
+        if estatisticas is not None:
+            estatisticas['passadas'] = min(passada + 1, n - 1)
+        candidatos = distancias[origens] + pesos
+        minimos = np.minimum.reduceat(candidatos, inicio_grupos)
+        melhora = minimos < distancias[destinos_grupos]
+        if not melhora.any():
+            return distancias, predecessores, np.empty(0, dtype=np.int64)
+        if passada == n - 1 and not completo:
+            break
+        
+        # Aresta vencedora de cada destino melhorado: a que atinge o mínimo
+        novas = distancias.copy()
+        novas[destinos_grupos[melhora]] = minimos[melhora]
+        vencedoras = (candidatos == novas[destinos]) & (candidatos < distancias[destinos])
+        predecessores[destinos[vencedoras]] = origens[vencedoras]
+        distancias = novas
+    
+    return distancias, predecessores, destinos_grupos[melhora]
+
+
+def _arrays_numpy(grafo, vertices):
+    """
+    Prepara os arrays NumPy de arestas (do dicionário ou do GrafoCSR).
+    
+    Returns:
+        Tupla (origens, destinos, pesos, pesos_inteiros)
+    """
+    if np is None:
+        raise ImportError("bellman_ford(modo='numpy') requer o pacote numpy")
+    
+    if isinstance(grafo, GrafoCSR):
+        _, destinos, pesos = grafo.para_numpy()
+        origens = np.asarray(grafo.origens(), dtype=np.int64)
+        return origens, destinos.astype(np.int64), pesos, pesos.dtype.kind in 'iu'
+    
+    indice = {v: i for i, v in enumerate(vertices)}
+    lista_origens, lista_destinos, lista_pesos = [], [], []
+    for u in grafo:
+        for v, peso in grafo[u].items():
+            lista_origens.append(indice[u])
+            lista_destinos.append(indice[v])
+            lista_pesos.append(peso)
+    return (
+        np.array(lista_origens, dtype=np.int64),
+        np.array(lista_destinos, dtype=np.int64),
+        np.array(lista_pesos, dtype=np.float64),
+        all(isinstance(p, int) for p in lista_pesos),
+    )
+
+
+def bellman_ford(grafo, origem, vertices=None, modo='classico', slf=False, lll=False,
+                 retornar_ciclo=False, marcar_menos_infinito=False, permutar=False,
+                 semente=None, estatisticas=None):
     """
     Implementa o Algoritmo de Bellman-Ford para encontrar caminhos mais curtos.
     
@@ -27,59 +400,148 @@ def bellman_ford(grafo, origem, vertices=None):
        - Para cada aresta (u, v, peso):
          - Se distância[v] > distância[u] + peso: existe ciclo negativo
     
+    No modo 'spfa', os passos 2 e 3 são substituídos por uma fila de
+    vértices cuja distância mudou (ver '_relaxar_spfa'). No modo 'numpy',
+    cada passada é feita de forma vetorizada (ver '_relaxar_numpy'). No
+    modo 'yen', as arestas são separadas em "para frente" e "para trás"
+    segundo uma ordem dos vértices, reduzindo o número de passadas à
+    metade (ver '_relaxar_yen').
+    
+    Com 'retornar_ciclo' ou 'marcar_menos_infinito', a passada do passo 3
+    relaxa todas as arestas violadas. Um ciclo negativo é extraído
+    seguindo os predecessores de um vértice relaxado nessa passada, e os
+    vértices alcançáveis a partir deles recebem distância -inf. Tudo isso
+    sem uma segunda passada completa, mantendo O(|V| * |E|). Os modos
+    'spfa' e 'yen' param no primeiro ciclo detectado: o ciclo é extraído
+    da cadeia de predecessores do vértice que o denunciou, e o -inf é
+    propagado a partir desse ciclo (vértices alcançáveis só a partir de
+    outros ciclos negativos mantêm a distância em que a busca parou).
+    
     Args:
-        grafo: Dicionário {u: {v: peso}} representando o grafo direcionado
+        grafo: Dicionário {u: {v: peso}} representando o grafo direcionado,
+               ou um GrafoCSR (nesse caso 'vertices' é ignorado)
         origem: Vértice de origem para calcular os caminhos
         vertices: Lista opcional de vértices. Se None, extrai do grafo
+        modo: 'classico' (passadas sobre todas as arestas), 'spfa' (fila),
+              'numpy' (passadas vetorizadas; requer numpy) ou 'yen'
+              (arestas para frente/para trás)
+        slf: No modo 'spfa', ativa a heurística Small Label First
+        lll: No modo 'spfa', ativa a heurística Large Label Last
+        retornar_ciclo: Se True, o terceiro elemento do retorno é o ciclo
+                        negativo [c1, ..., ck, c1] (ou None se não houver)
+        marcar_menos_infinito: Se True, vértices alcançáveis a partir de um
+                               ciclo negativo recebem distância -inf
+        permutar: No modo 'yen', usa uma permutação aleatória dos vértices
+                  (Bannister-Eppstein) em vez da ordem de 'vertices'
+        semente: Semente do gerador aleatório usado por 'permutar'
+        estatisticas: Dicionário opcional preenchido com 'passadas', o
+                      número de passadas de relaxamento executadas (no
+                      modo 'spfa', o equivalente em remoções da fila / |V|)
         
     Returns:
         Tupla (distancias, predecessores, tem_ciclo_negativo) onde:
         - distancias: Dicionário {v: distância} com as menores distâncias
         - predecessores: Dicionário {v: predecessor} para reconstruir caminhos
-        - tem_ciclo_negativo: True se existe ciclo de peso negativo acessível da origem
+        - tem_ciclo_negativo: True se existe ciclo de peso negativo acessível
+          da origem (ou o próprio ciclo, se 'retornar_ciclo' for True)
     """
-    # Extrai vértices se não fornecidos
-    if vertices is None:
-        vertices = set(grafo.keys())
-        for u in grafo:
-            vertices.update(grafo[u].keys())
+    if modo not in ('classico', 'spfa', 'numpy', 'yen'):
+        raise ValueError(f"Modo desconhecido: {modo!r} "
+                         f"(use 'classico', 'spfa', 'numpy' ou 'yen')")
     
-    vertices = list(vertices)
-    n = len(vertices)
+    completo = retornar_ciclo or marcar_menos_infinito
+    denso = isinstance(grafo, GrafoCSR) or modo == 'numpy'
     
-    # Passo 1: Inicialização
-    distancias = {v: float('inf') for v in vertices}
-    predecessores = {v: None for v in vertices}
-    distancias[origem] = 0
-    
-    # Extrai todas as arestas
-    arestas = []
-    for u in grafo:
-        for v, peso in grafo[u].items():
-            arestas.append((u, v, peso))
+    # Extrai vértices se não fornecidos
+    if isinstance(grafo, GrafoCSR):
+        rotulos = grafo.rotulos
+        n = grafo.num_vertices
+    else:
+        if vertices is None:
+            vertices = set(grafo.keys())
+            for u in grafo:
+                vertices.update(grafo[u].keys())
+        rotulos = list(vertices)
+        n = len(rotulos)
     
-    # Passo 2: Relaxamento das arestas (|V| - 1 iterações)
-    for i in range(n - 1):
-        atualizado = False  # Flag para otimização: parar se não houver mudanças
+    if denso:
+        # Vértices como índices densos 0..n-1
+        if isinstance(grafo, GrafoCSR):
+            s = grafo.indice_de(origem)
+            vizinhos = grafo.vizinhos
+        else:
+            indice = {v: i for i, v in enumerate(rotulos)}
+            s = indice[origem]
+            
+            def vizinhos(u):
+                return ((indice[v], peso) for v, peso in grafo.get(rotulos[u], {}).items())
         
-        for u, v, peso in arestas:
-            # Relaxamento: verifica se passar por u melhora o caminho para v
-            if distancias[u] != float('inf') and distancias[v] > distancias[u] + peso:
-                distancias[v] = distancias[u] + peso
-                predecessores[v] = u
-                atualizado = True
+        distancias = [float('inf')] * n
+        predecessores = [None] * n
+    else:
+        s = origem
         
-        # Otimização: se não houve atualização, já convergiu
-        if not atualizado:
-            break
+        def vizinhos(u):
+            return grafo.get(u, {}).items()
+        
+        # Passo 1: Inicialização
+        distancias = {v: float('inf') for v in rotulos}
+        predecessores = {v: None for v in rotulos}
     
-    # Passo 3: Detecção de ciclo negativo
-    tem_ciclo_negativo = False
-    for u, v, peso in arestas:
-        if distancias[u] != float('inf') and distancias[v] > distancias[u] + peso:
-            tem_ciclo_negativo = True
-            break
+    def _lista_arestas():
+        if isinstance(grafo, GrafoCSR):
+            return list(zip(grafo.origens(), grafo.destinos, grafo.pesos))
+        return [(u, v, peso) for u in grafo for v, peso in grafo[u].items()]
     
+    distancias[s] = 0
+    pesos_inteiros = False
+    
+    if modo == 'numpy':
+        origens, destinos, pesos, pesos_inteiros = _arrays_numpy(grafo, rotulos)
+        dist, pred, relaxados = _relaxar_numpy(origens, destinos, pesos, n, s, completo,
+                                               estatisticas)
+        distancias = dist.tolist()
+        predecessores = [p if p >= 0 else None for p in pred.tolist()]
+        relaxados = relaxados.tolist()
+    elif modo in ('spfa', 'yen'):
+        if modo == 'spfa':
+            vertice_ciclo = _relaxar_spfa(vizinhos, s, n, distancias, predecessores, slf, lll,
+                                          estatisticas)
+        else:
+            ordem = list(range(n)) if denso else list(rotulos)
+            if permutar:
+                random.Random(semente).shuffle(ordem)
+            vertice_ciclo = _relaxar_yen(vizinhos, ordem, n, distancias, predecessores,
+                                         estatisticas)
+        relaxados = []
+        if vertice_ciclo is not None:
+            # O ciclo está na cadeia de predecessores do vértice que o
+            # denunciou; a marcação de -inf parte dos vértices do ciclo
+            relaxados = _extrair_ciclo(predecessores, [vertice_ciclo])[:-1]
+    else:
+        relaxados = _relaxar_classico(_lista_arestas(), n, distancias, predecessores, completo,
+                                      estatisticas)
+    
+    tem_ciclo_negativo = bool(relaxados)
+    ciclo = None
+    if tem_ciclo_negativo and retornar_ciclo:
+        ciclo = _extrair_ciclo(predecessores, relaxados)
+    if tem_ciclo_negativo and marcar_menos_infinito:
+        _propagar_menos_infinito(vizinhos, distancias, relaxados)
+    
+    if denso:
+        def _distancia(d):
+            if pesos_inteiros and d not in (float('inf'), float('-inf')):
+                return int(d)
+            return d
+        distancias = {rotulos[i]: _distancia(d) for i, d in enumerate(distancias)}
+        predecessores = {rotulos[i]: (rotulos[p] if p is not None else None)
+                         for i, p in enumerate(predecessores)}
+        if ciclo is not None:
+            ciclo = [rotulos[v] for v in ciclo]
+    
+    if retornar_ciclo:
+        return distancias, predecessores, ciclo
     return distancias, predecessores, tem_ciclo_negativo
 
 
@@ -103,6 +565,8 @@ def reconstruir_caminho(predecessores, origem, destino):
     
     while atual is not None:
         caminho.append(atual)
+        if len(caminho) > len(predecessores):
+            return None  # Predecessores formam um ciclo (ciclo negativo)
         atual = predecessores[atual]
     
     caminho.reverse()
@@ -122,7 +586,8 @@ def formatar_resultado(origem, distancias, predecessores, tem_ciclo_negativo, de
         origem: Vértice de origem
         distancias: Dicionário com as distâncias
         predecessores: Dicionário com os predecessores
-        tem_ciclo_negativo: Booleano indicando se há ciclo negativo
+        tem_ciclo_negativo: Booleano indicando se há ciclo negativo, ou a
+                            lista do ciclo (bellman_ford com retornar_ciclo)
         destino: Vértice de destino opcional (para mostrar caminho específico)
         
     Returns:
@@ -131,12 +596,16 @@ def formatar_resultado(origem, distancias, predecessores, tem_ciclo_negativo, de
     resultado = ""
     if tem_ciclo_negativo:
         resultado += "AVISO: Ciclo de peso negativo detectado!\n"
+        if isinstance(tem_ciclo_negativo, list):
+            resultado += f"Ciclo: {' -> '.join(map(str, tem_ciclo_negativo))}\n"
         resultado += "As distâncias podem não estar bem definidas.\n\n"
     
     # Se foi especificado um destino, mostra apenas esse caminho
     if destino is not None:
         if distancias[destino] == float('inf'):
             resultado += f"Não existe caminho de {origem} para {destino}\n"
+        elif distancias[destino] == float('-inf'):
+            resultado += "  Distância: -inf (caminho passa por ciclo negativo)\n"
         else:
             caminho = reconstruir_caminho(predecessores, origem, destino)
             resultado += f"  Distância: {distancias[destino]}\n"
@@ -153,6 +622,8 @@ def formatar_resultado(origem, distancias, predecessores, tem_ciclo_negativo, de
                 resultado += f"{v}: 0 (origem)\n"
             elif distancias[v] == float('inf'):
                 resultado += f"Destino: {v}:\t| Distância: inf | Caminho: inacessível\n"
+            elif distancias[v] == float('-inf'):
+                resultado += f"Destino: {v}:\t| Distância: -inf | Caminho: indefinido (ciclo negativo)\n"
             else:
                 caminho = reconstruir_caminho(predecessores, origem, v)
                 caminho_str = ' -> '.join(map(str, caminho)) if caminho else "?"
@@ -187,3 +658,13 @@ if __name__ == "__main__":
     print(f"CAMINHO ESPECÍFICO DE {origem} PARA O VÉRTICE {destino}:")
     print(formatar_resultado(origem, distancias, predecessores, tem_ciclo_negativo, destino))
     print("." * 20)
+    
+    # Grafo com ciclo negativo: extrai o ciclo e marca as distâncias -inf
+    grafo_com_ciclo = {'a': {'b': 1}, 'b': {'c': -2}, 'c': {'b': 1, 'd': 3}, 'd': {}}
+    distancias, predecessores, ciclo = bellman_ford(
+        grafo_com_ciclo, 'a', retornar_ciclo=True, marcar_menos_infinito=True
+    )
+    print("." * 20)
+    print("GRAFO COM CICLO NEGATIVO A PARTIR DO VÉRTICE a:")
+    print(formatar_resultado('a', distancias, predecessores, ciclo))
+    print("." * 20)
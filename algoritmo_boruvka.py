@@ -1,5 +1,7 @@
 import math
 
+from grafo_csr import GrafoCSR
+
 def gerar_matriz_pesos(grafo, vertices):
     N = len(vertices)
 
@@ -16,7 +18,12 @@ def gerar_matriz_pesos(grafo, vertices):
 
 class Boruvka:
 
-    def __init__(self, vertices, matriz_pesos):
+    # Aceita Boruvka(vertices, matriz_pesos) ou Boruvka(grafo_csr)
+    def __init__(self, vertices, matriz_pesos=None):
+        self.csr = vertices if isinstance(vertices, GrafoCSR) else None
+        if self.csr is not None:
+            vertices = range(self.csr.num_vertices)
+
         self.vertices = vertices
         self.matriz = matriz_pesos
 
@@ -33,7 +40,44 @@ class Boruvka:
         if raiz_a != raiz_b:
             self.pai[raiz_b] = raiz_a
 
+    def _executar_csr(self):
+        # Mesmo laço de 'executar', mas percorrendo as arestas do CSR
+        # (índices densos) em vez da matriz de pesos
+        grafo = self.csr
+        arestas = list(zip(grafo.origens(), grafo.destinos, grafo.pesos))
+        rotulos = grafo.rotulos
+        florestas = grafo.num_vertices
+        agm = []
+
+        while florestas > 1:
+            menor_aresta = {}
+
+            for u, v, peso in arestas:
+                raiz_u = self.encontrar(u)
+                raiz_v = self.encontrar(v)
+
+                if raiz_u != raiz_v:
+                    if raiz_u not in menor_aresta or menor_aresta[raiz_u][2] > peso:
+                        menor_aresta[raiz_u] = (u, v, peso)
+                    if raiz_v not in menor_aresta or menor_aresta[raiz_v][2] > peso:
+                        menor_aresta[raiz_v] = (u, v, peso)
+
+            # Grafo desconexo: nenhuma aresta liga componentes diferentes
+            if not menor_aresta:
+                break
+
+            for raiz, (u, v, peso) in menor_aresta.items():
+                if self.encontrar(u) != self.encontrar(v):
+                    agm.append((rotulos[u], rotulos[v], peso))
+                    self.unir(u, v)
+                    florestas -= 1
+
+        return agm
+
     def executar(self):
+        if self.csr is not None:
+            return self._executar_csr()
+
         florestas = len(self.vertices)
         agm = []
 
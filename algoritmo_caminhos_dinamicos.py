@@ -0,0 +1,305 @@
+"""
+Manutenção incremental de caminhos mais curtos de origem única.
+
+Em vez de executar novamente o Dijkstra ou o Bellman-Ford a cada mudança
+de peso, a classe CaminhosMinimosDinamicos parte das distâncias e dos
+predecessores já calculados e repara somente a parte afetada, no estilo
+de Ramalingam e Reps (1996):
+
+- Diminuição de peso (ou nova aresta) u -> v: se d(u) + w < d(v), as
+  melhorias são propagadas a partir de v com uma fila de prioridade
+  (correção de rótulos, aceitando pesos negativos). Se a propagação
+  chegar a melhorar d(u), a aresta fechou um ciclo negativo; se uma
+  cadeia de melhorias chegar a |V| arestas, ela tornou acessível um
+  ciclo negativo que antes não era. Nos dois casos tudo é desfeito e
+  ValueError é lançado.
+- Aumento de peso ou remoção de u -> v: só importa se u -> v pertence à
+  árvore de caminhos mínimos (predecessor[v] == u). Nesse caso somente
+  a subárvore de v é recalculada, a partir das arestas que chegam nela
+  vindas de vértices fora da subárvore.
+
+A árvore de caminhos mínimos é mantida explicitamente (filhos de cada
+vértice), assim como a adjacência reversa (arestas de entrada).
+"""
+
+import heapq
+import math
+
+from algoritmo_bellman_ford import bellman_ford
+from grafo_csr import GrafoCSR
+
+
+class CaminhosMinimosDinamicos:
+    """
+    Caminhos mais curtos a partir de uma origem, reparados a cada mudança
+    de aresta.
+
+    Atributos:
+        origem: Vértice de origem
+        distancias: Dicionário {v: distância} (math.inf se inacessível)
+        predecessores: Dicionário {v: predecessor} (None na origem e nos
+                       inacessíveis)
+    """
+
+    def __init__(self, grafo, origem, distancias=None, predecessores=None):
+        """
+        Args:
+            grafo: Dicionário {u: {v: peso}} ou GrafoCSR. Uma cópia é feita;
+                   o grafo original não é alterado
+            origem: Vértice de origem
+            distancias: Distâncias já calculadas (ex: saída do Dijkstra ou
+                        do Bellman-Ford). Se None, são calculadas com o
+                        Bellman-Ford
+            predecessores: Predecessores correspondentes a 'distancias'
+
+        Raises:
+            ValueError: Se o grafo tiver ciclo negativo acessível da origem
+        """
+        if isinstance(grafo, GrafoCSR):
+            grafo = grafo.para_dict()
+
+        self.origem = origem
+        self._saida = {u: dict(vizinhos) for u, vizinhos in grafo.items()}
+        self._entrada = {}
+        for u, vizinhos in grafo.items():
+            self._entrada.setdefault(u, {})
+            for v, peso in vizinhos.items():
+                self._saida.setdefault(v, {})
+                self._entrada.setdefault(v, {})[u] = peso
+        self._saida.setdefault(origem, {})
+        self._entrada.setdefault(origem, {})
+
+        if distancias is None or predecessores is None:
+            distancias, predecessores, tem_ciclo = bellman_ford(
+                self._saida, origem, list(self._saida), modo='spfa'
+            )
+            if tem_ciclo:
+                raise ValueError("O grafo tem um ciclo de peso negativo acessível da origem")
+
+        self.distancias = {v: distancias.get(v, math.inf) for v in self._saida}
+        self.predecessores = {v: predecessores.get(v) for v in self._saida}
+        self.distancias[origem] = 0
+        self.predecessores[origem] = None
+
+        self._filhos = {v: set() for v in self._saida}
+        for v, p in self.predecessores.items():
+            if p is not None:
+                self._filhos[p].add(v)
+
+    def _adicionar_vertice(self, v):
+        if v not in self._saida:
+            self._saida[v] = {}
+            self._entrada[v] = {}
+            self._filhos[v] = set()
+            self.distancias[v] = math.inf
+            self.predecessores[v] = None
+
+    def _definir_predecessor(self, v, p):
+        anterior = self.predecessores[v]
+        if anterior is not None:
+            self._filhos[anterior].discard(v)
+        if p is not None:
+            self._filhos[p].add(v)
+        self.predecessores[v] = p
+
+    def peso(self, u, v):
+        """Peso atual da aresta u -> v, ou None se ela não existe."""
+        return self._saida.get(u, {}).get(v)
+
+    def atualizar_aresta(self, u, v, peso):
+        """
+        Define o peso da aresta u -> v (inserindo-a se não existir) e
+        repara distâncias e predecessores.
+
+        Args:
+            u: Vértice de origem da aresta
+            v: Vértice de destino da aresta
+            peso: Novo peso
+
+        Returns:
+            Conjunto dos vértices cuja distância mudou
+
+        Raises:
+            ValueError: Se a nova aresta criar um ciclo de peso negativo
+                        (nesse caso nada é alterado)
+        """
+        self._adicionar_vertice(u)
+        self._adicionar_vertice(v)
+        anterior = self._saida[u].get(v)
+        if anterior == peso:
+            return set()
+
+        self._saida[u][v] = peso
+        self._entrada[v][u] = peso
+
+        if anterior is not None and peso > anterior:
+            if self.predecessores[v] == u:
+                return self._reparar_subarvore(v)
+            return set()
+
+        try:
+            return self._propagar_diminuicao(u, v, peso)
+        except ValueError:
+            if anterior is None:
+                del self._saida[u][v]
+                del self._entrada[v][u]
+            else:
+                self._saida[u][v] = anterior
+                self._entrada[v][u] = anterior
+            raise
+
+    def remover_aresta(self, u, v):
+        """
+        Remove a aresta u -> v e repara distâncias e predecessores.
+
+        Returns:
+            Conjunto dos vértices cuja distância mudou
+
+        Raises:
+            KeyError: Se a aresta não existir
+        """
+        del self._saida[u][v]
+        del self._entrada[v][u]
+        if self.predecessores[v] == u:
+            return self._reparar_subarvore(v)
+        return set()
+
+    def _propagar_diminuicao(self, u, v, peso):
+        """
+        Propaga a melhoria causada pela aresta u -> v mais barata.
+        Desfaz tudo e lança ValueError se um ciclo negativo for fechado ou
+        se tornar acessível (mesma contagem de arestas do modo 'spfa' do
+        Bellman-Ford, medida a partir de v).
+        """
+        distancias = self.distancias
+        nova_distancia = distancias[u] + peso
+        if not nova_distancia < distancias[v]:
+            return set()
+
+        # Estado anterior de cada vértice alterado, para desfazer
+        alterados = {}
+        arestas_no_caminho = {u: -1}
+        n = len(distancias)
+
+        def _melhorar(y, d, p):
+            arestas_no_caminho[y] = arestas_no_caminho[p] + 1
+            if y == u or arestas_no_caminho[y] >= n:
+                # d(u) melhoraria usando a própria aresta u -> v, ou a cadeia
+                # de melhorias repete um vértice: ciclo negativo
+                for x, (d_x, p_x) in alterados.items():
+                    distancias[x] = d_x
+                    self._definir_predecessor(x, p_x)
+                raise ValueError(f"A aresta {u} -> {v} com peso {peso} cria um ciclo negativo")
+            if y not in alterados:
+                alterados[y] = (distancias[y], self.predecessores[y])
+            distancias[y] = d
+            self._definir_predecessor(y, p)
+
+        _melhorar(v, nova_distancia, u)
+        fila = [(nova_distancia, v)]
+        while fila:
+            dist_x, x = heapq.heappop(fila)
+            if dist_x > distancias[x]:
+                continue
+            for y, peso_xy in self._saida[x].items():
+                candidata = dist_x + peso_xy
+                if candidata < distancias[y]:
+                    _melhorar(y, candidata, x)
+                    heapq.heappush(fila, (candidata, y))
+
+        return set(alterados)
+
+    def _reparar_subarvore(self, raiz):
+        """
+        Recalcula a subárvore de caminhos mínimos com raiz em 'raiz'
+        depois que a aresta até ela ficou mais cara ou foi removida.
+        """
+        distancias = self.distancias
+
+        # Vértices afetados: a subárvore de 'raiz'
+        afetados = []
+        pilha = [raiz]
+        while pilha:
+            x = pilha.pop()
+            afetados.append(x)
+            pilha.extend(self._filhos[x])
+        conjunto_afetados = set(afetados)
+        antigas = {x: distancias[x] for x in afetados}
+
+        for x in afetados:
+            distancias[x] = math.inf
+            self._definir_predecessor(x, None)
+
+        # Melhor entrada vinda de fora da subárvore
+        fila = []
+        for x in afetados:
+            melhor, melhor_p = math.inf, None
+            for p, peso in self._entrada[x].items():
+                if p not in conjunto_afetados and distancias[p] + peso < melhor:
+                    melhor, melhor_p = distancias[p] + peso, p
+            if melhor_p is not None:
+                distancias[x] = melhor
+                self._definir_predecessor(x, melhor_p)
+                fila.append((melhor, x))
+        heapq.heapify(fila)
+
+        # Correção de rótulos restrita à subárvore
+        while fila:
+            dist_x, x = heapq.heappop(fila)
+            if dist_x > distancias[x]:
+                continue
+            for y, peso_xy in self._saida[x].items():
+                candidata = dist_x + peso_xy
+                if y in conjunto_afetados and candidata < distancias[y]:
+                    distancias[y] = candidata
+                    self._definir_predecessor(y, x)
+                    heapq.heappush(fila, (candidata, y))
+
+        return {x for x in afetados if distancias[x] != antigas[x]}
+
+    def caminho(self, destino):
+        """
+        Caminho atual da origem até 'destino'.
+
+        Returns:
+            Lista de vértices, ou None se 'destino' for inacessível
+        """
+        if self.distancias.get(destino, math.inf) == math.inf:
+            return None
+        caminho = []
+        atual = destino
+        while atual is not None:
+            caminho.append(atual)
+            atual = self.predecessores[atual]
+        caminho.reverse()
+        return caminho
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    from grafos import grafo_direcionado, TODOS_NOS
+    from algoritmo_dijkstra import algoritmo_dijkstra
+
+    print("CAMINHOS MÍNIMOS DINÂMICOS")
+    origem, destino = 1, 15
+
+    distancias, predecessores = algoritmo_dijkstra(grafo_direcionado, TODOS_NOS, origem,
+                                                   modo='heap')
+    dinamico = CaminhosMinimosDinamicos(grafo_direcionado, origem, distancias, predecessores)
+
+    def _mostrar(titulo):
+        caminho = dinamico.caminho(destino)
+        print(f"{titulo}: distância {dinamico.distancias[destino]}, "
+              f"caminho {' -> '.join(map(str, caminho)) if caminho else 'inexistente'}")
+
+    _mostrar(f"Inicial ({origem} -> {destino})")
+
+    u, v = dinamico.caminho(destino)[1:3]
+    afetados = dinamico.atualizar_aresta(u, v, dinamico.peso(u, v) + 10)
+    _mostrar(f"Aresta {u} -> {v} mais cara ({len(afetados)} vértices mudaram)")
+
+    afetados = dinamico.remover_aresta(u, v)
+    _mostrar(f"Aresta {u} -> {v} removida ({len(afetados)} vértices mudaram)")
+
+    afetados = dinamico.atualizar_aresta(origem, destino, 5)
+    _mostrar(f"Nova aresta {origem} -> {destino} ({len(afetados)} vértices mudaram)")
@@ -3,11 +3,19 @@ Implementa o Algoritmo de Dijkstra para encontrar o caminho mais curto
 a partir de um nó de origem (s).
 
 A saída está configurada para focar no caminho de (s=1) para (fim=15).
+
+Dois motores estão disponíveis, selecionados pelo argumento 'modo':
+- 'classico': segue o pseudocódigo da aula, com busca linear do
+  próximo nó (O(V²)).
+- 'heap': fila de prioridade binária (heapq) com remoção preguiçosa,
+  O((V+E) log V).
 """
 
+import heapq
 import math
-# Importa o grafo e a lista de nós
-from grafos import grafo_direcionado, TODOS_NOS
+# Importa o grafo de exemplo
+from grafos import grafo_direcionado
+from grafo_csr import GrafoCSR
 
 def _encontrar_proximo_no_classico(distancias, visitados):
     """
@@ -36,19 +44,118 @@ def _encontrar_proximo_no_classico(distancias, visitados):
                 
     return proximo_no
 
-def algoritmo_dijkstra(grafo, todos_nos, no_inicial):
+def _dijkstra_heap(grafo, todos_nos, no_inicial):
+    """
+    Motor do Dijkstra baseado em heap binário (heapq), O((V+E) log V).
+
+    Em vez de diminuir a chave de um nó já presente na fila, uma nova
+    entrada (distância, nó) é inserida a cada melhoria. Entradas antigas
+    ("obsoletas") são descartadas quando retiradas da fila, comparando a
+    distância da entrada com a distância atual do nó (remoção preguiçosa).
+
+    Entrada e saída iguais às de 'algoritmo_dijkstra'.
+    """
+    distancias = {no: math.inf for no in todos_nos}
+    predecessores = {no: None for no in todos_nos}
+    distancias[no_inicial] = 0
+
+    fila = [(0, no_inicial)]
+
+    while fila:
+        dist_x, x = heapq.heappop(fila)
+
+        # Entrada obsoleta: o nó já foi fixado com distância menor
+        if dist_x > distancias[x]:
+            continue
+
+        for y, peso_xy in grafo.get(x, {}).items():
+            nova_distancia = dist_x + peso_xy
+            if nova_distancia < distancias[y]:
+                distancias[y] = nova_distancia
+                predecessores[y] = x
+                heapq.heappush(fila, (nova_distancia, y))
+
+    return distancias, predecessores
+
+def _dijkstra_csr(grafo, no_inicial, modo):
+    """
+    Dijkstra sobre um GrafoCSR, trabalhando com índices densos e listas
+    em vez de dicionários. Aceita os mesmos modos de 'algoritmo_dijkstra'.
+
+    Saída: dicionários de distâncias e predecessores com os rótulos
+    originais dos vértices.
+    """
+    n = grafo.num_vertices
+    inicio, destinos, pesos = grafo.inicio, grafo.destinos, grafo.pesos
+    s = grafo.indice_de(no_inicial)
+
+    distancias = [math.inf] * n
+    predecessores = [-1] * n
+    distancias[s] = 0
+
+    if modo == 'heap':
+        fila = [(0, s)]
+        while fila:
+            dist_x, x = heapq.heappop(fila)
+            if dist_x > distancias[x]:
+                continue
+            for e in range(inicio[x], inicio[x + 1]):
+                y = destinos[e]
+                nova_distancia = dist_x + pesos[e]
+                if nova_distancia < distancias[y]:
+                    distancias[y] = nova_distancia
+                    predecessores[y] = x
+                    heapq.heappush(fila, (nova_distancia, y))
+    else:
+        visitados = [False] * n
+        while True:
+            # Busca linear do nó não visitado de menor distância
+            x = -1
+            dist_minima = math.inf
+            for no in range(n):
+                if not visitados[no] and distancias[no] < dist_minima:
+                    dist_minima = distancias[no]
+                    x = no
+            if x < 0:
+                break
+            visitados[x] = True
+            for e in range(inicio[x], inicio[x + 1]):
+                y = destinos[e]
+                nova_distancia = distancias[x] + pesos[e]
+                if not visitados[y] and distancias[y] > nova_distancia:
+                    distancias[y] = nova_distancia
+                    predecessores[y] = x
+
+    rotulos = grafo.rotulos
+    return (
+        {rotulos[i]: distancias[i] for i in range(n)},
+        {rotulos[i]: (rotulos[predecessores[i]] if predecessores[i] >= 0 else None)
+         for i in range(n)},
+    )
+
+def algoritmo_dijkstra(grafo, todos_nos, no_inicial, modo='classico'):
     """
     Executa o Algoritmo de Dijkstra seguindo o pseudocódigo fornecido.
 
     Entrada:
-    - grafo (dict): O grafo direcionado (lista de adjacência).
+    - grafo (dict/GrafoCSR): O grafo direcionado (lista de adjacência
+      ou representação compacta CSR).
     - todos_nos (set): Um conjunto com todos os nós (ex: 1 a 19).
+      Ignorado para GrafoCSR, que já conhece seus vértices.
     - no_inicial (int): O nó de origem (s).
+    - modo (str): 'classico' (busca linear, O(V²)) ou 'heap'
+                  (fila de prioridade, O((V+E) log V)).
 
     Saída:
     - (dict): Dicionário de distâncias mínimas {no: distancia}.
     - (dict): Dicionário de predecessores {no: predecessor}.
     """
+    if modo not in ('classico', 'heap'):
+        raise ValueError(f"Modo desconhecido: {modo!r} (use 'classico' ou 'heap')")
+    if isinstance(grafo, GrafoCSR):
+        return _dijkstra_csr(grafo, no_inicial, modo)
+    if modo == 'heap':
+        return _dijkstra_heap(grafo, todos_nos, no_inicial)
     
     # --- Início da Inicialização (Passos 1-4) ---
     
@@ -108,6 +215,162 @@ def algoritmo_dijkstra(grafo, todos_nos, no_inicial):
                         
     return distancias, predecessores
 
+def dijkstra_ate_destinos(grafo, no_inicial, destinos):
+    """
+    Dijkstra ponto-a-ponto com parada antecipada (motor 'heap').
+
+    A busca termina assim que todos os destinos forem fixados (retirados
+    da fila com sua distância definitiva), em vez de visitar todos os
+    nós alcançáveis.
+
+    Entrada:
+    - grafo (dict): O grafo direcionado (lista de adjacência).
+    - no_inicial (int): O nó de origem (s).
+    - destinos (int/set): Um nó de destino ou um conjunto de destinos.
+
+    Saída:
+    - (dict): Distâncias {no: distancia} apenas dos nós fixados.
+    - (dict): Predecessores {no: predecessor} apenas dos nós fixados.
+      Destinos inalcançáveis não aparecem nos dicionários.
+    """
+    if isinstance(destinos, (set, frozenset, list, tuple)):
+        pendentes = set(destinos)
+    else:
+        pendentes = {destinos}
+
+    # Distâncias provisórias (fronteira) e predecessores provisórios
+    provisorias = {no_inicial: 0}
+    pred_provisorios = {no_inicial: None}
+
+    # Resultado: somente os nós já fixados
+    distancias = {}
+    predecessores = {}
+
+    fila = [(0, no_inicial)]
+
+    while fila and pendentes:
+        dist_x, x = heapq.heappop(fila)
+
+        # Entrada obsoleta ou nó já fixado
+        if x in distancias or dist_x > provisorias[x]:
+            continue
+
+        distancias[x] = dist_x
+        predecessores[x] = pred_provisorios[x]
+        pendentes.discard(x)
+
+        for y, peso_xy in grafo.get(x, {}).items():
+            if y in distancias:
+                continue
+            nova_distancia = dist_x + peso_xy
+            if nova_distancia < provisorias.get(y, math.inf):
+                provisorias[y] = nova_distancia
+                pred_provisorios[y] = x
+                heapq.heappush(fila, (nova_distancia, y))
+
+    return distancias, predecessores
+
+def construir_grafo_reverso(grafo):
+    """
+    Constrói a lista de adjacência reversa {v: {u: peso}} de um grafo
+    direcionado {u: {v: peso}}.
+
+    Pode ser calculada uma única vez e reaproveitada em várias chamadas
+    de 'dijkstra_bidirecional' sobre o mesmo grafo.
+    """
+    reverso = {}
+    for u, vizinhos in grafo.items():
+        reverso.setdefault(u, {})
+        for v, peso in vizinhos.items():
+            reverso.setdefault(v, {})[u] = peso
+    return reverso
+
+def dijkstra_bidirecional(grafo, no_inicial, no_final, grafo_reverso=None):
+    """
+    Dijkstra bidirecional para consultas de um único par (s, t).
+
+    Uma busca avança de 's' sobre o grafo original e outra recua de 't'
+    sobre o grafo reverso, alternando sempre a de menor chave no topo.
+    'mu' guarda o melhor caminho s -> t encontrado ao cruzar as buscas;
+    a parada ocorre quando topo_frente + topo_tras >= mu, pois nenhum
+    caminho ainda não examinado pode ser mais curto.
+
+    Entrada:
+    - grafo (dict): O grafo direcionado (lista de adjacência).
+    - no_inicial (int): O nó de origem (s).
+    - no_final (int): O nó de destino (t).
+    - grafo_reverso (dict): Adjacência reversa opcional. Se None, é
+      construída sob demanda com 'construir_grafo_reverso'.
+
+    Saída:
+    - (int/float): O custo do caminho mais curto (math.inf se não houver).
+    - (list/None): Lista de nós de 's' a 't', no mesmo formato de
+      'reconstruir_caminho', ou None se não houver caminho.
+    """
+    if no_inicial == no_final:
+        return 0, [no_inicial]
+
+    if grafo_reverso is None:
+        grafo_reverso = construir_grafo_reverso(grafo)
+
+    # Índice 0: busca para frente; índice 1: busca para trás
+    adjacencias = (grafo, grafo_reverso)
+    distancias = ({no_inicial: 0}, {no_final: 0})
+    predecessores = ({no_inicial: None}, {no_final: None})
+    fixados = (set(), set())
+    filas = ([(0, no_inicial)], [(0, no_final)])
+
+    mu = math.inf
+    # Aresta original (a, b) onde as buscas se encontram: 'a' pertence
+    # à busca para frente e 'b' à busca para trás
+    encontro = None
+
+    while filas[0] and filas[1]:
+        # Critério de parada do encontro no meio
+        if filas[0][0][0] + filas[1][0][0] >= mu:
+            break
+
+        lado = 0 if filas[0][0][0] <= filas[1][0][0] else 1
+        outro = 1 - lado
+
+        dist_x, x = heapq.heappop(filas[lado])
+        if x in fixados[lado] or dist_x > distancias[lado][x]:
+            continue
+        fixados[lado].add(x)
+
+        for y, peso_xy in adjacencias[lado].get(x, {}).items():
+            nova_distancia = dist_x + peso_xy
+            if nova_distancia < distancias[lado].get(y, math.inf):
+                distancias[lado][y] = nova_distancia
+                predecessores[lado][y] = x
+                heapq.heappush(filas[lado], (nova_distancia, y))
+
+            # A aresta (x, y) liga as duas buscas?
+            if y in distancias[outro]:
+                candidato = nova_distancia + distancias[outro][y]
+                if candidato < mu:
+                    mu = candidato
+                    encontro = (x, y) if lado == 0 else (y, x)
+
+    if encontro is None:
+        return math.inf, None
+
+    # Junta s -> ... -> a (frente) com b -> ... -> t (trás)
+    a, b = encontro
+    caminho = []
+    atual = a
+    while atual is not None:
+        caminho.append(atual)
+        atual = predecessores[0].get(atual)
+    caminho.reverse()
+
+    atual = b
+    while atual is not None:
+        caminho.append(atual)
+        atual = predecessores[1].get(atual)
+
+    return mu, caminho
+
 def reconstruir_caminho(predecessores, no_inicial, no_final):
     """
     Função auxiliar para montar o caminho a partir do dicionário
@@ -139,17 +402,17 @@ if __name__ == "__main__":
     no_de_inicio = 1
     no_de_fim = 15
     
-    print(f"Executando Dijkstra (Versão Clássica)...")
+    print(f"Executando Dijkstra (Ponto-a-Ponto, com parada antecipada)...")
     print(f"Buscando o caminho mais curto de (s={no_de_inicio}) para (fim={no_de_fim})...")
     
     # 1. Executa o algoritmo
-    # O algoritmo sempre calcula de 's' para TODOS os nós
-    dist, pred = algoritmo_dijkstra(grafo_direcionado, TODOS_NOS, no_de_inicio)
+    # A busca para assim que o 'no_de_fim' é fixado
+    dist, pred = dijkstra_ate_destinos(grafo_direcionado, no_de_inicio, no_de_fim)
     
     print("\n--- 🏁 Resultado do Caminho Mais Curto ---")
     
     # 2. Pega os resultados específicos para o 'no_de_fim'
-    distancia_final = dist[no_de_fim]
+    distancia_final = dist.get(no_de_fim, math.inf)
     caminho_final = reconstruir_caminho(pred, no_de_inicio, no_de_fim)
     
     # 3. Exibe o resultado específico
@@ -1,12 +1,347 @@
 import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from grafo_csr import GrafoCSR
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional (usado apenas no motor matricial)
+    np = None
 
 INF = math.inf
 
-def floyd_warshall(grafo, todos_nos):
+# Matriz de predecessores compacta: os n x n predecessores ficam como
+# índices densos int32 em um único buffer (array('i') na memória ou
+# np.memmap em disco, se 'arquivo' for dado), em vez de n dicionários com
+# n inteiros Python cada. pred[origem] devolve uma linha indexável pelo
+# rótulo (com -1 = sem caminho), então 'recuperar_caminho' e
+# 'exibir_resultados_floyd' funcionam sem mudanças
+class PredecessoresCompactos:
+    def __init__(self, nos, arquivo=None, preencher=True):
+        self.nos = list(nos)
+        self.indice = {no: i for i, no in enumerate(self.nos)}
+        n = len(self.nos)
+        if arquivo is None:
+            self.dados = array('i', [-1]) * (n * n) if preencher else array('i')
+        else:
+            if np is None:
+                raise ImportError("PredecessoresCompactos em disco requer o pacote numpy")
+            self.dados = np.memmap(arquivo, dtype=np.int32, mode='w+', shape=(max(1, n * n),))
+            if preencher:
+                self.dados[:] = -1
+
+    # Constrói a partir da matriz P (int32) dos motores matriciais sem o
+    # preenchimento com -1: os dados de P são copiados uma única vez, direto
+    # do buffer contíguo para o array('i') ou para o memmap
+    @classmethod
+    def de_matriz(cls, P, nos, arquivo=None):
+        compacto = cls(nos, arquivo, preencher=False)
+        P = np.ascontiguousarray(P, dtype=np.int32)
+        if P.size and arquivo is None:
+            compacto.dados.frombytes(memoryview(P).cast('B'))
+        elif P.size:
+            compacto.dados[:] = P.reshape(-1)
+        return compacto
+
+    def __len__(self):
+        return len(self.nos)
+
+    def __iter__(self):
+        return iter(self.nos)
+
+    def __getitem__(self, origem):
+        return _LinhaPredecessores(self, self.indice[origem] * len(self.nos))
+
+    # Acesso direto por índices densos (usado pelos motores)
+    def obter(self, i, j):
+        return self.dados[i * len(self.nos) + j]
+
+    def definir(self, i, j, p):
+        self.dados[i * len(self.nos) + j] = p
+
+    # Gera o caminho origem -> destino (rótulos) sem converter a matriz:
+    # só os índices do caminho são lidos, guardados em um array('i')
+    def iterar_caminho(self, origem, destino):
+        n = len(self.nos)
+        i = self.indice[origem]
+        atual = self.indice[destino]
+        if self.dados[i * n + atual] < 0:
+            return
+        inverso = array('i', [atual])
+        while atual != i:
+            atual = int(self.dados[i * n + atual])
+            inverso.append(atual)
+            if len(inverso) > n:
+                raise ValueError("Predecessores formam um ciclo (ciclo negativo?)")
+        for indice in reversed(inverso):
+            yield self.nos[indice]
+
+class _LinhaPredecessores:
+    def __init__(self, compacto, base):
+        self._compacto = compacto
+        self._base = base
+
+    def __getitem__(self, no):
+        compacto = self._compacto
+        p = compacto.dados[self._base + compacto.indice[no]]
+        return compacto.nos[p] if p >= 0 else -1
+
+    def __setitem__(self, no, predecessor):
+        compacto = self._compacto
+        p = compacto.indice[predecessor] if predecessor != -1 else -1
+        compacto.dados[self._base + compacto.indice[no]] = p
+
+    def __len__(self):
+        return len(self._compacto.nos)
+
+    def __iter__(self):
+        return iter(self._compacto.nos)
+
+    def keys(self):
+        return list(self._compacto.nos)
+
+    def items(self):
+        return [(no, self[no]) for no in self._compacto.nos]
+
+# Versão para GrafoCSR: matriz densa em listas (índices densos) e
+# conversão para os dicionários {i: {j: ...}} só no final. Com
+# 'pred_compacto', as linhas de 'pred' são visões (memoryview ou fatias do
+# memmap) do armazenamento compacto, que é preenchido diretamente durante a
+# relaxação, sem a matriz de listas intermediária
+def _floyd_warshall_csr(grafo, pred_compacto=False, arquivo_pred=None):
+    n = grafo.num_vertices
+    rotulos = grafo.rotulos
+
+    dist = [[INF] * n for _ in range(n)]
+    if pred_compacto:
+        compacto = PredecessoresCompactos(rotulos, arquivo_pred)
+        dados = compacto.dados
+        if isinstance(dados, array):
+            dados = memoryview(dados)
+        pred = [dados[i * n:(i + 1) * n] for i in range(n)]
+    else:
+        pred = [[-1] * n for _ in range(n)]
+
+    for i in range(n):
+        for j, peso in grafo.vizinhos(i):
+            if peso < dist[i][j]:
+                dist[i][j] = peso
+                pred[i][j] = i
+        dist[i][i] = 0
+        pred[i][i] = i
+
+    for k in range(n):
+        dist_k = dist[k]
+        pred_k = pred[k]
+        for i in range(n):
+            dist_i = dist[i]
+            d_ik = dist_i[k]
+            if d_ik == INF:
+                continue
+            pred_i = pred[i]
+            for j in range(n):
+                if d_ik + dist_k[j] < dist_i[j]:
+                    dist_i[j] = d_ik + dist_k[j]
+                    pred_i[j] = pred_k[j]
+
+    ordem = sorted(range(n), key=lambda i: rotulos[i])
+    dist_dict = {rotulos[i]: {rotulos[j]: dist[i][j] for j in ordem} for i in ordem}
+    if pred_compacto:
+        del pred, dados
+        return dist_dict, compacto
+    pred_dict = {rotulos[i]: {rotulos[j]: (rotulos[pred[i][j]] if pred[i][j] >= 0 else -1)
+                              for j in ordem}
+                 for i in ordem}
+    return dist_dict, pred_dict
+
+# Motor matricial (NumPy): cada passo k atualiza a matriz inteira de uma vez,
+# D = min(D, D[:, k] + D[k, :]), e a mesma máscara de melhora copia a linha k
+# de P. Devolve (D, P, nos): D em float64 (INF = np.inf), P em int32 com o
+# índice denso do predecessor (-1 = sem caminho) e nos[i] = rótulo do índice i
+def floyd_warshall_matricial(grafo, todos_nos=None):
+    D, P, nos = _matrizes_iniciais(grafo, todos_nos)
+
+    via = np.empty_like(D)
+    melhora = np.empty(D.shape, dtype=bool)
+    for k in range(len(nos)):
+        np.add(D[:, k, None], D[None, k, :], out=via)
+        np.less(via, D, out=melhora)
+        np.copyto(D, via, where=melhora)
+        np.copyto(P, P[k].copy(), where=melhora)
+
+    return D, P, nos
+
+# Matrizes iniciais D e P (arestas + diagonal) usadas pelos motores NumPy
+def _matrizes_iniciais(grafo, todos_nos):
+    if np is None:
+        raise ImportError("O Floyd-Warshall matricial requer o pacote numpy")
+
+    if isinstance(grafo, GrafoCSR):
+        nos = list(grafo.rotulos)
+        _, destinos, pesos = grafo.para_numpy()
+        origens = np.asarray(grafo.origens(), dtype=np.int64)
+        destinos = destinos.astype(np.int64)
+        pesos = pesos.astype(np.float64)
+    else:
+        nos = sorted(todos_nos)
+        indice = {no: i for i, no in enumerate(nos)}
+        arestas = [(indice[i], indice[j], peso)
+                   for i in nos for j, peso in grafo.get(i, {}).items() if j in indice]
+        origens = np.array([a[0] for a in arestas], dtype=np.int64)
+        destinos = np.array([a[1] for a in arestas], dtype=np.int64)
+        pesos = np.array([a[2] for a in arestas], dtype=np.float64)
+
+    n = len(nos)
+    D = np.full((n, n), np.inf)
+    P = np.full((n, n), -1, dtype=np.int32)
+
+    # Arestas paralelas: fica a de menor peso (np.minimum.at acumula)
+    np.minimum.at(D, (origens, destinos), pesos)
+    P[origens, destinos] = origens
+    diagonal = np.arange(n)
+    D[diagonal, diagonal] = 0
+    P[diagonal, diagonal] = diagonal
+
+    return D, P, nos
+
+# Relaxa o bloco de linhas [i0, i1) x colunas [j0, j1) por todos os k do
+# bloco pivô [k0, k1). Serve às três fases: no bloco diagonal, D[i, k] e
+# D[k, j] estão no próprio bloco; nos blocos da linha/coluna pivô, um deles
+# vem do bloco diagonal; nos demais, vêm dos blocos da linha e da coluna
+# pivô, que não mudam na fase 3
+def _relaxar_bloco(D, P, i0, i1, j0, j1, k0, k1):
+    bloco_d = D[i0:i1, j0:j1]
+    bloco_p = P[i0:i1, j0:j1]
+    via = np.empty_like(bloco_d)
+    melhora = np.empty(bloco_d.shape, dtype=bool)
+    for k in range(k0, k1):
+        np.add(D[i0:i1, k, None], D[None, k, j0:j1], out=via)
+        np.less(via, bloco_d, out=melhora)
+        np.copyto(bloco_d, via, where=melhora)
+        np.copyto(bloco_p, P[k, j0:j1].copy(), where=melhora)
+
+# Estado de cada processo trabalhador: visões D e P sobre a memória
+# compartilhada criada por 'floyd_warshall_blocado'
+_compartilhado = {}
+
+def _iniciar_trabalhador(nome_d, nome_p, n):
+    memoria_d = shared_memory.SharedMemory(name=nome_d)
+    memoria_p = shared_memory.SharedMemory(name=nome_p)
+    _compartilhado['memorias'] = (memoria_d, memoria_p)
+    _compartilhado['D'] = np.ndarray((n, n), dtype=np.float64, buffer=memoria_d.buf)
+    _compartilhado['P'] = np.ndarray((n, n), dtype=np.int32, buffer=memoria_p.buf)
+
+def _relaxar_blocos(tarefas):
+    D, P = _compartilhado['D'], _compartilhado['P']
+    for limites in tarefas:
+        _relaxar_bloco(D, P, *limites)
+
+def _dividir(tarefas, partes):
+    tamanho = max(1, -(-len(tarefas) // partes))
+    return [tarefas[i:i + tamanho] for i in range(0, len(tarefas), tamanho)]
+
+# Floyd-Warshall em blocos (tiles) de tamanho_bloco x tamanho_bloco, na
+# ordem clássica de três fases para cada bloco pivô kb:
+#   1) o bloco diagonal (kb, kb);
+#   2) os blocos da linha kb e da coluna kb (independentes entre si);
+#   3) todos os demais blocos (independentes entre si).
+# Cada bloco cabe na cache, e as fases 2 e 3 são divididas entre
+# 'processos' trabalhadores que operam sobre D e P em memória
+# compartilhada. Devolve (D, P, nos), igual a 'floyd_warshall_matricial'
+def floyd_warshall_blocado(grafo, todos_nos=None, tamanho_bloco=256, processos=None):
+    D_inicial, P_inicial, nos = _matrizes_iniciais(grafo, todos_nos)
+    n = len(nos)
+    if processos is None:
+        processos = os.cpu_count() or 1
+
+    limites = [(inicio, min(inicio + tamanho_bloco, n)) for inicio in range(0, n, tamanho_bloco)]
+
+    def _fases(executar):
+        for kb, (k0, k1) in enumerate(limites):
+            executar([(k0, k1, k0, k1, k0, k1)])
+            executar([(k0, k1, j0, j1, k0, k1) for jb, (j0, j1) in enumerate(limites) if jb != kb]
+                     + [(i0, i1, k0, k1, k0, k1) for ib, (i0, i1) in enumerate(limites) if ib != kb])
+            executar([(i0, i1, j0, j1, k0, k1)
+                      for ib, (i0, i1) in enumerate(limites) if ib != kb
+                      for jb, (j0, j1) in enumerate(limites) if jb != kb])
+
+    if processos <= 1 or len(limites) <= 1:
+        def _executar_local(tarefas):
+            for tarefa in tarefas:
+                _relaxar_bloco(D_inicial, P_inicial, *tarefa)
+        _fases(_executar_local)
+        return D_inicial, P_inicial, nos
+
+    memoria_d = shared_memory.SharedMemory(create=True, size=max(1, D_inicial.nbytes))
+    memoria_p = shared_memory.SharedMemory(create=True, size=max(1, P_inicial.nbytes))
+    try:
+        D = np.ndarray((n, n), dtype=np.float64, buffer=memoria_d.buf)
+        P = np.ndarray((n, n), dtype=np.int32, buffer=memoria_p.buf)
+        D[:] = D_inicial
+        P[:] = P_inicial
+        del D_inicial, P_inicial
+
+        with ProcessPoolExecutor(processos, initializer=_iniciar_trabalhador,
+                                 initargs=(memoria_d.name, memoria_p.name, n)) as executor:
+            def _executar_pool(tarefas):
+                if len(tarefas) == 1:
+                    _relaxar_bloco(D, P, *tarefas[0])
+                else:
+                    list(executor.map(_relaxar_blocos, _dividir(tarefas, processos)))
+            _fases(_executar_pool)
+
+        resultado = D.copy(), P.copy(), nos
+        del D, P
+        return resultado
+    finally:
+        memoria_d.close()
+        memoria_d.unlink()
+        memoria_p.close()
+        memoria_p.unlink()
+
+# Adaptador: matrizes de 'floyd_warshall_matricial' -> dicionários dist/pred
+# no mesmo formato de 'floyd_warshall'
+# (com pred_compacto, P vira um PredecessoresCompactos em vez de dicionários)
+def matrizes_para_dicionarios(D, P, nos, inteiros=False, pred_compacto=False, arquivo_pred=None):
+    dist = {}
+    pred = {}
+    if pred_compacto:
+        pred = PredecessoresCompactos.de_matriz(P, nos, arquivo_pred)
+    for i, no_i in enumerate(nos):
+        linha_d = D[i].tolist()
+        if inteiros:
+            linha_d = [int(d) if d != INF else INF for d in linha_d]
+        dist[no_i] = dict(zip(nos, linha_d))
+        if not pred_compacto:
+            pred[no_i] = {no_j: (nos[p] if p >= 0 else -1) for no_j, p in zip(nos, P[i].tolist())}
+    return dist, pred
+
+def _pesos_inteiros(grafo):
+    if isinstance(grafo, GrafoCSR):
+        return all(isinstance(peso, int) for peso in grafo.pesos)
+    return all(isinstance(peso, int) for vizinhos in grafo.values() for peso in vizinhos.values())
+
+def floyd_warshall(grafo, todos_nos=None, modo='classico', pred_compacto=False, arquivo_pred=None):
+    if modo not in ('classico', 'numpy', 'blocado'):
+        raise ValueError(f"Modo desconhecido: {modo!r} (use 'classico', 'numpy' ou 'blocado')")
+    if modo in ('numpy', 'blocado'):
+        motor = floyd_warshall_matricial if modo == 'numpy' else floyd_warshall_blocado
+        D, P, nos = motor(grafo, todos_nos)
+        return matrizes_para_dicionarios(D, P, nos, _pesos_inteiros(grafo),
+                                         pred_compacto, arquivo_pred)
+    if isinstance(grafo, GrafoCSR):
+        return _floyd_warshall_csr(grafo, pred_compacto, arquivo_pred)
+
     nos = sorted(todos_nos)
 
     dist = {i: {j: INF for j in nos} for i in nos}
-    pred = {i: {j: -1 for j in nos} for i in nos}
+    if pred_compacto:
+        pred = PredecessoresCompactos(nos, arquivo_pred)
+    else:
+        pred = {i: {j: -1 for j in nos} for i in nos}
 
     for i in nos:
         for j in nos:
@@ -26,6 +361,130 @@ def floyd_warshall(grafo, todos_nos):
 
     return dist, pred
 
+# Atualização em O(V²) de um resultado já calculado quando a aresta u -> v é
+# inserida ou tem o peso reduzido: um caminho i -> j só pode melhorar
+# passando por u -> v, então basta comparar dist[i][u] + peso + dist[v][j]
+# com dist[i][j]. Linhas em que nem dist[i][v] melhora são puladas. Aumentos
+# de peso não são suportados (exigem recalcular). Se 'grafo' for dado, ele é
+# usado para detectar aumentos e recebe o novo peso. Devolve o número de
+# pares (i, j) alterados
+def atualizar_aresta(dist, pred, u, v, peso, grafo=None):
+    if grafo is not None:
+        anterior = grafo.get(u, {}).get(v)
+        if anterior is not None and peso > anterior:
+            raise ValueError(f"Aumento do peso de {u} -> {v} exige recalcular o Floyd-Warshall")
+    if peso + dist[v][u] < 0:
+        raise ValueError(f"A aresta {u} -> {v} com peso {peso} cria um ciclo negativo")
+    if grafo is not None:
+        grafo.setdefault(u, {})[v] = peso
+
+    pred_v = pred[v]
+    alvos = [(j, d_vj) for j, d_vj in dist[v].items() if d_vj != INF]
+    alterados = 0
+    for i, dist_i in dist.items():
+        d_iu = dist_i[u]
+        if d_iu == INF or d_iu + peso >= dist_i[v]:
+            continue
+        base = d_iu + peso
+        pred_i = pred[i]
+        for j, d_vj in alvos:
+            if base + d_vj < dist_i[j]:
+                dist_i[j] = base + d_vj
+                pred_i[j] = u if j == v else pred_v[j]
+                alterados += 1
+    return alterados
+
+# Versão em lote: aplica as inserções/reduções (u, v, peso) em sequência
+def atualizar_arestas(dist, pred, arestas, grafo=None):
+    return sum(atualizar_aresta(dist, pred, u, v, peso, grafo) for u, v, peso in arestas)
+
+# Versão matricial de 'atualizar_aresta' sobre (D, P) dos motores NumPy,
+# com u e v dados como índices densos
+def atualizar_aresta_matricial(D, P, u, v, peso):
+    if peso + D[v, u] < 0:
+        raise ValueError(f"A aresta {u} -> {v} com peso {peso} cria um ciclo negativo")
+    via = (D[:, u] + peso)[:, None] + D[None, v, :]
+    melhora = via < D
+    np.copyto(D, via, where=melhora)
+    linha_p = P[v].copy()
+    linha_p[v] = u
+    np.copyto(P, linha_p, where=melhora)
+    return int(melhora.sum())
+
+# Fecho transitivo (Warshall) quando só importa "j é alcançável a partir
+# de i": cada linha é um bitset em vez de n distâncias e n predecessores.
+# motor='int' guarda cada linha em um int Python (bit j = alcança j);
+# motor='numpy' guarda linhas de palavras uint64. Em ambos o passo k é
+# "se i alcança k, linha[i] |= linha[k]", feito palavra a palavra.
+# O fecho é reflexivo: todo vértice alcança a si mesmo
+class FechoTransitivo:
+    def __init__(self, nos, linhas, motor):
+        self.nos = nos
+        self.indice = {no: i for i, no in enumerate(nos)}
+        self.linhas = linhas
+        self.motor = motor
+
+    def alcanca(self, origem, destino):
+        i = self.indice[origem]
+        j = self.indice[destino]
+        if self.motor == 'numpy':
+            return bool((int(self.linhas[i, j >> 6]) >> (j & 63)) & 1)
+        return bool((self.linhas[i] >> j) & 1)
+
+    def alcancaveis(self, origem):
+        linha = self.linhas[self.indice[origem]]
+        if self.motor == 'numpy':
+            linha = int.from_bytes(linha.tobytes(), 'little')
+        j = 0
+        while linha:
+            if linha & 1:
+                yield self.nos[j]
+            linha >>= 1
+            j += 1
+
+def fecho_transitivo(grafo, todos_nos=None, motor='int'):
+    if motor not in ('int', 'numpy'):
+        raise ValueError(f"Motor desconhecido: {motor!r} (use 'int' ou 'numpy')")
+
+    if isinstance(grafo, GrafoCSR):
+        nos = list(grafo.rotulos)
+        adjacencia = [[j for j, _ in grafo.vizinhos(i)] for i in range(len(nos))]
+    else:
+        nos = sorted(todos_nos)
+        indice = {no: i for i, no in enumerate(nos)}
+        adjacencia = [[indice[j] for j in grafo.get(i, {}) if j in indice] for i in nos]
+    n = len(nos)
+
+    if motor == 'int':
+        linhas = []
+        for i, vizinhos in enumerate(adjacencia):
+            linha = 1 << i
+            for j in vizinhos:
+                linha |= 1 << j
+            linhas.append(linha)
+
+        for k in range(n):
+            bit = 1 << k
+            linha_k = linhas[k]
+            for i in range(n):
+                if linhas[i] & bit:
+                    linhas[i] |= linha_k
+        return FechoTransitivo(nos, linhas, motor)
+
+    if np is None:
+        raise ImportError("fecho_transitivo(motor='numpy') requer o pacote numpy")
+    palavras = max(1, (n + 63) // 64)
+    linhas = np.zeros((n, palavras), dtype=np.uint64)
+    um = np.uint64(1)
+    for i, vizinhos in enumerate(adjacencia):
+        for j in [i] + vizinhos:
+            linhas[i, j >> 6] |= um << np.uint64(j & 63)
+
+    for k in range(n):
+        alcancam_k = ((linhas[:, k >> 6] >> np.uint64(k & 63)) & um).astype(bool)
+        linhas[alcancam_k] |= linhas[k]
+    return FechoTransitivo(nos, linhas, motor)
+
 def recuperar_caminho(pred, origem, destino):
     if pred[origem][destino] == -1:
         return None  
@@ -107,4 +566,23 @@ if __name__ == "__main__":
 
     caminho = recuperar_caminho(pred, origem, destino)
     
-    exibir_resultados_floyd(dist, pred, origem, destino)
\ No newline at end of file
+    exibir_resultados_floyd(dist, pred, origem, destino)
+
+    if np is not None:
+        print()
+        print("Motor matricial (NumPy) confere:",
+              floyd_warshall(grafo_direcionado, TODOS_NOS, modo='numpy') == (dist, pred))
+        dist_blocado, _ = floyd_warshall(grafo_direcionado, TODOS_NOS, modo='blocado')
+        print("Motor em blocos (distâncias) confere:", dist_blocado == dist)
+
+    _, pred_compacto = floyd_warshall(grafo_direcionado, TODOS_NOS, pred_compacto=True)
+    print("Predecessores compactos (int32): caminho",
+          " → ".join(map(str, pred_compacto.iterar_caminho(origem, destino))))
+
+    fecho = fecho_transitivo(grafo_direcionado, TODOS_NOS)
+    print(f"Fecho transitivo (bitset): {origem} alcança {destino}?",
+          fecho.alcanca(origem, destino))
+
+    alterados = atualizar_aresta(dist, pred, 1, 15, 5)
+    print(f"Nova aresta 1 -> 15 (peso 5): {alterados} pares atualizados, "
+          f"distância {dist[origem][destino]}")
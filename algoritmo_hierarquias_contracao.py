@@ -0,0 +1,357 @@
+"""
+Implementa Hierarquias de Contração (Contraction Hierarchies) para
+consultas de caminho mais curto em grafos estáticos grandes.
+
+Pré-processamento:
+1. Os vértices são ordenados pela diferença de arestas
+   (atalhos criados - arestas removidas + vizinhos já contraídos),
+   com atualização preguiçosa das prioridades.
+2. Cada vértice v é contraído: para cada par u -> v -> x, uma busca de
+   testemunha (Dijkstra limitado que ignora v) verifica se existe caminho
+   u -> x tão curto quanto u -> v -> x. Se não existir, cria-se o atalho
+   u -> x (que lembra o vértice do meio v).
+3. As arestas para vértices de nível mais alto são guardadas em dois
+   grafos compactos (CSR, com arrays): o grafo ascendente para frente e
+   o grafo ascendente para trás.
+
+Consulta: Dijkstra bidirecional em que as duas buscas só sobem na
+hierarquia (com stall-on-demand); os atalhos do caminho encontrado são desempacotados de
+volta para os vértices originais.
+"""
+
+import heapq
+import math
+from array import array
+
+
+class HierarquiaContracao:
+    """
+    Índice de Hierarquias de Contração.
+
+    Atributos:
+        rotulos: Lista de vértices; a posição é o índice denso do vértice
+        indice: Dicionário {vértice: índice denso}
+        nivel: array com a ordem de contração de cada vértice
+        frente_*: Grafo ascendente para frente em CSR (u -> v, nivel[v] > nivel[u])
+        tras_*: Grafo ascendente para trás em CSR (v <- u, nivel[u] > nivel[v]),
+                guardado no vértice de menor nível
+        *_meio: Vértice do meio de cada atalho (-1 para arestas originais)
+    """
+
+    def __init__(self, rotulos, nivel, frente, tras):
+        self.rotulos = rotulos
+        self.indice = {v: i for i, v in enumerate(rotulos)}
+        self.nivel = nivel
+        self.frente_inicio, self.frente_destinos, self.frente_pesos, self.frente_meio = frente
+        self.tras_inicio, self.tras_destinos, self.tras_pesos, self.tras_meio = tras
+
+    def _aresta(self, a, b):
+        """
+        Retorna (peso, meio) da aresta a -> b da hierarquia, procurando-a
+        na lista do extremo de menor nível.
+        """
+        if self.nivel[a] < self.nivel[b]:
+            inicio, destinos, pesos, meio, dono, alvo = (
+                self.frente_inicio, self.frente_destinos, self.frente_pesos,
+                self.frente_meio, a, b)
+        else:
+            inicio, destinos, pesos, meio, dono, alvo = (
+                self.tras_inicio, self.tras_destinos, self.tras_pesos,
+                self.tras_meio, b, a)
+        for e in range(inicio[dono], inicio[dono + 1]):
+            if destinos[e] == alvo:
+                return pesos[e], meio[e]
+        raise KeyError((a, b))
+
+    def _desempacotar(self, a, b, caminho):
+        """Acrescenta ao caminho os vértices originais da aresta a -> b (sem 'a')."""
+        pilha = [(a, b)]
+        while pilha:
+            u, v = pilha.pop()
+            _, meio = self._aresta(u, v)
+            if meio < 0:
+                caminho.append(v)
+            else:
+                # Empilha na ordem inversa: (u, meio) é processado primeiro
+                pilha.append((meio, v))
+                pilha.append((u, meio))
+
+    def consultar(self, origem, destino):
+        """
+        Consulta o caminho mais curto entre 'origem' e 'destino'.
+
+        Args:
+            origem: Vértice de origem
+            destino: Vértice de destino
+
+        Returns:
+            Tupla (custo, caminho), com o caminho no mesmo formato de
+            'reconstruir_caminho'; (math.inf, None) se não houver caminho
+        """
+        s = self.indice[origem]
+        t = self.indice[destino]
+        if s == t:
+            return 0, [origem]
+
+        grafos = (
+            (self.frente_inicio, self.frente_destinos, self.frente_pesos),
+            (self.tras_inicio, self.tras_destinos, self.tras_pesos),
+        )
+        distancias = ({s: 0}, {t: 0})
+        predecessores = ({s: -1}, {t: -1})
+        fixados = (set(), set())
+        filas = ([(0, s)], [(0, t)])
+
+        melhor = math.inf
+        encontro = -1
+
+        while filas[0] or filas[1]:
+            # Cada busca para quando sua menor chave não melhora 'melhor'
+            for lado in (0, 1):
+                fila = filas[lado]
+                if fila and fila[0][0] >= melhor:
+                    fila.clear()
+            if not filas[0] and not filas[1]:
+                break
+
+            if not filas[1] or (filas[0] and filas[0][0][0] <= filas[1][0][0]):
+                lado = 0
+            else:
+                lado = 1
+
+            dist_x, x = heapq.heappop(filas[lado])
+            if x in fixados[lado] or dist_x > distancias[lado][x]:
+                continue
+            fixados[lado].add(x)
+
+            outro = distancias[1 - lado].get(x)
+            if outro is not None and dist_x + outro < melhor:
+                melhor = dist_x + outro
+                encontro = x
+
+            # Stall-on-demand: se um vértice de nível mais alto já alcança
+            # x por um caminho menor, x não está em um caminho mínimo
+            # ascendente e não precisa ser expandido
+            inicio, destinos, pesos = grafos[1 - lado]
+            parado = False
+            for e in range(inicio[x], inicio[x + 1]):
+                dist_y = distancias[lado].get(destinos[e])
+                if dist_y is not None and dist_y + pesos[e] < dist_x:
+                    parado = True
+                    break
+            if parado:
+                continue
+
+            inicio, destinos, pesos = grafos[lado]
+            for e in range(inicio[x], inicio[x + 1]):
+                y = destinos[e]
+                nova_distancia = dist_x + pesos[e]
+                if nova_distancia < distancias[lado].get(y, math.inf):
+                    distancias[lado][y] = nova_distancia
+                    predecessores[lado][y] = x
+                    heapq.heappush(filas[lado], (nova_distancia, y))
+
+        if encontro < 0:
+            return math.inf, None
+
+        # Sequência de vértices da hierarquia: s ... encontro ... t
+        subida = []
+        atual = encontro
+        while atual >= 0:
+            subida.append(atual)
+            atual = predecessores[0][atual]
+        subida.reverse()
+        atual = predecessores[1][encontro]
+        while atual >= 0:
+            subida.append(atual)
+            atual = predecessores[1][atual]
+
+        # Desempacota os atalhos
+        caminho = [subida[0]]
+        for a, b in zip(subida, subida[1:]):
+            self._desempacotar(a, b, caminho)
+
+        return melhor, [self.rotulos[v] for v in caminho]
+
+
+def _busca_testemunha(saida, origem, ignorado, limite, max_fixados):
+    """
+    Dijkstra limitado a partir de 'origem' no grafo restante, sem passar
+    por 'ignorado'. Para quando a distância passa de 'limite' ou após
+    'max_fixados' vértices fixados.
+
+    Returns:
+        Dicionário {vértice: distância} dos vértices alcançados
+    """
+    distancias = {origem: 0}
+    fila = [(0, origem)]
+    fixados = 0
+    while fila:
+        dist_x, x = heapq.heappop(fila)
+        if dist_x > distancias[x]:
+            continue
+        if dist_x > limite or fixados >= max_fixados:
+            break
+        fixados += 1
+        for y, peso in saida[x].items():
+            if y == ignorado:
+                continue
+            nova_distancia = dist_x + peso
+            if nova_distancia < distancias.get(y, math.inf):
+                distancias[y] = nova_distancia
+                heapq.heappush(fila, (nova_distancia, y))
+    return distancias
+
+
+def _atalhos_necessarios(saida, entrada, v, max_fixados):
+    """
+    Lista os atalhos (u, x, peso) necessários para contrair 'v'.
+    """
+    atalhos = []
+    if not entrada[v] or not saida[v]:
+        return atalhos
+    max_saida = max(saida[v].values())
+    for u, peso_uv in entrada[v].items():
+        testemunhas = _busca_testemunha(saida, u, v, peso_uv + max_saida, max_fixados)
+        for x, peso_vx in saida[v].items():
+            if x == u:
+                continue
+            via_v = peso_uv + peso_vx
+            if testemunhas.get(x, math.inf) > via_v:
+                atalhos.append((u, x, via_v))
+    return atalhos
+
+
+def _compactar(listas, tipo_peso):
+    """Converte listas de adjacência [(destino, peso, meio)] para CSR."""
+    inicio = array('q', [0])
+    destinos = array('q')
+    pesos = array(tipo_peso)
+    meio = array('q')
+    for arestas in listas:
+        for destino, peso, m in arestas:
+            destinos.append(destino)
+            pesos.append(peso)
+            meio.append(m)
+        inicio.append(len(destinos))
+    return inicio, destinos, pesos, meio
+
+
+def construir_hierarquia(grafo, max_fixados_testemunha=50):
+    """
+    Constrói o índice de Hierarquias de Contração.
+
+    Args:
+        grafo: Dicionário {u: {v: peso}} com pesos não negativos
+        max_fixados_testemunha: Limite de vértices fixados em cada busca
+            de testemunha. Limites menores aceleram o pré-processamento ao
+            custo de alguns atalhos desnecessários (nunca incorretos).
+
+    Returns:
+        HierarquiaContracao pronta para consultas
+    """
+    vertices = set(grafo.keys())
+    for u in grafo:
+        vertices.update(grafo[u].keys())
+    rotulos = list(vertices)
+    indice = {v: i for i, v in enumerate(rotulos)}
+    n = len(rotulos)
+
+    # Grafo restante (vértices ainda não contraídos) e vértices do meio
+    saida = [dict() for _ in range(n)]
+    entrada = [dict() for _ in range(n)]
+    meio = {}
+    pesos_inteiros = True
+    for u, vizinhos in grafo.items():
+        iu = indice[u]
+        for v, peso in vizinhos.items():
+            iv = indice[v]
+            if iu == iv:
+                continue
+            if not isinstance(peso, int):
+                pesos_inteiros = False
+            if peso < saida[iu].get(iv, math.inf):
+                saida[iu][iv] = peso
+                entrada[iv][iu] = peso
+
+    vizinhos_contraidos = [0] * n
+
+    def _prioridade(v, atalhos):
+        return (len(atalhos) - len(saida[v]) - len(entrada[v])
+                + vizinhos_contraidos[v])
+
+    fila = [(_prioridade(v, _atalhos_necessarios(saida, entrada, v, max_fixados_testemunha)), v)
+            for v in range(n)]
+    heapq.heapify(fila)
+
+    nivel = array('q', [0] * n)
+    contraido = [False] * n
+    acima_frente = [[] for _ in range(n)]
+    acima_tras = [[] for _ in range(n)]
+    proximo_nivel = 0
+
+    while fila:
+        _, v = heapq.heappop(fila)
+        if contraido[v]:
+            continue
+
+        # Atualização preguiçosa: recalcula e devolve à fila se piorou
+        atalhos = _atalhos_necessarios(saida, entrada, v, max_fixados_testemunha)
+        atual = _prioridade(v, atalhos)
+        if fila and atual > fila[0][0]:
+            heapq.heappush(fila, (atual, v))
+            continue
+
+        # Arestas para vértices restantes sobem na hierarquia
+        for x, peso in saida[v].items():
+            acima_frente[v].append((x, peso, meio.get((v, x), -1)))
+            del entrada[x][v]
+            vizinhos_contraidos[x] += 1
+        for u, peso in entrada[v].items():
+            acima_tras[v].append((u, peso, meio.get((u, v), -1)))
+            del saida[u][v]
+            vizinhos_contraidos[u] += 1
+        saida[v] = {}
+        entrada[v] = {}
+
+        for u, x, peso in atalhos:
+            if peso < saida[u].get(x, math.inf):
+                saida[u][x] = peso
+                entrada[x][u] = peso
+                meio[(u, x)] = v
+
+        contraido[v] = True
+        nivel[v] = proximo_nivel
+        proximo_nivel += 1
+
+    tipo_peso = 'q' if pesos_inteiros else 'd'
+    return HierarquiaContracao(
+        rotulos,
+        nivel,
+        _compactar(acima_frente, tipo_peso),
+        _compactar(acima_tras, tipo_peso),
+    )
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    from grafos import grafo_direcionado
+
+    no_de_inicio = 1
+    no_de_fim = 15
+
+    print("Construindo Hierarquias de Contração...")
+    hierarquia = construir_hierarquia(grafo_direcionado)
+    print(f"  Arestas ascendentes (frente): {len(hierarquia.frente_destinos)}")
+    print(f"  Arestas ascendentes (trás):   {len(hierarquia.tras_destinos)}")
+
+    custo, caminho = hierarquia.consultar(no_de_inicio, no_de_fim)
+
+    print("\n--- 🏁 Resultado do Caminho Mais Curto (CH) ---")
+    print(f"  Origem:  {no_de_inicio}")
+    print(f"  Destino: {no_de_fim}")
+    if caminho is None:
+        print("  Custo:   ∞ (Inalcançável)")
+    else:
+        print(f"  Custo:   {custo}")
+        print(f"  Caminho: {' -> '.join(map(str, caminho))}")
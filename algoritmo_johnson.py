@@ -0,0 +1,180 @@
+"""
+Implementa o Algoritmo de Johnson para caminhos mais curtos entre todos os
+pares de vértices em grafos esparsos com pesos possivelmente negativos.
+
+Algoritmo:
+1. Adiciona uma fonte virtual q com arestas de peso 0 para todos os
+   vértices e executa o Bellman-Ford a partir de q, obtendo os potenciais
+   h(v) = dist(q, v). Se houver ciclo negativo, o algoritmo para.
+2. Repondera cada aresta: w'(u, v) = w(u, v) + h(u) - h(v) >= 0.
+3. Executa o Dijkstra (motor 'heap') a partir de cada vértice s no grafo
+   reponderado e corrige as distâncias: d(s, v) = d'(s, v) - h(s) + h(v).
+
+Complexidade: O(V*E + V*(V+E) log V), contra Θ(V³) do Floyd-Warshall.
+As linhas da matriz de distâncias são produzidas uma por vez (gerador),
+então quem as consome não precisa manter a matriz V×V inteira na memória.
+"""
+
+import math
+from array import array
+
+from algoritmo_bellman_ford import bellman_ford
+from algoritmo_dijkstra import algoritmo_dijkstra
+from grafo_csr import GrafoCSR
+
+
+def calcular_potenciais(grafo, vertices=None):
+    """
+    Passo 1: potenciais h(v) pelo Bellman-Ford (modo 'spfa') a partir de
+    uma fonte virtual ligada a todos os vértices com peso 0.
+
+    Args:
+        grafo: Dicionário {u: {v: peso}} ou GrafoCSR
+        vertices: Coleção opcional de vértices (ignorada para GrafoCSR)
+
+    Returns:
+        Dicionário {v: h(v)}
+
+    Raises:
+        ValueError: Se o grafo tiver um ciclo de peso negativo
+    """
+    if isinstance(grafo, GrafoCSR):
+        # A fonte virtual é o índice n de uma cópia com uma linha a mais
+        n = grafo.num_vertices
+        inicio = array('q', grafo.inicio)
+        inicio.append(inicio[-1] + n)
+        destinos = array(grafo.destinos.typecode if isinstance(grafo.destinos, array) else 'q',
+                         grafo.destinos)
+        destinos.extend(range(n))
+        pesos = array(grafo.pesos.typecode if isinstance(grafo.pesos, array) else 'd',
+                      grafo.pesos)
+        pesos.extend([0] * n)
+        aumentado = GrafoCSR(inicio, destinos, pesos)
+        distancias, _, ciclo = bellman_ford(aumentado, n, modo='spfa', retornar_ciclo=True)
+        rotulos = grafo.rotulos
+        potenciais = {rotulos[i]: distancias[i] for i in range(n)}
+    else:
+        if vertices is None:
+            vertices = set(grafo.keys())
+            for u in grafo:
+                vertices.update(grafo[u].keys())
+        vertices = list(vertices)
+
+        fonte = object()
+        aumentado = dict(grafo)
+        aumentado[fonte] = {v: 0 for v in vertices}
+        distancias, _, ciclo = bellman_ford(aumentado, fonte, vertices + [fonte],
+                                            modo='spfa', retornar_ciclo=True)
+        del distancias[fonte]
+        potenciais = distancias
+
+    if ciclo is not None:
+        rotulos = grafo.rotulos if isinstance(grafo, GrafoCSR) else None
+        if rotulos is not None:
+            ciclo = [rotulos[v] for v in ciclo]
+        raise ValueError(f"Ciclo de peso negativo: {' -> '.join(map(str, ciclo))}")
+
+    return potenciais
+
+
+def reponderar(grafo, potenciais):
+    """
+    Passo 2: w'(u, v) = w(u, v) + h(u) - h(v), que é sempre >= 0.
+
+    Com pesos reais, erros de arredondamento podem gerar valores
+    ligeiramente negativos; esses são truncados em 0.
+
+    Returns:
+        Grafo do mesmo tipo da entrada com os pesos reponderados
+    """
+    if isinstance(grafo, GrafoCSR):
+        rotulos = grafo.rotulos
+        h = [potenciais[rotulos[i]] for i in range(grafo.num_vertices)]
+        inicio, destinos, pesos = grafo.inicio, grafo.destinos, grafo.pesos
+        tipo = pesos.typecode if isinstance(pesos, array) else 'd'
+        novos_pesos = array(tipo, bytes(array(tipo).itemsize * len(pesos)))
+        for u in range(grafo.num_vertices):
+            for e in range(inicio[u], inicio[u + 1]):
+                novos_pesos[e] = max(0, pesos[e] + h[u] - h[destinos[e]])
+        reponderado = GrafoCSR(inicio, destinos, novos_pesos, grafo._rotulos)
+        reponderado._indice = grafo._indice
+        return reponderado
+
+    return {
+        u: {v: max(0, peso + potenciais[u] - potenciais[v]) for v, peso in vizinhos.items()}
+        for u, vizinhos in grafo.items()
+    }
+
+
+def johnson(grafo, vertices=None, origens=None):
+    """
+    Executa o Algoritmo de Johnson.
+
+    Os passos 1 e 2 são executados imediatamente (um ciclo negativo gera
+    ValueError já na chamada); o passo 3 é executado sob demanda, uma
+    origem por vez, à medida que o gerador devolvido é consumido.
+
+    Args:
+        grafo: Dicionário {u: {v: peso}} ou GrafoCSR
+        vertices: Coleção opcional de vértices. Se None, extrai do grafo
+        origens: Origens desejadas (padrão: todos os vértices)
+
+    Returns:
+        Gerador de tuplas (origem, distancias, predecessores), com os
+        dicionários no mesmo formato do Bellman-Ford e do Dijkstra
+
+    Raises:
+        ValueError: Se o grafo tiver um ciclo de peso negativo
+    """
+    potenciais = calcular_potenciais(grafo, vertices)
+    reponderado = reponderar(grafo, potenciais)
+    todos_nos = list(potenciais)
+    if origens is None:
+        origens = todos_nos
+
+    def _linhas():
+        for s in origens:
+            distancias, predecessores = algoritmo_dijkstra(reponderado, todos_nos, s, modo='heap')
+            h_s = potenciais[s]
+            for v, d in distancias.items():
+                if d != math.inf:
+                    distancias[v] = d - h_s + potenciais[v]
+            yield s, distancias, predecessores
+
+    return _linhas()
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    from grafos import grafo_direcionado, TODOS_NOS
+    from algoritmo_bellman_ford import reconstruir_caminho
+
+    print("ALGORITMO DE JOHNSON")
+    print()
+
+    # Grafo do trabalho: somente as linhas de 1 e 19
+    for origem, distancias, predecessores in johnson(grafo_direcionado, TODOS_NOS,
+                                                     origens=[1, 19]):
+        caminho = reconstruir_caminho(predecessores, origem, 15)
+        print(f"Origem {origem} -> 15: distância {distancias[15]}, "
+              f"caminho {' -> '.join(map(str, caminho)) if caminho else 'inexistente'}")
+    print()
+
+    # Grafo esparso com pesos negativos (sem ciclo negativo)
+    grafo_negativo = {
+        'a': {'b': -2, 'c': 4},
+        'b': {'c': 1, 'd': 7},
+        'c': {'d': -3},
+        'd': {'a': 5},
+    }
+    print("Matriz de distâncias (pesos negativos):")
+    nos = sorted(grafo_negativo)
+    print("     " + "".join(f"{v:>5}" for v in nos))
+    for origem, distancias, _ in johnson(grafo_negativo, origens=nos):
+        print(f"{origem:>3} |" + "".join(f"{distancias[v]:>5}" for v in nos))
+    print()
+
+    try:
+        johnson({'a': {'b': 1}, 'b': {'a': -2}})
+    except ValueError as erro:
+        print(f"Grafo com ciclo negativo rejeitado: {erro}")
@@ -4,12 +4,142 @@ Algoritmo de Kruskal para Árvore Geradora Mínima (AGM)
 Complexidade: O(m log m)
 """
 
+import heapq
+import os
+import pickle
+import random
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from carregador_arestas import ler_blocos_arestas, rotulo_padrao
+from grafo_csr import GrafoCSR
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional (usado apenas em UnionFindDenso.find_many)
+    np = None
+
+
+class UnionFindDenso:
+    """
+    Union-Find (Disjoint Set) sobre índices densos 0..n-1.
+    
+    'pai' e 'tamanho' são arrays contíguos (array('i')) em vez de
+    dicionários. 'find' é iterativo com divisão de caminho (path halving),
+    então não há recursão mesmo em árvores profundas, e 'union' usa união
+    por tamanho.
+    """
+    
+    def __init__(self, n):
+        """
+        Inicializa n conjuntos unitários.
+        
+        Args:
+            n: Número de elementos
+        """
+        self.pai = array('i', range(n))
+        self.tamanho = array('i', [1]) * n
+        self.num_conjuntos = n
+    
+    def __len__(self):
+        return len(self.pai)
+    
+    def adicionar(self):
+        """
+        Adiciona um novo conjunto unitário.
+        
+        Returns:
+            Índice do novo elemento
+        """
+        i = len(self.pai)
+        self.pai.append(i)
+        self.tamanho.append(1)
+        self.num_conjuntos += 1
+        return i
+    
+    def find(self, i):
+        """
+        Encontra a raiz do conjunto que contém i. Cada nó visitado passa a
+        apontar para o avô (divisão de caminho), o que reduz o caminho pela
+        metade a cada busca.
+        
+        Args:
+            i: Índice do elemento
+            
+        Returns:
+            Índice da raiz
+        """
+        pai = self.pai
+        while pai[i] != i:
+            pai[i] = pai[pai[i]]
+            i = pai[i]
+        return i
+    
+    def find_many(self, indices):
+        """
+        Encontra as raízes de vários elementos de uma vez.
+        
+        Com um numpy.ndarray, a busca é vetorizada (saltos de ponteiro em
+        todos os elementos ao mesmo tempo) e os elementos consultados
+        passam a apontar diretamente para a raiz.
+        
+        Args:
+            indices: Sequência ou numpy.ndarray de índices
+            
+        Returns:
+            Raízes, no mesmo tipo da entrada (lista ou numpy.ndarray)
+        """
+        if np is not None and isinstance(indices, np.ndarray):
+            pai = np.frombuffer(self.pai, dtype=np.int32)
+            raizes = pai[indices]
+            proximo = pai[raizes]
+            while not np.array_equal(proximo, raizes):
+                raizes = proximo
+                proximo = pai[raizes]
+            pai[indices] = raizes
+            return raizes
+        return [self.find(i) for i in indices]
+    
+    def union(self, i, j):
+        """
+        Une os conjuntos que contêm i e j (o menor passa a ser filho da
+        raiz do maior).
+        
+        Args:
+            i: Primeiro índice
+            j: Segundo índice
+            
+        Returns:
+            True se os conjuntos foram unidos, False se já estavam no mesmo conjunto
+        """
+        raiz_i = self.find(i)
+        raiz_j = self.find(j)
+        
+        if raiz_i == raiz_j:
+            return False
+        
+        tamanho = self.tamanho
+        if tamanho[raiz_i] < tamanho[raiz_j]:
+            raiz_i, raiz_j = raiz_j, raiz_i
+        self.pai[raiz_j] = raiz_i
+        tamanho[raiz_i] += tamanho[raiz_j]
+        self.num_conjuntos -= 1
+        return True
+    
+    def conectados(self, i, j):
+        """Indica se i e j estão no mesmo conjunto."""
+        return self.find(i) == self.find(j)
+
 
 class UnionFind:
     """
     Estrutura de dados Union-Find (Disjoint Set) para detectar ciclos.
     
-    Utiliza compressão de caminho e união por rank para otimização.
+    Aceita vértices com rótulos arbitrários: cada rótulo é mapeado para um
+    índice denso de um UnionFindDenso (divisão de caminho e união por
+    tamanho).
     """
     
     def __init__(self, vertices):
@@ -19,13 +149,24 @@ class UnionFind:
         Args:
             vertices: Lista ou conjunto de vértices do grafo
         """
-        self.pai = {v: v for v in vertices}
-        self.rank = {v: 0 for v in vertices}
+        self.rotulos = list(vertices)
+        self.indice = {v: i for i, v in enumerate(self.rotulos)}
+        self.denso = UnionFindDenso(len(self.rotulos))
+    
+    def adicionar(self, v):
+        """
+        Adiciona o vértice v como um novo conjunto unitário.
+        
+        Args:
+            v: Vértice a ser adicionado
+        """
+        if v not in self.indice:
+            self.indice[v] = self.denso.adicionar()
+            self.rotulos.append(v)
     
     def find(self, v):
         """
         Encontra o representante (raiz) do conjunto que contém v.
-        Usa compressão de caminho para otimização.
         
         Args:
             v: Vértice a ser buscado
@@ -33,14 +174,26 @@ class UnionFind:
         Returns:
             Representante do conjunto que contém v
         """
-        if self.pai[v] != v:
-            self.pai[v] = self.find(self.pai[v])  # Compressão de caminho
-        return self.pai[v]
+        return self.rotulos[self.denso.find(self.indice[v])]
+    
+    def find_many(self, vertices):
+        """
+        Encontra os representantes de vários vértices de uma vez.
+        
+        Args:
+            vertices: Sequência de vértices
+            
+        Returns:
+            Lista com o representante de cada vértice
+        """
+        indice = self.indice
+        rotulos = self.rotulos
+        return [rotulos[r] for r in self.denso.find_many([indice[v] for v in vertices])]
     
     def union(self, u, v):
         """
         Une os conjuntos que contêm u e v.
-        Usa união por rank para manter a árvore balanceada.
+        Usa união por tamanho para manter a árvore balanceada.
         
         Args:
             u: Primeiro vértice
@@ -49,25 +202,162 @@ class UnionFind:
         Returns:
             True se os conjuntos foram unidos, False se já estavam no mesmo conjunto
         """
-        raiz_u = self.find(u)
-        raiz_v = self.find(v)
+        return self.denso.union(self.indice[u], self.indice[v])
+
+
+# Partições do Filter-Kruskal com até LIMIAR_FILTRO arestas são ordenadas
+# diretamente. Com um pool de processos, listas com pelo menos
+# LIMIAR_ORDENACAO_PARALELA arestas são ordenadas em paralelo (e, no modo
+# 'filtro', esse passa a ser o tamanho das partições ordenadas)
+LIMIAR_FILTRO = 1024
+LIMIAR_ORDENACAO_PARALELA = 50_000
+
+_peso_aresta = itemgetter(2)
+
+
+def _ordenar_bloco(bloco):
+    """Ordena um bloco de arestas (u, v, peso) por peso (executado nos processos)."""
+    bloco.sort(key=_peso_aresta)
+    return bloco
+
+
+def _ordenar_arestas(arestas, executor=None, processos=1):
+    """
+    Ordena as arestas (u, v, peso) por peso. Com um executor, listas
+    grandes são divididas em 'processos' blocos ordenados em paralelo e
+    depois intercaladas com heapq.merge.
+    """
+    if executor is None or len(arestas) < LIMIAR_ORDENACAO_PARALELA:
+        arestas.sort(key=_peso_aresta)
+        return arestas
+    return _ordenar_em_paralelo(arestas, executor, processos)
+
+
+def _ordenar_em_paralelo(arestas, executor, processos):
+    """
+    Divide as arestas em 'processos' blocos, ordena-os no executor e
+    devolve um iterador que os intercala por peso (heapq.merge).
+    """
+    tamanho = -(-len(arestas) // processos)
+    blocos = [arestas[i:i + tamanho] for i in range(0, len(arestas), tamanho)]
+    return heapq.merge(*executor.map(_ordenar_bloco, blocos), key=_peso_aresta)
+
+
+def _selecionar_arestas(arestas, uf, n, agm):
+    """
+    Passo 2 do Kruskal: percorre as arestas já ordenadas e aceita as que
+    não formam ciclo, até a árvore ter n-1 arestas.
+    """
+    for u, v, peso in arestas:
+        if uf.union(u, v):
+            agm.append((u, v, peso))
+            if len(agm) == n - 1:
+                break
+
+
+def _filtro_kruskal(arestas, uf, n, agm, aleatorio, executor=None, processos=1):
+    """
+    Filter-Kruskal (Osipov, Sanders e Singler, 2009).
+    
+    Em vez de ordenar todas as arestas, particiona-as em torno de um peso
+    pivô como no quicksort: primeiro resolve as leves e, se a árvore
+    ainda não estiver completa, descarta das pesadas as que ligam
+    vértices já conectados (filtro com o Union-Find) antes de resolvê-las.
+    Arestas pesadas que nunca seriam usadas não chegam a ser ordenadas.
+    
+    Args:
+        arestas: Lista de arestas (u, v, peso)
+        uf: UnionFind ou UnionFindDenso (alterado no lugar)
+        n: Número de vértices
+        agm: Lista de arestas aceitas (alterada no lugar)
+        aleatorio: random.Random usado na escolha do pivô
+        executor: ProcessPoolExecutor opcional. Com ele, as arestas leves
+                  de uma partição com pelo menos LIMIAR_ORDENACAO_PARALELA
+                  arestas são ordenadas de uma vez, em blocos paralelos,
+                  em vez de serem particionadas recursivamente
+        processos: Número de processos do executor
+    """
+    # Pilha de partições (arestas, filtrar); a do topo é sempre a mais leve
+    pendentes = [(arestas, False)]
+    while pendentes and len(agm) < n - 1:
+        arestas, filtrar = pendentes.pop()
         
-        if raiz_u == raiz_v:
-            return False  # Já estão no mesmo conjunto (formaria ciclo)
+        if filtrar:
+            find = uf.find
+            arestas = [a for a in arestas if find(a[0]) != find(a[1])]
         
-        # União por rank
-        if self.rank[raiz_u] < self.rank[raiz_v]:
-            self.pai[raiz_u] = raiz_v
-        elif self.rank[raiz_u] > self.rank[raiz_v]:
-            self.pai[raiz_v] = raiz_u
-        else:
-            self.pai[raiz_v] = raiz_u
-            self.rank[raiz_u] += 1
+        if len(arestas) > LIMIAR_FILTRO:
+            pivo = aleatorio.choice(arestas)[2]
+            leves = [a for a in arestas if a[2] <= pivo]
+            pesadas = [a for a in arestas if a[2] > pivo]
+            if not pesadas:
+                # Pivô é o maior peso: separa as arestas iguais a ele
+                leves = [a for a in arestas if a[2] < pivo]
+                pesadas = [a for a in arestas if a[2] >= pivo]
+            if leves:
+                pendentes.append((pesadas, True))
+                if executor is not None and len(arestas) >= LIMIAR_ORDENACAO_PARALELA:
+                    _selecionar_arestas(_ordenar_em_paralelo(leves, executor, processos),
+                                        uf, n, agm)
+                else:
+                    pendentes.append((leves, False))
+                continue
         
-        return True
+        _selecionar_arestas(_ordenar_arestas(arestas, executor, processos), uf, n, agm)
+
+
+def _executar_kruskal(arestas, uf, n, modo='classico', processos=None):
+    """
+    Seleciona as arestas da AGM com o motor escolhido.
+    
+    Returns:
+        Lista de arestas (u, v, peso) aceitas, na ordem de aceitação
+    """
+    if modo not in ('classico', 'filtro'):
+        raise ValueError(f"Modo desconhecido: {modo!r} (use 'classico' ou 'filtro')")
+    
+    agm = []
+    processos = processos or 1
+    executor = ProcessPoolExecutor(processos) if processos > 1 else None
+    try:
+        if modo == 'filtro':
+            _filtro_kruskal(arestas, uf, n, agm, random.Random(0), executor, processos)
+        else:
+            _selecionar_arestas(_ordenar_arestas(arestas, executor, processos), uf, n, agm)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return agm
 
 
-def kruskal(grafo, vertices=None):
+def _kruskal_csr(grafo, modo='classico', processos=None):
+    """
+    Kruskal sobre um GrafoCSR (tratado como não direcionado), usando os
+    índices densos diretamente no UnionFindDenso.
+    
+    Returns:
+        A mesma tupla de 'kruskal', com os rótulos originais
+    """
+    n = grafo.num_vertices
+    if n <= 1:
+        return [], 0
+    
+    # Remove duplicatas (u,v)/(v,u) mantendo o menor peso
+    arestas_unicas = {}
+    for u, v, peso in zip(grafo.origens(), grafo.destinos, grafo.pesos):
+        chave = (u, v) if u < v else (v, u)
+        if chave not in arestas_unicas or peso < arestas_unicas[chave]:
+            arestas_unicas[chave] = peso
+    
+    arestas = [(u, v, peso) for (u, v), peso in arestas_unicas.items()]
+    agm = _executar_kruskal(arestas, UnionFindDenso(n), n, modo, processos)
+    
+    rotulos = grafo.rotulos
+    agm = [(rotulos[u], rotulos[v], peso) for u, v, peso in agm]
+    return agm, sum(peso for _, _, peso in agm)
+
+
+def kruskal(grafo, vertices=None, modo='classico', processos=None):
     """
     Implementa o Algoritmo de Kruskal para encontrar a AGM.
     
@@ -80,14 +370,26 @@ def kruskal(grafo, vertices=None):
     3. Para quando tiver n-1 arestas (árvore completa)
     
     Args:
-        grafo: Dicionário {u: {v: peso}} representando o grafo
+        grafo: Dicionário {u: {v: peso}} representando o grafo, ou um
+               GrafoCSR (nesse caso 'vertices' é ignorado)
         vertices: Lista opcional de vértices. Se None, extrai do grafo
+        modo: 'classico' (ordena todas as arestas) ou 'filtro'
+              (Filter-Kruskal: particiona pelo peso e descarta as arestas
+              pesadas que já ligam vértices conectados antes de ordená-las)
+        processos: Número de processos para ordenar listas grandes de
+                   arestas em paralelo (padrão: sem paralelismo)
         
     Returns:
         Tupla (arestas_agm, custo_total) onde:
         - arestas_agm: Lista de tuplas (u, v, peso) da AGM
         - custo_total: Soma dos pesos das arestas da AGM
+    
+    Raises:
+        ValueError: Se o modo for desconhecido
     """
+    if isinstance(grafo, GrafoCSR):
+        return _kruskal_csr(grafo, modo, processos)
+    
     # Extrai vértices se não fornecidos
     if vertices is None:
         vertices = set(grafo.keys())
@@ -122,30 +424,15 @@ def kruskal(grafo, vertices=None):
     
     arestas = [(u, v, peso) for (u, v), peso in arestas_unicas.items()]
     
-    # Passo 1: Ordena as arestas por peso (ordem crescente)
-    arestas.sort(key=lambda x: x[2])
-    
-    # Inicializa Union-Find
-    uf = UnionFind(vertices)
-    
-    # Passo 2: Seleciona arestas que não formam ciclo
-    agm = []
-    custo_total = 0
-    
-    for u, v, peso in arestas:
-        # Se u e v estão em conjuntos diferentes, não forma ciclo
-        if uf.union(u, v):
-            agm.append((u, v, peso))
-            custo_total += peso
-            
-            # Para quando tiver n-1 arestas (árvore completa)
-            if len(agm) == n - 1:
-                break
+    # Passos 1 e 2: ordena as arestas por peso e seleciona as que não
+    # formam ciclo (no modo 'filtro', ordenação e seleção são intercaladas)
+    agm = _executar_kruskal(arestas, UnionFind(vertices), n, modo, processos)
+    custo_total = sum(peso for _, _, peso in agm)
     
     return agm, custo_total
 
 
-def kruskal_direcionado(grafo, vertices=None):
+def kruskal_direcionado(grafo, vertices=None, modo='classico', processos=None):
     """
     Versão do Kruskal que trata o grafo direcionado como não direcionado.
     
@@ -155,12 +442,18 @@ def kruskal_direcionado(grafo, vertices=None):
     Args:
         grafo: Dicionário {u: {v: peso}} representando o grafo direcionado
         vertices: Lista opcional de vértices. Se None, extrai do grafo
+        modo: 'classico' ou 'filtro' (ver 'kruskal')
+        processos: Número de processos para a ordenação (ver 'kruskal')
         
     Returns:
         Tupla (arestas_agm, custo_total) onde:
         - arestas_agm: Lista de tuplas (u, v, peso) da AGM
         - custo_total: Soma dos pesos das arestas da AGM
     """
+    # Em CSR, 'kruskal' já ignora a direção das arestas
+    if isinstance(grafo, GrafoCSR):
+        return _kruskal_csr(grafo, modo, processos)
+    
     # Converte para grafo não direcionado
     grafo_nd = {}
     
@@ -185,7 +478,146 @@ def kruskal_direcionado(grafo, vertices=None):
             else:
                 grafo_nd[v][u] = min(grafo_nd[v][u], peso)
     
-    return kruskal(grafo_nd, vertices)
+    return kruskal(grafo_nd, vertices, modo, processos)
+
+
+def _gravar_run(arestas, diretorio, numero, tamanho_lote=4096):
+    """
+    Ordena uma run de arestas (peso, u, v) e a grava em disco em lotes
+    de 'tamanho_lote' arestas (um pickle por lote).
+    
+    Returns:
+        Caminho do arquivo da run
+    """
+    arestas.sort()
+    caminho = os.path.join(diretorio, f"run_{numero:06d}.pkl")
+    with open(caminho, 'wb') as arquivo:
+        for inicio in range(0, len(arestas), tamanho_lote):
+            pickle.dump(arestas[inicio:inicio + tamanho_lote], arquivo,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    return caminho
+
+
+def _ler_run(caminho):
+    """
+    Lê uma run gravada por '_gravar_run', um lote por vez.
+    
+    Yields:
+        Arestas (peso, u, v) em ordem crescente
+    """
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            try:
+                lote = pickle.load(arquivo)
+            except EOFError:
+                return
+            yield from lote
+
+
+def kruskal_externo(caminho, arestas_por_run=1_000_000, delimitador=None,
+                    tamanho_bloco=1 << 20, peso_padrao=1, tipo_rotulo=rotulo_padrao,
+                    diretorio_temporario=None, estatisticas=None):
+    """
+    Kruskal em memória externa para listas de arestas maiores que a RAM.
+    
+    1. O arquivo é lido em blocos (ver 'carregador_arestas'); os rótulos
+       são internados em índices densos e as arestas acumuladas em runs de
+       até 'arestas_por_run' arestas, que são ordenadas e gravadas em
+       arquivos temporários.
+    2. As runs são intercaladas com heapq.merge (k-way merge), lendo um
+       lote de cada arquivo por vez.
+    3. A sequência intercalada alimenta um UnionFindDenso, e a leitura
+       para assim que a AGM tiver n-1 arestas.
+    
+    A memória fica proporcional a |V| (rótulos e Union-Find) mais uma run.
+    Como no 'kruskal', a direção das arestas é ignorada; arestas repetidas
+    não precisam ser removidas, pois as cópias mais caras são rejeitadas
+    pelo Union-Find.
+    
+    Args:
+        caminho: Arquivo de lista de arestas "u v peso"
+        arestas_por_run: Número máximo de arestas por run em memória
+        delimitador: Separador de colunas (ver 'ler_blocos_arestas')
+        tamanho_bloco: Tamanho aproximado de cada bloco lido, em bytes
+        peso_padrao: Peso usado quando a linha não tem terceira coluna
+        tipo_rotulo: Função que converte o texto (bytes) de um rótulo
+        diretorio_temporario: Diretório para as runs (padrão do sistema se None)
+        estatisticas: Dicionário opcional preenchido com 'arestas_lidas',
+                      'runs' e 'arestas_examinadas'
+        
+    Returns:
+        Tupla (arestas_agm, custo_total), como em 'kruskal' (uma floresta
+        geradora mínima se o grafo for desconexo)
+    """
+    # Vértices identificados pelo rótulo convertido (b'1' e b'01' são o
+    # mesmo vértice); 'por_token' evita converter de novo um token já visto
+    indice = {}
+    por_token = {}
+    rotulos = []
+    arestas_lidas = 0
+    
+    def _internar(token):
+        i = por_token.get(token)
+        if i is None:
+            rotulo = tipo_rotulo(token)
+            i = indice.get(rotulo)
+            if i is None:
+                i = indice[rotulo] = len(rotulos)
+                rotulos.append(rotulo)
+            por_token[token] = i
+        return i
+    
+    with tempfile.TemporaryDirectory(dir=diretorio_temporario) as diretorio:
+        runs = []
+        run = []
+        for arestas, _, _ in ler_blocos_arestas(caminho, delimitador, tamanho_bloco,
+                                                peso_padrao):
+            for token_u, token_v, peso in arestas:
+                u = _internar(token_u)
+                v = _internar(token_v)
+                if u != v:
+                    run.append((peso, u, v))
+            arestas_lidas += len(arestas)
+            if len(run) >= arestas_por_run:
+                runs.append(_gravar_run(run, diretorio, len(runs)))
+                run = []
+        del indice, por_token
+        
+        # Uma única run cabe na memória: dispensa os arquivos
+        if runs:
+            if run:
+                runs.append(_gravar_run(run, diretorio, len(runs)))
+            leitores = [_ler_run(caminho_run) for caminho_run in runs]
+            sequencia = heapq.merge(*leitores)
+        else:
+            run.sort()
+            leitores = []
+            sequencia = iter(run)
+        
+        n = len(rotulos)
+        uf = UnionFindDenso(n)
+        agm = []
+        custo_total = 0
+        examinadas = 0
+        
+        if n > 1:
+            for peso, u, v in sequencia:
+                examinadas += 1
+                if uf.union(u, v):
+                    agm.append((rotulos[u], rotulos[v], peso))
+                    custo_total += peso
+                    if len(agm) == n - 1:
+                        break
+        
+        for leitor in leitores:
+            leitor.close()
+    
+    if estatisticas is not None:
+        estatisticas['arestas_lidas'] = arestas_lidas
+        estatisticas['runs'] = len(runs) or 1
+        estatisticas['arestas_examinadas'] = examinadas
+    
+    return agm, custo_total
 
 
 def formatar_resultado(arestas_agm, custo_total):
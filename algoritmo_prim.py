@@ -1,11 +1,23 @@
 """
 Este arquivo implementa o Algoritmo de Prim para encontrar a
 Árvore Geradora Mínima (AGM) de um grafo.
+
+Três motores estão disponíveis, selecionados pelo argumento 'modo':
+- 'classico': segue o pseudocódigo da aula; a cada passo percorre todos
+  os nós da árvore e seus vizinhos em busca da aresta mínima (O(V·E)).
+- 'preguicoso': heap binário (heapq) de arestas candidatas; arestas que
+  levam a nós já na árvore são descartadas ao sair da fila,
+  O(E log E) = O(E log V).
+- 'ansioso': fila de prioridade indexada de nós (FilaPrioridadeIndexada)
+  com diminuição de chave; cada nó fora da árvore guarda só a sua melhor
+  aresta de ligação, O(E log V) com no máximo V entradas na fila.
 """
 
+import heapq
 import math
 # Importa o grafo e a lista de nós do outro arquivo
 from grafos import grafo_direcionado, TODOS_NOS
+from grafo_csr import GrafoCSR
 
 def _adicionar_aresta_nao_direcionada(grafo_nd, u, v, peso):
     """
@@ -51,9 +63,275 @@ def criar_grafo_nao_direcionado(grafo_dir, nos):
             
     return grafo_nd
 
-def algoritmo_prim(grafo_nd, no_inicial):
+class FilaPrioridadeIndexada:
+    """
+    Heap binário mínimo em que cada chave (nó) aparece no máximo uma vez,
+    com a sua posição no heap guardada em um dicionário. Isso permite
+    diminuir a prioridade de uma chave já presente (decrease-key) em
+    O(log n), em vez de inserir uma entrada nova como no heapq.
+
+    Os atributos 'insercoes', 'remocoes' e 'diminuicoes' contam as
+    operações realizadas.
     """
-    Executa o Algoritmo de Prim (implementação clássica, O(N^2)).
+
+    def __init__(self):
+        self._heap = []      # Listas [prioridade, chave]
+        self._posicao = {}   # chave -> índice em _heap
+        self.insercoes = 0
+        self.remocoes = 0
+        self.diminuicoes = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, chave):
+        return chave in self._posicao
+
+    def prioridade(self, chave):
+        """Prioridade atual de uma chave presente na fila."""
+        return self._heap[self._posicao[chave]][0]
+
+    def inserir(self, chave, prioridade):
+        """
+        Insere uma chave que ainda não está na fila.
+
+        Entrada:
+        - chave: Identificador (hashable) do elemento.
+        - prioridade (int/float): Prioridade inicial.
+        """
+        if chave in self._posicao:
+            raise KeyError(f"A chave {chave!r} já está na fila")
+        self._heap.append([prioridade, chave])
+        self._posicao[chave] = len(self._heap) - 1
+        self._subir(len(self._heap) - 1)
+        self.insercoes += 1
+
+    def diminuir_chave(self, chave, prioridade):
+        """
+        Diminui a prioridade de uma chave presente na fila.
+
+        Entrada:
+        - chave: Chave presente na fila.
+        - prioridade (int/float): Nova prioridade (não maior que a atual).
+        """
+        i = self._posicao[chave]
+        if prioridade > self._heap[i][0]:
+            raise ValueError(f"A nova prioridade {prioridade} é maior que a atual")
+        self._heap[i][0] = prioridade
+        self._subir(i)
+        self.diminuicoes += 1
+
+    def remover_minimo(self):
+        """
+        Remove o elemento de menor prioridade.
+
+        Saída:
+        - (tuple): (chave, prioridade).
+        """
+        heap = self._heap
+        prioridade, chave = heap[0]
+        ultimo = heap.pop()
+        del self._posicao[chave]
+        if heap:
+            heap[0] = ultimo
+            self._posicao[ultimo[1]] = 0
+            self._descer(0)
+        self.remocoes += 1
+        return chave, prioridade
+
+    def _subir(self, i):
+        heap, posicao = self._heap, self._posicao
+        item = heap[i]
+        while i > 0:
+            pai = (i - 1) >> 1
+            if heap[pai][0] <= item[0]:
+                break
+            heap[i] = heap[pai]
+            posicao[heap[i][1]] = i
+            i = pai
+        heap[i] = item
+        posicao[item[1]] = i
+
+    def _descer(self, i):
+        heap, posicao = self._heap, self._posicao
+        n = len(heap)
+        item = heap[i]
+        while True:
+            filho = 2 * i + 1
+            if filho >= n:
+                break
+            if filho + 1 < n and heap[filho + 1][0] < heap[filho][0]:
+                filho += 1
+            if item[0] <= heap[filho][0]:
+                break
+            heap[i] = heap[filho]
+            posicao[heap[i][1]] = i
+            i = filho
+        heap[i] = item
+        posicao[item[1]] = i
+
+def _avisar_se_desconexo(num_visitados, num_nos):
+    """
+    Imprime o aviso de grafo desconexo quando a AGM não alcançou todos os nós.
+    """
+    if num_visitados < num_nos:
+        print(f"\nAviso: O grafo pode não ser conexo.")
+        print(f"A AGM foi gerada para {num_visitados} nós alcançáveis.")
+
+def _prim_preguicoso(vizinhos, no_inicial, num_nos, estatisticas=None):
+    """
+    Motor 'preguicoso' (lazy Prim), O(E log V).
+
+    A fila (heapq) guarda arestas candidatas (peso, j, k) com j na árvore.
+    Quando uma aresta sai da fila e k já está na árvore, ela é descartada.
+
+    Entrada:
+    - vizinhos (callable): vizinhos(j) devolve pares (k, peso).
+    - no_inicial: O nó onde o algoritmo começa.
+    - num_nos (int): Número total de nós.
+    - estatisticas (dict/None): Recebe 'insercoes', 'remocoes' e
+      'descartadas' (remoções de arestas obsoletas).
+
+    Saída: a mesma de 'algoritmo_prim'.
+    """
+    agm_arestas = []
+    custo_total = 0
+    na_arvore = {no_inicial}
+    fila = []
+    insercoes = remocoes = descartadas = 0
+
+    for k, peso in vizinhos(no_inicial):
+        if k not in na_arvore:
+            fila.append((peso, no_inicial, k))
+    heapq.heapify(fila)
+    insercoes += len(fila)
+
+    while fila and len(na_arvore) < num_nos:
+        aresta = heapq.heappop(fila)
+        remocoes += 1
+        peso, j, k = aresta
+        if k in na_arvore:
+            descartadas += 1
+            continue
+
+        na_arvore.add(k)
+        agm_arestas.append(aresta)
+        custo_total += peso
+
+        for y, peso_ky in vizinhos(k):
+            if y not in na_arvore:
+                heapq.heappush(fila, (peso_ky, k, y))
+                insercoes += 1
+
+    if estatisticas is not None:
+        estatisticas['insercoes'] = insercoes
+        estatisticas['remocoes'] = remocoes
+        estatisticas['descartadas'] = descartadas
+
+    _avisar_se_desconexo(len(na_arvore), num_nos)
+    return agm_arestas, custo_total
+
+def _prim_ansioso(vizinhos, no_inicial, num_nos, estatisticas=None):
+    """
+    Motor 'ansioso' (eager Prim), O(E log V).
+
+    A fila indexada guarda cada nó k fora da árvore uma única vez, com o
+    peso da sua melhor aresta até a árvore; 'ligacao[k]' guarda a ponta j
+    dessa aresta. Uma aresta mais barata até k diminui a chave de k.
+
+    Entrada: igual à de '_prim_preguicoso'. 'estatisticas' recebe
+    'insercoes', 'remocoes' e 'diminuicoes_chave'.
+
+    Saída: a mesma de 'algoritmo_prim'.
+    """
+    agm_arestas = []
+    custo_total = 0
+    na_arvore = set()
+    ligacao = {no_inicial: None}
+    fila = FilaPrioridadeIndexada()
+    fila.inserir(no_inicial, 0)
+
+    while fila:
+        k, peso = fila.remover_minimo()
+        na_arvore.add(k)
+        j = ligacao[k]
+        if j is not None:
+            agm_arestas.append((peso, j, k))
+            custo_total += peso
+
+        for y, peso_ky in vizinhos(k):
+            if y in na_arvore:
+                continue
+            if y not in fila:
+                fila.inserir(y, peso_ky)
+                ligacao[y] = k
+            elif peso_ky < fila.prioridade(y):
+                fila.diminuir_chave(y, peso_ky)
+                ligacao[y] = k
+
+    if estatisticas is not None:
+        estatisticas['insercoes'] = fila.insercoes
+        estatisticas['remocoes'] = fila.remocoes
+        estatisticas['diminuicoes_chave'] = fila.diminuicoes
+
+    _avisar_se_desconexo(len(na_arvore), num_nos)
+    return agm_arestas, custo_total
+
+def _prim_csr(grafo_nd, no_inicial, modo='classico', estatisticas=None):
+    """
+    Algoritmo de Prim sobre um GrafoCSR não direcionado (cada aresta
+    presente nos dois sentidos), usando índices densos. Aceita os mesmos
+    modos de 'algoritmo_prim'.
+
+    Saída: a mesma de 'algoritmo_prim', com os rótulos originais.
+    """
+    n = grafo_nd.num_vertices
+    inicio, destinos, pesos = grafo_nd.inicio, grafo_nd.destinos, grafo_nd.pesos
+    rotulos = grafo_nd.rotulos
+
+    if modo != 'classico':
+        def _vizinhos(j):
+            return zip(destinos[inicio[j]:inicio[j + 1]], pesos[inicio[j]:inicio[j + 1]])
+
+        motor = _prim_preguicoso if modo == 'preguicoso' else _prim_ansioso
+        agm_arestas, custo_total = motor(_vizinhos, grafo_nd.indice_de(no_inicial), n,
+                                         estatisticas)
+        return [(peso, rotulos[j], rotulos[k]) for peso, j, k in agm_arestas], custo_total
+
+    agm_arestas = []
+    custo_total = 0
+
+    na_arvore = [False] * n
+    na_arvore[grafo_nd.indice_de(no_inicial)] = True
+    nos_visitados = [grafo_nd.indice_de(no_inicial)]
+
+    while len(nos_visitados) < n:
+        peso_minimo = math.inf
+        melhor_aresta = None
+
+        for j in nos_visitados:
+            for e in range(inicio[j], inicio[j + 1]):
+                k = destinos[e]
+                if not na_arvore[k] and pesos[e] < peso_minimo:
+                    peso_minimo = pesos[e]
+                    melhor_aresta = (pesos[e], j, k)
+
+        if melhor_aresta is None:
+            break
+
+        (peso, j, k) = melhor_aresta
+        na_arvore[k] = True
+        nos_visitados.append(k)
+        agm_arestas.append((peso, rotulos[j], rotulos[k]))
+        custo_total += peso
+
+    _avisar_se_desconexo(len(nos_visitados), n)
+
+    return agm_arestas, custo_total
+
+def algoritmo_prim(grafo_nd, no_inicial, modo='classico', estatisticas=None):
+    """
+    Executa o Algoritmo de Prim (por padrão, a implementação clássica).
 
     Segue o pseudocódigo:
     Z = nós na árvore
@@ -62,14 +340,30 @@ def algoritmo_prim(grafo_nd, no_inicial):
     tal que j está em Z e k está em N.
 
     Entrada:
-    - grafo_nd (dict): O grafo NÃO DIRECIONADO.
+    - grafo_nd (dict/GrafoCSR): O grafo NÃO DIRECIONADO.
     - no_inicial (int): O nó onde o algoritmo deve começar (raiz da árvore).
+    - modo (str): 'classico' (busca exaustiva, O(V·E)), 'preguicoso'
+                  (heapq de arestas) ou 'ansioso' (fila indexada com
+                  diminuição de chave), ambos O(E log V).
+    - estatisticas (dict/None): Se fornecido, recebe as contagens de
+      operações da fila nos modos com heap ('insercoes', 'remocoes' e
+      'descartadas' ou 'diminuicoes_chave').
 
     Saída:
     - (list): Uma lista de tuplas, onde cada tupla representa uma aresta
               na AGM no formato (peso, nó_origem, nó_destino).
     - (float/int): O custo total da AGM.
     """
+    if modo not in ('classico', 'preguicoso', 'ansioso'):
+        raise ValueError(f"Modo desconhecido: {modo!r} "
+                         f"(use 'classico', 'preguicoso' ou 'ansioso')")
+    if isinstance(grafo_nd, GrafoCSR):
+        return _prim_csr(grafo_nd, no_inicial, modo, estatisticas)
+    if modo != 'classico':
+        motor = _prim_preguicoso if modo == 'preguicoso' else _prim_ansioso
+        return motor(lambda j: grafo_nd.get(j, {}).items(), no_inicial, len(grafo_nd),
+                     estatisticas)
+    
     
     # T ← ∅ (Arestas da árvore final)
     agm_arestas = []
@@ -123,10 +417,8 @@ def algoritmo_prim(grafo_nd, no_inicial):
         agm_arestas.append((peso, j, k))
         custo_total += peso
 
-    # 9. Verifica se o grafo era conexo
-    if nos_nao_visitados: # Se sobraram nós em N
-        print(f"\nAviso: O grafo pode não ser conexo.")
-        print(f"A AGM foi gerada para {len(nos_visitados)} nós alcançáveis.")
+    # 9. Verifica se o grafo era conexo (se sobraram nós em N)
+    _avisar_se_desconexo(len(nos_visitados), len(nos_visitados) + len(nos_nao_visitados))
         
     return agm_arestas, custo_total
 
@@ -213,4 +505,11 @@ if __name__ == "__main__":
     print("-------------------------------------------------")
 
     # 5. Exibir os resultados (Desenho da Árvore)
-    exibir_agm_desenhada(agm_final, TODOS_NOS, no_de_inicio)
\ No newline at end of file
+    exibir_agm_desenhada(agm_final, TODOS_NOS, no_de_inicio)
+    # 6. Comparar com os motores baseados em heap
+    print("\nMotores com fila de prioridade:")
+    for modo in ('preguicoso', 'ansioso'):
+        estatisticas = {}
+        _, custo = algoritmo_prim(grafo_nd, no_de_inicio, modo=modo, estatisticas=estatisticas)
+        operacoes = ", ".join(f"{nome}={valor}" for nome, valor in estatisticas.items())
+        print(f"  {modo:<11} custo {custo} ({operacoes})")
@@ -0,0 +1,70 @@
+"""
+Benchmark: Hierarquias de Contração x Dijkstra (motor 'heap').
+
+Mede o tempo de pré-processamento das Hierarquias de Contração e o tempo
+médio por consulta das duas abordagens em grades e em grafos geométricos
+aleatórios, conferindo que os custos encontrados são iguais.
+
+Uso:
+    python benchmark_hierarquias_contracao.py
+"""
+
+import math
+import random
+import time
+
+from algoritmo_dijkstra import algoritmo_dijkstra
+from algoritmo_hierarquias_contracao import construir_hierarquia
+from geradores_grafos import gerar_grade, gerar_geometrico_aleatorio
+
+
+def executar_benchmark(nome, grafo, num_consultas=50, semente=0):
+    """
+    Executa o benchmark em um grafo e imprime os tempos.
+
+    Args:
+        nome: Nome do grafo para exibição
+        grafo: Dicionário {u: {v: peso}}
+        num_consultas: Número de pares (origem, destino) aleatórios
+        semente: Semente do gerador aleatório
+    """
+    aleatorio = random.Random(semente)
+    vertices = set(grafo.keys())
+    lista_vertices = sorted(vertices)
+    consultas = [(aleatorio.choice(lista_vertices), aleatorio.choice(lista_vertices))
+                 for _ in range(num_consultas)]
+
+    inicio = time.perf_counter()
+    hierarquia = construir_hierarquia(grafo)
+    tempo_construcao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    custos_ch = [hierarquia.consultar(s, t)[0] for s, t in consultas]
+    tempo_ch = (time.perf_counter() - inicio) / num_consultas
+
+    inicio = time.perf_counter()
+    custos_dijkstra = [algoritmo_dijkstra(grafo, vertices, s, modo='heap')[0][t]
+                       for s, t in consultas]
+    tempo_dijkstra = (time.perf_counter() - inicio) / num_consultas
+
+    for c1, c2 in zip(custos_ch, custos_dijkstra):
+        assert c1 == c2 or math.isclose(c1, c2), (c1, c2)
+
+    num_arestas = sum(len(v) for v in grafo.values())
+    print(f"{nome}: {len(vertices)} vértices, {num_arestas} arestas")
+    print(f"  Construção da hierarquia: {tempo_construcao:.2f} s")
+    print(f"  Consulta (CH):            {tempo_ch * 1000:.3f} ms")
+    print(f"  Consulta (Dijkstra):      {tempo_dijkstra * 1000:.3f} ms")
+    print(f"  Aceleração:               {tempo_dijkstra / tempo_ch:.1f}x")
+    print()
+
+
+if __name__ == "__main__":
+    print("BENCHMARK: HIERARQUIAS DE CONTRAÇÃO x DIJKSTRA")
+    print()
+
+    grade, _ = gerar_grade(60, 60, semente=1)
+    executar_benchmark("Grade 60x60", grade)
+
+    geometrico, _ = gerar_geometrico_aleatorio(4000, 0.03, semente=2)
+    executar_benchmark("Geométrico aleatório (r=0.03)", geometrico)
@@ -0,0 +1,234 @@
+"""
+Carregador de grafos a partir de arquivos de lista de arestas.
+
+Cada linha descreve uma aresta "u v peso" (o peso é opcional). As colunas
+podem ser separadas por espaços/tabulações (TSV) ou por vírgulas (CSV).
+Linhas vazias e comentários iniciados por '#' ou '%' são ignorados.
+
+O arquivo é lido em blocos de tamanho fixo, e cada bloco é descartado
+depois de processado: o texto bruto nunca fica inteiro na memória.
+Os rótulos dos vértices são internados em índices densos (0..n-1), o que
+permite construir tanto o dicionário {u: {v: peso}} de 'grafos.py'
+quanto um GrafoCSR compacto.
+"""
+
+import time
+from array import array
+
+from grafo_csr import GrafoCSR
+
+
+class EstatisticasCarga:
+    """
+    Contadores de uma carga, atualizados a cada bloco lido.
+
+    Atributos:
+        linhas: Linhas lidas (incluindo comentários e linhas vazias)
+        arestas: Arestas carregadas
+        vertices: Vértices distintos encontrados
+        bytes_lidos: Bytes lidos do arquivo
+        segundos: Tempo decorrido desde o início da carga
+    """
+
+    def __init__(self):
+        self.linhas = 0
+        self.arestas = 0
+        self.vertices = 0
+        self.bytes_lidos = 0
+        self.segundos = 0.0
+
+    @property
+    def arestas_por_segundo(self):
+        """Vazão da carga em arestas por segundo."""
+        if self.segundos <= 0:
+            return 0.0
+        return self.arestas / self.segundos
+
+    def __repr__(self):
+        return (f"EstatisticasCarga(arestas={self.arestas}, vertices={self.vertices}, "
+                f"bytes_lidos={self.bytes_lidos}, segundos={self.segundos:.3f}, "
+                f"arestas_por_segundo={self.arestas_por_segundo:.0f})")
+
+
+def rotulo_padrao(token):
+    """
+    Converte o texto de um rótulo: inteiro quando possível, senão string.
+    """
+    try:
+        return int(token)
+    except ValueError:
+        return token.decode('utf-8')
+
+
+def _converter_peso(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+
+def ler_blocos_arestas(caminho, delimitador=None, tamanho_bloco=1 << 20, peso_padrao=1):
+    """
+    Lê o arquivo em blocos de aproximadamente 'tamanho_bloco' bytes.
+
+    Args:
+        caminho: Caminho do arquivo de lista de arestas
+        delimitador: Separador de colunas. None detecta pelo nome do
+                     arquivo: ',' para '.csv', espaços/tabulações nos demais
+        tamanho_bloco: Tamanho aproximado de cada bloco, em bytes
+        peso_padrao: Peso usado quando a linha não tem terceira coluna
+
+    Yields:
+        Tuplas (arestas, linhas, bytes) por bloco, onde 'arestas' é uma
+        lista de (token_u, token_v, peso) com os rótulos ainda em bytes
+    """
+    if delimitador is None and str(caminho).lower().endswith('.csv'):
+        delimitador = ','
+    separador = delimitador.encode('utf-8') if delimitador is not None else None
+
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            linhas = arquivo.readlines(tamanho_bloco)
+            if not linhas:
+                break
+
+            arestas = []
+            num_bytes = 0
+            for linha in linhas:
+                num_bytes += len(linha)
+                linha = linha.strip()
+                if not linha or linha[:1] in (b'#', b'%'):
+                    continue
+                colunas = linha.split(separador)
+                if len(colunas) < 2:
+                    raise ValueError(f"Linha de aresta inválida: {linha!r}")
+                peso = (_converter_peso(colunas[2].strip())
+                        if len(colunas) > 2 else peso_padrao)
+                arestas.append((colunas[0].strip(), colunas[1].strip(), peso))
+
+            yield arestas, len(linhas), num_bytes
+
+
+def carregar_lista_arestas(caminho, formato='dict', direcionado=True, delimitador=None,
+                           tamanho_bloco=1 << 20, peso_padrao=1, tipo_rotulo=rotulo_padrao,
+                           progresso=None):
+    """
+    Carrega um grafo a partir de um arquivo de lista de arestas.
+
+    Args:
+        caminho: Caminho do arquivo
+        formato: 'dict' para {u: {v: peso}} ou 'csr' para GrafoCSR
+        direcionado: Se False, cada linha gera as arestas (u, v) e (v, u)
+        delimitador: Separador de colunas (ver 'ler_blocos_arestas')
+        tamanho_bloco: Tamanho aproximado de cada bloco, em bytes
+        peso_padrao: Peso usado quando a linha não tem terceira coluna
+        tipo_rotulo: Função que converte o texto (bytes) de um rótulo
+        progresso: Função opcional chamada com a EstatisticasCarga após
+                   cada bloco (para painéis de acompanhamento)
+
+    Returns:
+        Tupla (grafo, estatisticas). No formato 'dict', arestas repetidas
+        mantêm o menor peso; no formato 'csr', todas são preservadas.
+    """
+    if formato not in ('dict', 'csr'):
+        raise ValueError(f"Formato desconhecido: {formato!r} (use 'dict' ou 'csr')")
+
+    estatisticas = EstatisticasCarga()
+    inicio_carga = time.perf_counter()
+
+    # Internação dos rótulos: rótulo convertido -> índice denso. Grafias
+    # diferentes do mesmo rótulo (ex: b'1' e b'01') viram o mesmo vértice;
+    # 'por_token' só evita converter de novo um token já visto
+    indice = {}
+    por_token = {}
+    rotulos = []
+
+    grafo = {}
+    origens = array('q')
+    destinos = array('q')
+    pesos = array('q')
+
+    def _internar(token):
+        i = por_token.get(token)
+        if i is None:
+            rotulo = tipo_rotulo(token)
+            i = indice.get(rotulo)
+            if i is None:
+                i = len(rotulos)
+                indice[rotulo] = i
+                rotulos.append(rotulo)
+                if formato == 'dict':
+                    grafo[rotulo] = {}
+            por_token[token] = i
+        return i
+
+    for arestas, num_linhas, num_bytes in ler_blocos_arestas(
+            caminho, delimitador, tamanho_bloco, peso_padrao):
+        for token_u, token_v, peso in arestas:
+            u = _internar(token_u)
+            v = _internar(token_v)
+
+            if formato == 'dict':
+                pares = ((u, v),) if direcionado else ((u, v), (v, u))
+                for a, b in pares:
+                    vizinhos = grafo[rotulos[a]]
+                    rotulo_b = rotulos[b]
+                    if rotulo_b not in vizinhos or peso < vizinhos[rotulo_b]:
+                        vizinhos[rotulo_b] = peso
+            else:
+                if isinstance(peso, float) and pesos.typecode == 'q':
+                    pesos = array('d', pesos)
+                origens.append(u)
+                destinos.append(v)
+                pesos.append(peso)
+                if not direcionado:
+                    origens.append(v)
+                    destinos.append(u)
+                    pesos.append(peso)
+
+        estatisticas.linhas += num_linhas
+        estatisticas.arestas += len(arestas)
+        estatisticas.vertices = len(rotulos)
+        estatisticas.bytes_lidos += num_bytes
+        estatisticas.segundos = time.perf_counter() - inicio_carga
+        if progresso is not None:
+            progresso(estatisticas)
+
+    if formato == 'csr':
+        grafo = GrafoCSR.de_arestas(len(rotulos), origens, destinos, pesos, rotulos)
+
+    estatisticas.segundos = time.perf_counter() - inicio_carga
+    return grafo, estatisticas
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from grafos import grafo_direcionado
+
+    # Grava o grafo do trabalho como lista de arestas e o recarrega
+    caminho_arquivo = os.path.join(tempfile.gettempdir(), "grafo_direcionado.tsv")
+    with open(caminho_arquivo, 'w') as saida:
+        saida.write("# u\tv\tpeso\n")
+        for u, vizinhos in grafo_direcionado.items():
+            for v, peso in vizinhos.items():
+                saida.write(f"{u}\t{v}\t{peso}\n")
+
+    def _mostrar_progresso(estatisticas):
+        print(f"  ... {estatisticas.arestas} arestas "
+              f"({estatisticas.arestas_por_segundo:.0f} arestas/s)")
+
+    print(f"Carregando {caminho_arquivo}...")
+    grafo, estatisticas = carregar_lista_arestas(caminho_arquivo, tamanho_bloco=128,
+                                                 progresso=_mostrar_progresso)
+    print(estatisticas)
+    print("Arestas conferem com grafos.py:",
+          all(grafo.get(u, {}) == vizinhos for u, vizinhos in grafo_direcionado.items()
+              if vizinhos))
+
+    grafo_csr, _ = carregar_lista_arestas(caminho_arquivo, formato='csr')
+    print(f"Formato compacto: {grafo_csr}")
+
+    os.remove(caminho_arquivo)
@@ -0,0 +1,130 @@
+"""
+Geradores de grafos sintéticos para testes de desempenho.
+
+Todos os grafos seguem o formato de 'grafos.py': {u: {v: peso}}.
+As funções de grafos com geometria também devolvem as coordenadas dos
+vértices, úteis para heurísticas geométricas (A*).
+"""
+
+import math
+import random
+
+
+def gerar_grade(linhas, colunas, peso_min=1, peso_max=10, semente=None):
+    """
+    Gera uma grade (malha) direcionada com arestas nos dois sentidos entre
+    vizinhos horizontais e verticais, com pesos inteiros aleatórios.
+
+    Args:
+        linhas: Número de linhas da grade
+        colunas: Número de colunas da grade
+        peso_min: Menor peso possível
+        peso_max: Maior peso possível
+        semente: Semente opcional do gerador aleatório
+
+    Returns:
+        Tupla (grafo, coordenadas) onde:
+        - grafo: Dicionário {u: {v: peso}}, vértices numerados a partir de 0
+        - coordenadas: Dicionário {v: (linha, coluna)}
+    """
+    aleatorio = random.Random(semente)
+    grafo = {}
+    coordenadas = {}
+
+    for i in range(linhas):
+        for j in range(colunas):
+            v = i * colunas + j
+            coordenadas[v] = (i, j)
+            grafo[v] = {}
+
+    for i in range(linhas):
+        for j in range(colunas):
+            v = i * colunas + j
+            if j + 1 < colunas:
+                grafo[v][v + 1] = aleatorio.randint(peso_min, peso_max)
+                grafo[v + 1][v] = aleatorio.randint(peso_min, peso_max)
+            if i + 1 < linhas:
+                grafo[v][v + colunas] = aleatorio.randint(peso_min, peso_max)
+                grafo[v + colunas][v] = aleatorio.randint(peso_min, peso_max)
+
+    return grafo, coordenadas
+
+
+def gerar_geometrico_aleatorio(n, raio, semente=None):
+    """
+    Gera um grafo geométrico aleatório: n pontos uniformes no quadrado
+    unitário, ligados (nos dois sentidos) quando a distância entre eles é
+    no máximo 'raio'. O peso é a distância euclidiana.
+
+    Os pontos são distribuídos em células de lado 'raio', de modo que só
+    pares de células vizinhas são comparados.
+
+    Args:
+        n: Número de vértices
+        raio: Distância máxima de conexão
+        semente: Semente opcional do gerador aleatório
+
+    Returns:
+        Tupla (grafo, coordenadas) onde:
+        - grafo: Dicionário {u: {v: peso}}, vértices numerados a partir de 0
+        - coordenadas: Dicionário {v: (x, y)}
+    """
+    aleatorio = random.Random(semente)
+    coordenadas = {v: (aleatorio.random(), aleatorio.random()) for v in range(n)}
+    grafo = {v: {} for v in range(n)}
+
+    celulas = {}
+    for v, (x, y) in coordenadas.items():
+        celulas.setdefault((int(x / raio), int(y / raio)), []).append(v)
+
+    for (cx, cy), membros in celulas.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                vizinhos = celulas.get((cx + dx, cy + dy))
+                if not vizinhos:
+                    continue
+                for u in membros:
+                    xu, yu = coordenadas[u]
+                    for v in vizinhos:
+                        if u < v:
+                            xv, yv = coordenadas[v]
+                            distancia = math.hypot(xu - xv, yu - yv)
+                            if distancia <= raio:
+                                grafo[u][v] = distancia
+                                grafo[v][u] = distancia
+
+    return grafo, coordenadas
+
+
+def gerar_aleatorio(n, m, peso_min=1, peso_max=100, semente=None):
+    """
+    Gera um grafo aleatório (modelo G(n, m)) com m arestas distintas entre
+    pares de vértices sorteados uniformemente, representadas nos dois
+    sentidos com o mesmo peso inteiro aleatório.
+
+    Args:
+        n: Número de vértices
+        m: Número de arestas (limitado a n*(n-1)/2)
+        peso_min: Menor peso possível
+        peso_max: Maior peso possível
+        semente: Semente opcional do gerador aleatório
+
+    Returns:
+        Dicionário {u: {v: peso}}, vértices numerados a partir de 0
+    """
+    aleatorio = random.Random(semente)
+    grafo = {v: {} for v in range(n)}
+    m = min(m, n * (n - 1) // 2)
+
+    arestas = 0
+    while arestas < m:
+        u = aleatorio.randrange(n)
+        v = aleatorio.randrange(n)
+        if u == v or v in grafo[u]:
+            continue
+        peso = aleatorio.randint(peso_min, peso_max)
+        grafo[u][v] = peso
+        grafo[v][u] = peso
+        arestas += 1
+
+    return grafo
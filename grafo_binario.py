@@ -0,0 +1,249 @@
+"""
+Formato binário versionado para grafos CSR, aberto com mmap.
+
+Layout do arquivo (little-endian, seções alinhadas em 8 bytes):
+
+    cabeçalho (CABECALHO, 56 bytes)
+        magic        8s   b'GRAFOCSR'
+        versao       I    VERSAO_FORMATO
+        flags        I    bit 0: possui tabela de rótulos
+        n            q    número de vértices
+        m            q    número de arestas
+        tipo_destino c    typecode dos destinos ('i' ou 'q')
+        tipo_peso    c    typecode dos pesos ('q' ou 'd')
+        (6 bytes de preenchimento)
+        tam_rotulos  q    tamanho em bytes da tabela de rótulos
+        (8 bytes reservados)
+    inicio       (n + 1) * int64
+    destinos     m * tipo_destino
+    pesos        m * tipo_peso
+    rotulos      JSON (lista de rótulos int/str), opcional
+
+Abrir o arquivo apenas lê o cabeçalho e cria visões (memoryview) sobre o
+mapeamento; nenhum dado é copiado, então o custo é praticamente constante
+mesmo para bilhões de arestas. Como o mapeamento é somente leitura e
+compartilhado, vários processos que abrem o mesmo arquivo usam as mesmas
+páginas do cache do sistema operacional.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from grafo_csr import GrafoCSR
+
+MAGIC = b'GRAFOCSR'
+VERSAO_FORMATO = 1
+FLAG_ROTULOS = 1
+
+CABECALHO = struct.Struct('<8sIIqqcc6xq8x')
+
+
+def _alinhar(posicao):
+    return (posicao + 7) & ~7
+
+
+def _como_array(sequencia, tipos_validos, tipo_padrao):
+    """
+    Devolve (typecode, buffer) de uma sequência, evitando cópia quando ela
+    já é um array/memoryview com typecode aceito pelo formato.
+    """
+    if isinstance(sequencia, array) and sequencia.typecode in tipos_validos:
+        return sequencia.typecode, sequencia
+    if isinstance(sequencia, memoryview) and sequencia.format in tipos_validos:
+        return sequencia.format, sequencia
+    convertido = array(tipo_padrao, sequencia)
+    return tipo_padrao, convertido
+
+
+def salvar_grafo_binario(grafo, caminho):
+    """
+    Grava um GrafoCSR no formato binário.
+
+    Args:
+        grafo: GrafoCSR a ser gravado
+        caminho: Caminho do arquivo de saída
+
+    Raises:
+        ValueError: Se algum rótulo não for int ou str
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("O formato binário de grafos requer uma máquina little-endian")
+
+    n = grafo.num_vertices
+    m = grafo.num_arestas
+
+    _, inicio = _como_array(grafo.inicio, ('q',), 'q')
+    tipo_destino, destinos = _como_array(grafo.destinos, ('i', 'q'), 'q')
+    tipo_peso, pesos = _como_array(grafo.pesos, ('q', 'd'), 'd')
+
+    flags = 0
+    rotulos_json = b''
+    if grafo._rotulos is not None:
+        rotulos = list(grafo.rotulos)
+        for rotulo in rotulos:
+            if isinstance(rotulo, bool) or not isinstance(rotulo, (int, str)):
+                raise ValueError(f"Rótulo não suportado pelo formato binário: {rotulo!r}")
+        rotulos_json = json.dumps(rotulos, separators=(',', ':')).encode('utf-8')
+        flags |= FLAG_ROTULOS
+
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(MAGIC, VERSAO_FORMATO, flags, n, m,
+                                     tipo_destino.encode(), tipo_peso.encode(),
+                                     len(rotulos_json)))
+        for secao in (inicio, destinos, pesos):
+            arquivo.write(memoryview(secao).cast('B'))
+            arquivo.write(b'\0' * (_alinhar(arquivo.tell()) - arquivo.tell()))
+        arquivo.write(rotulos_json)
+
+
+class GrafoCSRMapeado(GrafoCSR):
+    """
+    GrafoCSR cujos arrays são visões sobre um arquivo mapeado em memória.
+
+    A tabela de rótulos só é decodificada no primeiro acesso a 'rotulos'.
+    Use 'fechar' (ou um bloco 'with') para liberar o mapeamento.
+    """
+
+    def __init__(self, mapa, inicio, destinos, pesos, secao_rotulos):
+        super().__init__(inicio, destinos, pesos, None)
+        self._mapa = mapa
+        self._secao_rotulos = secao_rotulos
+
+    @property
+    def rotulos(self):
+        if self._rotulos is None and self._secao_rotulos is not None:
+            self._rotulos = json.loads(bytes(self._secao_rotulos).decode('utf-8'))
+            self._secao_rotulos.release()
+            self._secao_rotulos = None
+        return super().rotulos
+
+    def indice_de(self, rotulo):
+        # Carrega a tabela de rótulos antes de consultar o índice
+        if self._secao_rotulos is not None:
+            _ = self.rotulos
+        return super().indice_de(rotulo)
+
+    def fechar(self):
+        """
+        Libera as visões e fecha o mapeamento do arquivo. Visões NumPy
+        obtidas com 'para_numpy' devem ser descartadas antes.
+        """
+        for visao in (self.inicio, self.destinos, self.pesos, self._secao_rotulos):
+            if isinstance(visao, memoryview):
+                visao.release()
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def _validar_cabecalho(mapa, caminho):
+    """
+    Lê o cabeçalho e confere que as seções descritas cabem no arquivo,
+    antes de criar qualquer visão sobre o mapeamento.
+
+    Returns:
+        Tupla (n, m, (tipo_destino, tipo_peso), tam_rotulos, flags)
+
+    Raises:
+        ValueError: Se o cabeçalho for inválido ou o arquivo estiver
+                    truncado
+    """
+    if len(mapa) < CABECALHO.size:
+        raise ValueError(f"{caminho} é pequeno demais para um grafo binário")
+
+    (magic, versao, flags, n, m, tipo_destino, tipo_peso,
+     tam_rotulos) = CABECALHO.unpack_from(mapa, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{caminho} não é um grafo binário (magic inválido)")
+    if versao != VERSAO_FORMATO:
+        raise ValueError(f"Versão de grafo binário não suportada: {versao}")
+    tipo_destino = tipo_destino.decode('latin-1')
+    tipo_peso = tipo_peso.decode('latin-1')
+    if tipo_destino not in ('i', 'q') or tipo_peso not in ('q', 'd'):
+        raise ValueError(f"{caminho}: tipos de seção inválidos no cabeçalho "
+                         f"(destinos {tipo_destino!r}, pesos {tipo_peso!r})")
+    if n < 0 or m < 0 or tam_rotulos < 0:
+        raise ValueError(f"{caminho}: cabeçalho com tamanhos negativos "
+                         f"(n={n}, m={m}, rótulos={tam_rotulos})")
+    if not flags & FLAG_ROTULOS and tam_rotulos:
+        raise ValueError(f"{caminho}: tabela de rótulos de {tam_rotulos} bytes "
+                         f"sem a flag de rótulos")
+
+    fim = CABECALHO.size
+    for typecode, quantidade in (('q', n + 1), (tipo_destino, m), (tipo_peso, m)):
+        fim = _alinhar(fim + quantidade * array(typecode).itemsize)
+    fim += tam_rotulos
+    if fim > len(mapa):
+        raise ValueError(f"{caminho} está truncado: o cabeçalho (n={n}, m={m}, "
+                         f"rótulos={tam_rotulos} bytes) exige {fim} bytes, "
+                         f"mas o arquivo tem {len(mapa)}")
+
+    return n, m, (tipo_destino, tipo_peso), tam_rotulos, flags
+
+
+def abrir_grafo_binario(caminho):
+    """
+    Abre um grafo gravado por 'salvar_grafo_binario' sem copiar os dados.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        GrafoCSRMapeado, aceito por todos os algoritmos que recebem GrafoCSR
+
+    Raises:
+        ValueError: Se o arquivo não estiver no formato ou versão esperados,
+                    ou se for menor que o tamanho descrito no cabeçalho
+    """
+    with open(caminho, 'rb') as arquivo:
+        mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        n, m, tipos, tam_rotulos, flags = _validar_cabecalho(mapa, caminho)
+    except ValueError:
+        mapa.close()
+        raise
+
+    visao = memoryview(mapa)
+    posicao = CABECALHO.size
+    secoes = []
+    for typecode, quantidade in zip(('q',) + tipos, (n + 1, m, m)):
+        tamanho = quantidade * array(typecode).itemsize
+        secoes.append(visao[posicao:posicao + tamanho].cast(typecode))
+        posicao = _alinhar(posicao + tamanho)
+
+    secao_rotulos = None
+    if flags & FLAG_ROTULOS:
+        secao_rotulos = visao[posicao:posicao + tam_rotulos]
+    visao.release()
+
+    return GrafoCSRMapeado(mapa, *secoes, secao_rotulos)
+
+
+# --- Bloco de Execução Principal ---
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from grafos import grafo_direcionado, TODOS_NOS
+    from algoritmo_dijkstra import algoritmo_dijkstra, reconstruir_caminho
+
+    caminho_arquivo = os.path.join(tempfile.gettempdir(), "grafo_direcionado.csr")
+    salvar_grafo_binario(GrafoCSR.de_dict(grafo_direcionado, TODOS_NOS), caminho_arquivo)
+    print(f"Grafo gravado em {caminho_arquivo} ({os.path.getsize(caminho_arquivo)} bytes)")
+
+    with abrir_grafo_binario(caminho_arquivo) as grafo:
+        print(f"Aberto com mmap: {grafo}")
+        dist, pred = algoritmo_dijkstra(grafo, None, 1, modo='heap')
+        caminho = reconstruir_caminho(pred, 1, 15)
+        print(f"  Custo 1 -> 15:   {dist[15]}")
+        print(f"  Caminho:         {' -> '.join(map(str, caminho))}")
+
+    os.remove(caminho_arquivo)
@@ -0,0 +1,217 @@
+"""
+Representação compacta de grafos em CSR (Compressed Sparse Row).
+
+O formato de 'grafos.py' ({u: {v: peso}}) é prático para grafos pequenos,
+mas custa centenas de bytes por aresta. Em CSR o grafo é guardado em três
+arrays contíguos:
+
+- inicio[i] .. inicio[i+1]-1: posições das arestas que saem do vértice i
+- destinos[e]: índice denso do vértice de destino da aresta e
+- pesos[e]: peso da aresta e
+
+Os vértices são numerados densamente de 0 a n-1; 'rotulos' faz a ponte
+entre o índice denso e o rótulo original do vértice (ex: 1 a 19).
+Os arrays são do módulo 'array' por padrão; NumPy é opcional.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+
+def _tipo_indice(quantidade):
+    """Typecode de array suficiente para guardar índices até 'quantidade'."""
+    return 'i' if quantidade < 2 ** 31 else 'q'
+
+
+def _tipo_peso(pesos):
+    """'q' se todos os pesos forem inteiros, senão 'd'."""
+    for peso in pesos:
+        if not isinstance(peso, int) or isinstance(peso, bool):
+            return 'd'
+    return 'q'
+
+
+class GrafoCSR:
+    """
+    Grafo direcionado ponderado em formato CSR.
+
+    Atributos:
+        inicio: Sequência com n+1 deslocamentos
+        destinos: Sequência com o índice denso do destino de cada aresta
+        pesos: Sequência com o peso de cada aresta
+    """
+
+    def __init__(self, inicio, destinos, pesos, rotulos=None):
+        """
+        Inicializa o grafo a partir dos arrays CSR.
+
+        Args:
+            inicio: Deslocamentos (n+1 posições)
+            destinos: Índices densos dos destinos
+            pesos: Pesos das arestas
+            rotulos: Lista opcional de rótulos; se None, o rótulo de cada
+                     vértice é o próprio índice denso
+        """
+        self.inicio = inicio
+        self.destinos = destinos
+        self.pesos = pesos
+        self._rotulos = rotulos
+        self._indice = None
+
+    @property
+    def num_vertices(self):
+        return len(self.inicio) - 1
+
+    @property
+    def num_arestas(self):
+        return len(self.destinos)
+
+    @property
+    def rotulos(self):
+        """Sequência {índice denso -> rótulo}."""
+        if self._rotulos is None:
+            return range(self.num_vertices)
+        return self._rotulos
+
+    @property
+    def indice(self):
+        """Dicionário {rótulo -> índice denso} (construído sob demanda)."""
+        if self._indice is None:
+            self._indice = {rotulo: i for i, rotulo in enumerate(self.rotulos)}
+        return self._indice
+
+    def indice_de(self, rotulo):
+        """Índice denso do vértice com o rótulo dado."""
+        if self._rotulos is None:
+            return rotulo
+        return self.indice[rotulo]
+
+    def vizinhos(self, i):
+        """
+        Itera sobre as arestas que saem do vértice denso i.
+
+        Yields:
+            Tuplas (j, peso) com o índice denso do destino
+        """
+        destinos = self.destinos
+        pesos = self.pesos
+        for e in range(self.inicio[i], self.inicio[i + 1]):
+            yield destinos[e], pesos[e]
+
+    def origens(self):
+        """
+        Array com o índice denso da origem de cada aresta (mesma ordem de
+        'destinos' e 'pesos'), útil para percorrer a lista de arestas.
+        """
+        origens = array(_tipo_indice(self.num_vertices))
+        inicio = self.inicio
+        for i in range(self.num_vertices):
+            origens.extend([i] * (inicio[i + 1] - inicio[i]))
+        return origens
+
+    @classmethod
+    def de_arestas(cls, num_vertices, origens, destinos, pesos, rotulos=None):
+        """
+        Constrói o grafo a partir de uma lista de arestas em índices densos
+        (ordenação por contagem, O(n + m)).
+
+        Args:
+            num_vertices: Número de vértices n
+            origens: Sequência com a origem de cada aresta
+            destinos: Sequência com o destino de cada aresta
+            pesos: Sequência com o peso de cada aresta
+            rotulos: Lista opcional de rótulos
+
+        Returns:
+            GrafoCSR
+        """
+        m = len(origens)
+        tipo = _tipo_indice(max(num_vertices, m))
+
+        contagem = array('q', [0] * (num_vertices + 1))
+        for u in origens:
+            contagem[u + 1] += 1
+        for i in range(num_vertices):
+            contagem[i + 1] += contagem[i]
+        inicio = array('q', contagem)
+
+        tipo_peso = pesos.typecode if isinstance(pesos, array) else _tipo_peso(pesos)
+        novos_destinos = array(tipo, [0] * m)
+        novos_pesos = array(tipo_peso, [0] * m)
+        posicao = contagem
+        for u, v, peso in zip(origens, destinos, pesos):
+            e = posicao[u]
+            novos_destinos[e] = v
+            novos_pesos[e] = peso
+            posicao[u] = e + 1
+
+        return cls(inicio, novos_destinos, novos_pesos, rotulos)
+
+    @classmethod
+    def de_dict(cls, grafo, vertices=None):
+        """
+        Converte um grafo {u: {v: peso}} para CSR.
+
+        Args:
+            grafo: Dicionário {u: {v: peso}}
+            vertices: Coleção opcional de vértices. Se None, extrai do grafo
+
+        Returns:
+            GrafoCSR com os rótulos originais
+        """
+        if vertices is None:
+            vertices = set(grafo.keys())
+            for u in grafo:
+                vertices.update(grafo[u].keys())
+
+        rotulos = list(vertices)
+        indice = {v: i for i, v in enumerate(rotulos)}
+        n = len(rotulos)
+
+        inicio = array('q', [0])
+        destinos = array(_tipo_indice(n))
+        lista_pesos = []
+        for u in rotulos:
+            for v, peso in grafo.get(u, {}).items():
+                destinos.append(indice[v])
+                lista_pesos.append(peso)
+            inicio.append(len(destinos))
+
+        grafo_csr = cls(inicio, destinos, array(_tipo_peso(lista_pesos), lista_pesos), rotulos)
+        grafo_csr._indice = indice
+        return grafo_csr
+
+    def para_dict(self):
+        """
+        Converte o grafo de volta para o formato {u: {v: peso}}.
+
+        Returns:
+            Dicionário {rótulo_u: {rótulo_v: peso}}
+        """
+        rotulos = self.rotulos
+        grafo = {}
+        for i in range(self.num_vertices):
+            grafo[rotulos[i]] = {rotulos[j]: peso for j, peso in self.vizinhos(i)}
+        return grafo
+
+    def para_numpy(self):
+        """
+        Visões NumPy (sem cópia, quando possível) dos arrays CSR.
+
+        Returns:
+            Tupla (inicio, destinos, pesos) de numpy.ndarray
+
+        Raises:
+            ImportError: Se o NumPy não estiver instalado
+        """
+        if np is None:
+            raise ImportError("GrafoCSR.para_numpy requer o pacote numpy")
+        return (np.asarray(self.inicio), np.asarray(self.destinos),
+                np.asarray(self.pesos))
+
+    def __repr__(self):
+        return f"GrafoCSR(vertices={self.num_vertices}, arestas={self.num_arestas})"
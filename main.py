@@ -41,6 +41,11 @@ def main():
     # Chu-Liu/Edmonds
     print(">>> Algoritmo de Chu-Liu/Edmonds")
     runpy.run_module('algoritmo_chu_liu_edmonds', run_name='__main__')
+    print("\n" + "─" * 70 + "\n")
+    
+    # AGM dinâmica
+    print(">>> AGM Dinâmica")
+    runpy.run_module('algoritmo_agm_dinamica', run_name='__main__')
 
     print("=" * 70)
     print("\n\n")
@@ -62,10 +67,28 @@ def main():
     
     print("=" * 70)
     
+    # A*
+    print(">>> Algoritmo A*")
+    runpy.run_module('algoritmo_a_estrela', run_name='__main__')
+    
+    print("=" * 70)
+    
     # Floyd-Warshall
     print(">>> Algoritmo de Floyd-Warshall")
     runpy.run_module('algoritmo_floyd_warshall', run_name='__main__')
     
+    print("=" * 70)
+    
+    # Johnson
+    print(">>> Algoritmo de Johnson")
+    runpy.run_module('algoritmo_johnson', run_name='__main__')
+    
+    print("=" * 70)
+    
+    # Caminhos mínimos dinâmicos
+    print(">>> Caminhos Mínimos Dinâmicos")
+    runpy.run_module('algoritmo_caminhos_dinamicos', run_name='__main__')
+    
     print("=" * 70)
     print("\n\n")
 
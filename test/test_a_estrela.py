@@ -0,0 +1,77 @@
+"""
+Testes para o Algoritmo A*
+"""
+
+import math
+
+import pytest
+from algoritmo_a_estrela import (a_estrela, heuristica_euclidiana, heuristica_manhattan,
+                                 heuristica_nula)
+from algoritmo_dijkstra import algoritmo_dijkstra, reconstruir_caminho
+from geradores_grafos import gerar_geometrico_aleatorio, gerar_grade
+
+
+def _conferir_consultas(grafo, heuristica, origens, destinos):
+    """Compara custo e caminho do A* com o Dijkstra completo"""
+    for origem in origens:
+        esperado, _ = algoritmo_dijkstra(grafo, set(grafo), origem, modo='heap')
+        for destino in destinos:
+            distancias, predecessores = a_estrela(grafo, origem, destino, heuristica,
+                                                  depurar=True)
+            if esperado[destino] == math.inf:
+                assert destino not in distancias
+                continue
+            caminho = reconstruir_caminho(predecessores, origem, destino)
+            custo = sum(grafo[a][b] for a, b in zip(caminho, caminho[1:]))
+            assert distancias[destino] == pytest.approx(esperado[destino])
+            assert custo == pytest.approx(esperado[destino])
+
+
+class TestAEstrela:
+    """Testes do A* contra o Dijkstra com heurísticas admissíveis"""
+
+    def test_grade_manhattan(self):
+        """Testa a grade com Manhattan (pesos >= 1 = escala)"""
+        grafo, coordenadas = gerar_grade(10, 10, peso_min=1, peso_max=9, semente=3)
+
+        _conferir_consultas(grafo, heuristica_manhattan(coordenadas), (0, 45), range(0, 100, 7))
+        _conferir_consultas(grafo, heuristica_nula, (0,), range(0, 100, 11))
+
+    def test_geometrico_euclidiana(self):
+        """Testa o grafo geométrico (pesos = distâncias euclidianas)"""
+        grafo, coordenadas = gerar_geometrico_aleatorio(150, 0.15, semente=4)
+
+        _conferir_consultas(grafo, heuristica_euclidiana(coordenadas), (0, 1, 2), range(150))
+
+    def test_expande_menos_que_dijkstra(self):
+        """Testa que a heurística reduz os nós expandidos"""
+        grafo, coordenadas = gerar_grade(15, 15, peso_min=1, peso_max=1, semente=0)
+        sem_heuristica, com_heuristica = {}, {}
+
+        a_estrela(grafo, 0, 224, estatisticas=sem_heuristica)
+        a_estrela(grafo, 0, 224, heuristica_manhattan(coordenadas), estatisticas=com_heuristica)
+
+        assert com_heuristica['nos_expandidos'] < sem_heuristica['nos_expandidos']
+
+    def test_inalcancavel_e_mesmo_vertice(self):
+        """Testa destino inalcançável e s == t"""
+        grafo = {1: {2: 1}, 2: {}, 3: {1: 1}}
+
+        distancias, _ = a_estrela(grafo, 1, 3)
+        assert 3 not in distancias
+        distancias, predecessores = a_estrela(grafo, 2, 2)
+        assert distancias == {2: 0}
+        assert reconstruir_caminho(predecessores, 2, 2) == [2]
+
+    def test_depurar_heuristica_inconsistente(self):
+        """Testa que 'depurar' detecta uma heurística inconsistente"""
+        grafo = {1: {2: 1}, 2: {3: 1}, 3: {}}
+        estimativas = {1: 2, 2: 5, 3: 0}
+
+        with pytest.raises(ValueError, match="inconsistente"):
+            a_estrela(grafo, 1, 3, lambda no, _: estimativas[no], depurar=True)
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
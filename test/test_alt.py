@@ -0,0 +1,108 @@
+"""
+Testes para o ALT (A*, marcos e desigualdade triangular)
+"""
+
+import math
+import pickle
+
+import pytest
+from algoritmo_alt import IndiceALT, assinatura_grafo, preprocessar_alt
+from algoritmo_dijkstra import algoritmo_dijkstra
+from geradores_grafos import gerar_aleatorio, gerar_grade
+
+
+@pytest.fixture
+def grade():
+    grafo, _ = gerar_grade(10, 12, semente=5)
+    # Vértice isolado e vértice que só tem arestas de saída
+    grafo[120] = {}
+    grafo[121] = {0: 2}
+    return grafo
+
+
+class TestConsultas:
+    """Testes das consultas ALT contra o Dijkstra"""
+
+    @pytest.mark.parametrize("estrategia", ['farthest', 'avoid'])
+    def test_igual_ao_dijkstra(self, grade, estrategia):
+        """Testa custos, caminhos e limites inferiores"""
+        indice = preprocessar_alt(grade, 4, estrategia=estrategia, semente=1)
+        nos = set(grade)
+
+        assert len(indice.marcos) == 4
+        for origem in (0, 37, 121):
+            esperado, _ = algoritmo_dijkstra(grade, nos, origem, modo='heap')
+            for destino in range(0, 122, 5):
+                custo, caminho = indice.consultar(grade, origem, destino)
+
+                assert custo == esperado[destino]
+                if custo == math.inf:
+                    assert caminho is None
+                    continue
+                assert caminho[0] == origem and caminho[-1] == destino
+                assert sum(grade[a][b] for a, b in zip(caminho, caminho[1:])) == custo
+                assert indice.limite_inferior(origem, destino) <= custo
+
+    def test_inalcancavel_e_mesmo_vertice(self, grade):
+        """Testa destino inalcançável e s == t"""
+        indice = preprocessar_alt(grade, 3, semente=2)
+
+        assert indice.consultar(grade, 0, 120) == (math.inf, None)
+        assert indice.consultar(grade, 0, 121) == (math.inf, None)
+        assert indice.consultar(grade, 8, 8) == (0, [8])
+
+    def test_menos_expansoes_que_dijkstra(self):
+        """Testa que os marcos reduzem os nós expandidos do A*"""
+        grafo = gerar_aleatorio(300, 900, semente=3)
+        indice = preprocessar_alt(grafo, 8, semente=3)
+        sem_marcos = IndiceALT([], indice.rotulos, [], [])
+        com, sem = {}, {}
+
+        indice.consultar(grafo, 0, 299, estatisticas=com)
+        sem_marcos.consultar(grafo, 0, 299, estatisticas=sem)
+
+        assert com['nos_expandidos'] <= sem['nos_expandidos']
+
+
+class TestPersistencia:
+    """Testes de 'salvar' e 'carregar'"""
+
+    def test_ida_e_volta(self, grade, tmp_path):
+        """Testa que o índice carregado responde igual ao original"""
+        indice = preprocessar_alt(grade, 3, semente=4)
+        caminho = tmp_path / "indice.alt"
+
+        indice.salvar(caminho)
+        carregado = IndiceALT.carregar(caminho, grade)
+
+        assert carregado.marcos == indice.marcos
+        assert carregado.assinatura == assinatura_grafo(grade)
+        for destino in (5, 60, 119):
+            assert carregado.consultar(grade, 0, destino) == indice.consultar(grade, 0, destino)
+
+    def test_assinatura_diferente(self, grade, tmp_path):
+        """Testa que um índice de outra versão do grafo é rejeitado"""
+        caminho = tmp_path / "indice.alt"
+        preprocessar_alt(grade, 2, semente=4).salvar(caminho)
+
+        alterado = {u: dict(vizinhos) for u, vizinhos in grade.items()}
+        alterado[0][1] += 1
+        with pytest.raises(ValueError, match="outra versão"):
+            IndiceALT.carregar(caminho, alterado)
+        alterado[0][1] -= 1
+        del alterado[120]
+        with pytest.raises(ValueError, match="outra versão"):
+            IndiceALT.carregar(caminho, alterado)
+
+    def test_arquivo_invalido(self, tmp_path):
+        """Testa um arquivo que não contém um índice ALT"""
+        caminho = tmp_path / "outro.pkl"
+        caminho.write_bytes(pickle.dumps({'formato': 'outro'}))
+
+        with pytest.raises(ValueError, match="não contém"):
+            IndiceALT.carregar(caminho)
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
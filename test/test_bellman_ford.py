@@ -2,8 +2,11 @@
 Testes para o Algoritmo de Bellman-Ford
 """
 
+import random
+
 import pytest
 from algoritmo_bellman_ford import bellman_ford, reconstruir_caminho
+from grafo_csr import GrafoCSR
 
 
 class TestBellmanFordBasico:
@@ -402,6 +405,353 @@ class TestConvergenciaPrecoce:
         assert tem_ciclo == False
 
 
+
+class TestGrafoCSR:
+    """Testes do Bellman-Ford recebendo um GrafoCSR"""
+    
+    def test_mesmo_resultado_do_dict(self):
+        """Testa que o CSR produz as mesmas distâncias do dicionário"""
+        grafo = {
+            'A': {'B': 10, 'F': 8},
+            'B': {'D': 1},
+            'C': {'B': 1},
+            'D': {'C': -2},
+            'E': {'B': -4, 'D': -1},
+            'F': {'E': 1}
+        }
+        esperado, _, _ = bellman_ford(grafo, 'A')
+        distancias, predecessores, tem_ciclo = bellman_ford(GrafoCSR.de_dict(grafo), 'A')
+        
+        assert distancias == esperado
+        assert reconstruir_caminho(predecessores, 'A', 'C') == ['A', 'F', 'E', 'B', 'D', 'C']
+        assert tem_ciclo == False
+    
+    def test_ciclo_negativo_csr(self):
+        """Testa detecção de ciclo negativo no CSR"""
+        grafo = {1: {2: 1}, 2: {3: 1}, 3: {1: -5}}
+        distancias, predecessores, tem_ciclo = bellman_ford(GrafoCSR.de_dict(grafo), 1)
+        
+        assert tem_ciclo == True
+
+
+
+class TestSPFA:
+    """Testes do modo baseado em fila (SPFA) e das heurísticas SLF/LLL"""
+    
+    HEURISTICAS = [
+        {},
+        {'slf': True},
+        {'lll': True},
+        {'slf': True, 'lll': True},
+    ]
+    
+    @pytest.mark.parametrize("opcoes", HEURISTICAS)
+    def test_mesmas_distancias_do_classico(self, opcoes):
+        """Testa que o SPFA chega às mesmas distâncias do modo clássico"""
+        grafo = {
+            'A': {'B': 10, 'F': 8},
+            'B': {'D': 1},
+            'C': {'B': 1},
+            'D': {'C': -2},
+            'E': {'B': -4, 'D': -1},
+            'F': {'E': 1}
+        }
+        esperado, _, _ = bellman_ford(grafo, 'A')
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 'A', modo='spfa', **opcoes)
+        
+        assert distancias == esperado
+        assert reconstruir_caminho(predecessores, 'A', 'C') == ['A', 'F', 'E', 'B', 'D', 'C']
+        assert tem_ciclo == False
+    
+    @pytest.mark.parametrize("opcoes", HEURISTICAS)
+    def test_ciclo_negativo_alcancavel(self, opcoes):
+        """Testa a detecção de ciclo negativo pela contagem de relaxamentos"""
+        grafo = {
+            1: {2: 1},
+            2: {3: 1},
+            3: {4: 1},
+            4: {5: 1},
+            5: {3: -5}
+        }
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 1, modo='spfa', **opcoes)
+        
+        assert tem_ciclo == True
+    
+    def test_ciclo_negativo_desconectado(self):
+        """Testa que ciclo negativo inalcançável não é detectado"""
+        grafo = {
+            1: {2: 1},
+            2: {},
+            3: {4: 1},
+            4: {5: 1},
+            5: {3: -5}
+        }
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 1, vertices=[1, 2, 3, 4, 5],
+                                                            modo='spfa')
+        
+        assert tem_ciclo == False
+        assert distancias[3] == float('inf')
+    
+    def test_autoloop_negativo(self):
+        """Testa auto-loop negativo no SPFA"""
+        grafo = {1: {1: -5, 2: 1}, 2: {}}
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 1, modo='spfa')
+        
+        assert tem_ciclo == True
+    
+    def test_modo_invalido(self):
+        """Testa que um modo desconhecido gera erro"""
+        with pytest.raises(ValueError):
+            bellman_ford({1: {}}, 1, modo='inexistente')
+
+
+
+class TestModoNumpy:
+    """Testes do modo vetorizado com NumPy"""
+    
+    @pytest.fixture(autouse=True)
+    def _requer_numpy(self):
+        pytest.importorskip("numpy")
+    
+    def test_mesmo_resultado_do_classico(self):
+        """Testa que o modo vetorizado produz as mesmas distâncias"""
+        grafo = {
+            1: {2: 2, 4: 1},
+            2: {3: 2, 4: 2},
+            3: {5: 2},
+            4: {3: 4, 5: 4},
+            5: {6: 1, 7: 2},
+            6: {3: 3, 7: 4},
+            7: {}
+        }
+        esperado, _, _ = bellman_ford(grafo, 1)
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 1, modo='numpy')
+        
+        assert distancias == esperado
+        assert all(isinstance(d, int) for d in distancias.values())
+        assert reconstruir_caminho(predecessores, 1, 7) == [1, 4, 5, 7]
+        assert tem_ciclo == False
+    
+    def test_pesos_negativos_e_inacessiveis(self):
+        """Testa pesos negativos e vértices inacessíveis no modo vetorizado"""
+        grafo = {
+            1: {2: 5, 3: 1},
+            2: {4: 1},
+            3: {2: -10},
+            4: {},
+            5: {1: 1}
+        }
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 1, modo='numpy')
+        
+        assert distancias[4] == -8
+        assert distancias[5] == float('inf')
+        assert predecessores[5] is None
+        assert reconstruir_caminho(predecessores, 1, 4) == [1, 3, 2, 4]
+    
+    def test_ciclo_negativo(self):
+        """Testa detecção de ciclo negativo no modo vetorizado"""
+        grafo = {
+            'A': {'B': 1},
+            'B': {'C': -3},
+            'C': {'A': 1},
+        }
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 'A', modo='numpy')
+        
+        assert tem_ciclo == True
+    
+    def test_grafo_csr(self):
+        """Testa o modo vetorizado recebendo um GrafoCSR"""
+        grafo = {1: {2: 1.5}, 2: {3: -0.5}, 3: {}}
+        distancias, predecessores, tem_ciclo = bellman_ford(GrafoCSR.de_dict(grafo), 1,
+                                                            modo='numpy')
+        
+        assert distancias == {1: 0, 2: 1.5, 3: 1.0}
+
+
+class TestExtracaoCiclo:
+    """Testes da extração do ciclo negativo e da marcação de -inf"""
+    
+    GRAFO = {
+        'S': {'A': 1, 'X': 2},
+        'A': {'B': 1},
+        'B': {'C': -3},
+        'C': {'A': 1, 'D': 2},
+        'D': {},
+        'X': {},
+    }
+    
+    @staticmethod
+    def _peso_ciclo(grafo, ciclo):
+        return sum(grafo[u][v] for u, v in zip(ciclo, ciclo[1:]))
+    
+    @pytest.mark.parametrize("modo", ["classico", "spfa", "numpy", "yen"])
+    def test_ciclo_retornado(self, modo):
+        """Testa que o ciclo retornado é fechado e tem peso negativo"""
+        if modo == "numpy":
+            pytest.importorskip("numpy")
+        _, _, ciclo = bellman_ford(self.GRAFO, 'S', modo=modo, retornar_ciclo=True)
+        
+        assert ciclo[0] == ciclo[-1]
+        assert set(ciclo) == {'A', 'B', 'C'}
+        assert self._peso_ciclo(self.GRAFO, ciclo) < 0
+    
+    @pytest.mark.parametrize("modo", ["classico", "spfa", "numpy", "yen"])
+    def test_marcar_menos_infinito(self, modo):
+        """Testa que somente vértices alcançáveis pelo ciclo recebem -inf"""
+        if modo == "numpy":
+            pytest.importorskip("numpy")
+        distancias, predecessores, tem_ciclo = bellman_ford(
+            self.GRAFO, 'S', modo=modo, marcar_menos_infinito=True
+        )
+        
+        assert tem_ciclo == True
+        for v in ('A', 'B', 'C', 'D'):
+            assert distancias[v] == float('-inf')
+        assert distancias['S'] == 0
+        assert distancias['X'] == 2
+        assert reconstruir_caminho(predecessores, 'S', 'X') == ['S', 'X']
+    
+    @pytest.mark.parametrize("opcoes", [
+        {'modo': 'spfa'},
+        {'modo': 'spfa', 'slf': True, 'lll': True},
+        {'modo': 'yen'},
+        {'modo': 'yen', 'permutar': True, 'semente': 1},
+    ])
+    def test_ciclo_pelos_predecessores(self, opcoes):
+        """Testa SPFA e Yen em grafos aleatórios: o ciclo sai da cadeia de
+        predecessores e o -inf cobre tudo que ele alcança"""
+        for semente in range(150):
+            aleatorio = random.Random(semente)
+            n = aleatorio.randint(2, 15)
+            grafo = {u: {} for u in range(n)}
+            for _ in range(aleatorio.randint(1, 3 * n)):
+                u, v = aleatorio.randrange(n), aleatorio.randrange(n)
+                grafo[u][v] = aleatorio.randint(-4, 15)
+            
+            _, _, esperado = bellman_ford(grafo, 0)
+            distancias, _, ciclo = bellman_ford(grafo, 0, retornar_ciclo=True,
+                                                marcar_menos_infinito=True, **opcoes)
+            
+            assert (ciclo is not None) == esperado
+            if ciclo is None:
+                continue
+            assert ciclo[0] == ciclo[-1]
+            assert self._peso_ciclo(grafo, ciclo) < 0
+            alcancados = set(ciclo)
+            fila = list(ciclo)
+            while fila:
+                for v in grafo[fila.pop()]:
+                    if v not in alcancados:
+                        alcancados.add(v)
+                        fila.append(v)
+            assert all(distancias[v] == float('-inf') for v in alcancados)
+    
+    def test_sem_ciclo_retorna_none(self):
+        """Testa que retornar_ciclo devolve None sem ciclo negativo"""
+        grafo = {1: {2: -1}, 2: {3: 2}, 3: {}}
+        distancias, _, ciclo = bellman_ford(grafo, 1, retornar_ciclo=True,
+                                            marcar_menos_infinito=True)
+        
+        assert ciclo is None
+        assert distancias == {1: 0, 2: -1, 3: 1}
+    
+    def test_autoloop_negativo(self):
+        """Testa extração de um autoloop negativo"""
+        grafo = {1: {2: 1}, 2: {2: -1, 3: 1}, 3: {}}
+        distancias, _, ciclo = bellman_ford(grafo, 1, retornar_ciclo=True,
+                                            marcar_menos_infinito=True)
+        
+        assert ciclo == [2, 2]
+        assert distancias == {1: 0, 2: float('-inf'), 3: float('-inf')}
+    
+    def test_grafo_csr(self):
+        """Testa a extração do ciclo com GrafoCSR"""
+        _, _, ciclo = bellman_ford(GrafoCSR.de_dict(self.GRAFO), 'S', retornar_ciclo=True)
+        
+        assert self._peso_ciclo(self.GRAFO, ciclo) < 0
+    
+    def test_reconstruir_caminho_com_ciclo(self):
+        """Testa que reconstruir_caminho não entra em laço no ciclo"""
+        _, predecessores, _ = bellman_ford(self.GRAFO, 'S')
+        
+        assert reconstruir_caminho(predecessores, 'S', 'D') is None
+
+
+class TestModoYen:
+    """Testes da ordenação de Yen / Bannister-Eppstein"""
+    
+    @staticmethod
+    def _cadeia_invertida(n):
+        """Cadeia 0 -> 1 -> ... -> n-1 com as arestas em ordem inversa"""
+        return {u: ({u + 1: -1} if u + 1 < n else {}) for u in reversed(range(n))}
+    
+    @pytest.mark.parametrize("permutar", [False, True])
+    def test_mesmas_distancias_do_classico(self, permutar):
+        """Testa que o modo de Yen produz as mesmas distâncias"""
+        grafo = {
+            1: {2: 2, 4: 1},
+            2: {3: 2, 4: 2},
+            3: {5: 2},
+            4: {3: 4, 5: -4},
+            5: {6: 1, 7: 2},
+            6: {3: 3, 7: 4},
+            7: {}
+        }
+        esperado, _, _ = bellman_ford(grafo, 1)
+        distancias, predecessores, tem_ciclo = bellman_ford(grafo, 1, modo='yen',
+                                                            permutar=permutar, semente=7)
+        
+        assert distancias == esperado
+        assert reconstruir_caminho(predecessores, 1, 7) == [1, 4, 5, 7]
+        assert tem_ciclo == False
+    
+    def test_menos_passadas_que_o_classico(self):
+        """Testa a redução de passadas quando a ordem das arestas é ruim"""
+        grafo = self._cadeia_invertida(20)
+        vertices = list(reversed(range(20)))
+        
+        classico, yen = {}, {}
+        esperado, _, _ = bellman_ford(grafo, 0, vertices, estatisticas=classico)
+        distancias, _, _ = bellman_ford(grafo, 0, vertices, modo='yen', estatisticas=yen)
+        
+        assert distancias == esperado
+        assert classico['passadas'] == 19
+        assert yen['passadas'] <= 2
+    
+    def test_permutacao_reprodutivel(self):
+        """Testa que a mesma semente produz o mesmo número de passadas"""
+        grafo = self._cadeia_invertida(30)
+        passadas = []
+        for _ in range(2):
+            estatisticas = {}
+            bellman_ford(grafo, 0, modo='yen', permutar=True, semente=42,
+                         estatisticas=estatisticas)
+            passadas.append(estatisticas['passadas'])
+        
+        assert passadas[0] == passadas[1]
+    
+    def test_ciclo_negativo(self):
+        """Testa detecção e extração de ciclo negativo no modo de Yen"""
+        grafo = {'A': {'B': 1}, 'B': {'C': -3}, 'C': {'A': 1, 'D': 1}, 'D': {}}
+        _, _, tem_ciclo = bellman_ford(grafo, 'A', modo='yen')
+        distancias, _, ciclo = bellman_ford(grafo, 'A', modo='yen', retornar_ciclo=True,
+                                            marcar_menos_infinito=True)
+        
+        assert tem_ciclo == True
+        assert set(ciclo) == {'A', 'B', 'C'}
+        assert distancias['D'] == float('-inf')
+    
+    def test_grafo_csr(self):
+        """Testa o modo de Yen recebendo um GrafoCSR"""
+        grafo = {1: {2: 4, 3: 1}, 2: {4: 1}, 3: {2: -2}, 4: {}}
+        estatisticas = {}
+        distancias, _, _ = bellman_ford(GrafoCSR.de_dict(grafo), 1, modo='yen',
+                                        estatisticas=estatisticas)
+        
+        assert distancias == {1: 0, 2: -1, 3: 1, 4: 0}
+        assert estatisticas['passadas'] >= 1
+
+
 if __name__ == "__main__":
     # Executa os testes com pytest
     pytest.main([__file__, "-v"])
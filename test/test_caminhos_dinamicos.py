@@ -0,0 +1,161 @@
+"""
+Testes para os caminhos mínimos dinâmicos de origem única
+"""
+
+import math
+import random
+
+import pytest
+from algoritmo_bellman_ford import bellman_ford
+from algoritmo_caminhos_dinamicos import CaminhosMinimosDinamicos
+from grafo_csr import GrafoCSR
+
+
+def _conferir(dinamico, grafo, origem):
+    """Compara com o Bellman-Ford recalculado e confere os caminhos"""
+    esperado, _, _ = bellman_ford(grafo, origem, list(grafo), modo='spfa')
+    assert dinamico.distancias == esperado
+    for v, d in esperado.items():
+        caminho = dinamico.caminho(v)
+        if d == math.inf:
+            assert caminho is None
+            continue
+        assert caminho[0] == origem and caminho[-1] == v
+        assert sum(grafo[a][b] for a, b in zip(caminho, caminho[1:])) == d
+
+
+class TestAtualizacoes:
+    """Testes de aumentos, diminuições e remoções de arestas"""
+
+    @pytest.fixture
+    def grafo(self):
+        # Árvore de caminhos mínimos: 1 -> 2 -> {3, 4}, 4 -> 5; 1 -> 6
+        return {
+            1: {2: 1, 3: 10, 6: 2},
+            2: {3: 1, 4: 2},
+            3: {},
+            4: {5: 1},
+            5: {},
+            6: {5: 6},
+        }
+
+    def test_subarvore_apos_aumento(self, grafo):
+        """Testa que um aumento só recalcula a subárvore do vértice"""
+        dinamico = CaminhosMinimosDinamicos(grafo, 1)
+
+        alterados = dinamico.atualizar_aresta(1, 2, 6)
+        grafo[1][2] = 6
+
+        # 3 continua via 2 (7 < 10); 5 passa a vir de 6 (8 < 6 + 2 + 1)
+        assert alterados == {2, 3, 4, 5}
+        assert dinamico.distancias[6] == 2
+        assert dinamico.caminho(5) == [1, 6, 5]
+        _conferir(dinamico, grafo, 1)
+
+    def test_aumento_fora_da_arvore(self, grafo):
+        """Testa que aumentar uma aresta fora da árvore não muda nada"""
+        dinamico = CaminhosMinimosDinamicos(grafo, 1)
+
+        assert dinamico.atualizar_aresta(1, 3, 50) == set()
+        assert dinamico.peso(1, 3) == 50
+
+    def test_diminuicao_e_nova_aresta(self, grafo):
+        """Testa a propagação de melhorias, com peso negativo"""
+        dinamico = CaminhosMinimosDinamicos(grafo, 1)
+
+        alterados = dinamico.atualizar_aresta(6, 4, -1)
+        grafo[6][4] = -1
+
+        assert alterados == {4, 5}
+        assert dinamico.caminho(5) == [1, 6, 4, 5]
+        _conferir(dinamico, grafo, 1)
+
+    def test_remover_aresta(self, grafo):
+        """Testa remoções que religam ou desconectam vértices"""
+        dinamico = CaminhosMinimosDinamicos(grafo, 1)
+
+        assert dinamico.remover_aresta(2, 3) == {3}
+        assert dinamico.caminho(3) == [1, 3]
+        dinamico.remover_aresta(1, 3)
+        assert dinamico.distancias[3] == math.inf
+        assert dinamico.caminho(3) is None
+        with pytest.raises(KeyError):
+            dinamico.remover_aresta(1, 3)
+
+    def test_ciclo_negativo_desfeito(self, grafo):
+        """Testa que uma aresta que fecha um ciclo negativo é desfeita"""
+        dinamico = CaminhosMinimosDinamicos(grafo, 1)
+        distancias = dict(dinamico.distancias)
+        predecessores = dict(dinamico.predecessores)
+
+        with pytest.raises(ValueError):
+            dinamico.atualizar_aresta(5, 2, -5)
+        with pytest.raises(ValueError):
+            dinamico.atualizar_aresta(4, 2, -3)
+
+        assert dinamico.peso(5, 2) is None
+        assert dinamico.distancias == distancias
+        assert dinamico.predecessores == predecessores
+        # A estrutura continua utilizável depois de desfazer
+        assert dinamico.atualizar_aresta(5, 2, -2) == set()
+
+    def test_ciclo_negativo_na_construcao(self):
+        """Testa que o construtor rejeita um ciclo negativo acessível"""
+        with pytest.raises(ValueError):
+            CaminhosMinimosDinamicos({1: {2: 1}, 2: {3: -2}, 3: {2: 1}}, 1)
+
+    def test_grafo_csr(self, grafo):
+        """Testa a construção a partir de um GrafoCSR"""
+        dinamico = CaminhosMinimosDinamicos(GrafoCSR.de_dict(grafo), 1)
+
+        _conferir(dinamico, grafo, 1)
+
+
+class TestSequenciasAleatorias:
+    """Testes de sequências de mudanças contra o Bellman-Ford recalculado"""
+
+    @pytest.mark.parametrize("negativos", [False, True])
+    @pytest.mark.parametrize("semente", range(4))
+    def test_contra_bellman_ford(self, semente, negativos):
+        """Testa cada passo de uma sequência aleatória de mudanças"""
+        aleatorio = random.Random(semente)
+        n = 20
+        grafo = {v: {} for v in range(n)}
+        for _ in range(50):
+            u, v = aleatorio.sample(range(n), 2)
+            grafo[u][v] = aleatorio.randint(1, 20)
+        dinamico = CaminhosMinimosDinamicos(grafo, 0)
+
+        for _ in range(150):
+            u, v = aleatorio.sample(range(n), 2)
+            if grafo[u] and aleatorio.random() < 0.25:
+                v = aleatorio.choice(list(grafo[u]))
+                dinamico.remover_aresta(u, v)
+                del grafo[u][v]
+            else:
+                peso = aleatorio.randint(-6 if negativos else 0, 20)
+                anterior = grafo[u].get(v)
+                grafo[u][v] = peso
+                _, _, tem_ciclo = bellman_ford(grafo, 0, list(grafo), modo='spfa')
+                if tem_ciclo:
+                    distancias = dict(dinamico.distancias)
+                    with pytest.raises(ValueError):
+                        dinamico.atualizar_aresta(u, v, peso)
+                    assert dinamico.distancias == distancias
+                    if anterior is None:
+                        del grafo[u][v]
+                    else:
+                        grafo[u][v] = anterior
+                    assert dinamico.peso(u, v) == anterior
+                else:
+                    antes = dict(dinamico.distancias)
+                    alterados = dinamico.atualizar_aresta(u, v, peso)
+                    assert alterados == {x for x in antes
+                                         if antes[x] != dinamico.distancias[x]}
+
+            _conferir(dinamico, grafo, 0)
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
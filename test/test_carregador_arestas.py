@@ -0,0 +1,47 @@
+"""
+Testes para o carregador de listas de arestas
+"""
+
+import pytest
+from carregador_arestas import carregar_lista_arestas
+
+
+class TestRotulos:
+    """Testes da internação dos rótulos dos vértices"""
+
+    def test_grafias_diferentes_do_mesmo_vertice_dict(self, tmp_path):
+        """Testa que '1' e '01' são o mesmo vértice e não apagam arestas"""
+        caminho = tmp_path / "arestas.tsv"
+        caminho.write_text("1 2 1\n01 3 5\n")
+
+        grafo, estatisticas = carregar_lista_arestas(caminho)
+
+        assert grafo == {1: {2: 1, 3: 5}, 2: {}, 3: {}}
+        assert estatisticas.vertices == 3
+
+    def test_grafias_diferentes_do_mesmo_vertice_csr(self, tmp_path):
+        """Testa que o CSR não repete rótulos com grafias diferentes"""
+        caminho = tmp_path / "arestas.tsv"
+        caminho.write_text("1 2 1\n01 3 5\n+1 2 4\n")
+
+        grafo, _ = carregar_lista_arestas(caminho, formato='csr')
+
+        assert grafo.num_vertices == 3
+        assert sorted(grafo.rotulos) == [1, 2, 3]
+        assert set(grafo.para_dict()[1]) == {2, 3}
+        assert list(grafo.origens()) == [grafo.indice_de(1)] * 3
+
+    def test_rotulos_texto(self, tmp_path):
+        """Testa rótulos não numéricos em CSV"""
+        caminho = tmp_path / "arestas.csv"
+        caminho.write_text("# comentario\na,b,2\nb,c\n")
+
+        grafo, estatisticas = carregar_lista_arestas(caminho, direcionado=False)
+
+        assert grafo == {'a': {'b': 2}, 'b': {'a': 2, 'c': 1}, 'c': {'b': 1}}
+        assert estatisticas.arestas == 2
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
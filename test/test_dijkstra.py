@@ -0,0 +1,110 @@
+"""
+Testes para o Algoritmo de Dijkstra
+"""
+
+import math
+
+import pytest
+from algoritmo_dijkstra import (_dijkstra_heap, algoritmo_dijkstra, construir_grafo_reverso,
+                                dijkstra_bidirecional, reconstruir_caminho)
+from geradores_grafos import gerar_aleatorio, gerar_grade
+from grafo_csr import GrafoCSR
+
+
+def _grafos():
+    """Grade direcionada (pesos diferentes em cada sentido) e G(n, m) com
+    um vértice isolado e um que só tem arestas de saída"""
+    grade, _ = gerar_grade(8, 9, semente=1)
+    aleatorio = gerar_aleatorio(60, 150, semente=2)
+    for grafo in (grade, aleatorio):
+        n = len(grafo)
+        grafo[n] = {}
+        grafo[n + 1] = {0: 3, 1: 1}
+    return [grade, aleatorio]
+
+
+def _custo(grafo, caminho):
+    return sum(grafo[a][b] for a, b in zip(caminho, caminho[1:]))
+
+
+class TestMotorHeap:
+    """Testes do motor 'heap' contra o clássico"""
+
+    @pytest.mark.parametrize("csr", [False, True])
+    @pytest.mark.parametrize("indice_grafo", [0, 1])
+    def test_igual_ao_classico(self, indice_grafo, csr):
+        """Testa distâncias, caminhos e vértices inalcançáveis"""
+        grafo = _grafos()[indice_grafo]
+        nos = set(grafo)
+        entrada = GrafoCSR.de_dict(grafo) if csr else grafo
+
+        for origem in (0, 17, len(grafo) - 1):
+            esperado, _ = algoritmo_dijkstra(grafo, nos, origem)
+            distancias, predecessores = algoritmo_dijkstra(entrada, nos, origem, modo='heap')
+
+            assert distancias == esperado
+            for v, d in distancias.items():
+                caminho = reconstruir_caminho(predecessores, origem, v)
+                if d == math.inf:
+                    assert caminho is None
+                else:
+                    assert caminho[0] == origem and _custo(grafo, caminho) == d
+
+    def test_inalcancaveis(self):
+        """Testa que o vértice isolado e a fonte pura ficam em inf"""
+        grafo = _grafos()[1]
+        isolado, fonte = len(grafo) - 2, len(grafo) - 1
+
+        distancias, predecessores = _dijkstra_heap(grafo, set(grafo), 0)
+
+        assert distancias[isolado] == distancias[fonte] == math.inf
+        assert predecessores[isolado] is predecessores[fonte] is None
+        assert distancias[0] == 0 and reconstruir_caminho(predecessores, 0, 0) == [0]
+
+    def test_modo_invalido(self):
+        """Testa que um modo desconhecido é rejeitado"""
+        with pytest.raises(ValueError):
+            algoritmo_dijkstra({1: {}}, {1}, 1, modo='fibonacci')
+
+
+class TestBidirecional:
+    """Testes do Dijkstra bidirecional contra o Dijkstra completo"""
+
+    @pytest.mark.parametrize("indice_grafo", [0, 1])
+    def test_todos_os_pares_de_origens(self, indice_grafo):
+        """Testa custo e caminho de várias origens para todos os destinos"""
+        grafo = _grafos()[indice_grafo]
+        nos = set(grafo)
+        reverso = construir_grafo_reverso(grafo)
+
+        for origem in (0, 5, len(grafo) - 1):
+            esperado, _ = algoritmo_dijkstra(grafo, nos, origem)
+            for destino in nos:
+                custo, caminho = dijkstra_bidirecional(grafo, origem, destino, reverso)
+
+                assert custo == esperado[destino]
+                if custo == math.inf:
+                    assert caminho is None
+                else:
+                    assert caminho[0] == origem and caminho[-1] == destino
+                    assert _custo(grafo, caminho) == custo
+
+    def test_inalcancavel_e_mesmo_vertice(self):
+        """Testa destino inalcançável e s == t"""
+        grafo = _grafos()[0]
+        isolado = len(grafo) - 2
+
+        assert dijkstra_bidirecional(grafo, 0, isolado) == (math.inf, None)
+        assert dijkstra_bidirecional(grafo, 0, len(grafo) - 1) == (math.inf, None)
+        assert dijkstra_bidirecional(grafo, 7, 7) == (0, [7])
+
+    def test_grafo_reverso(self):
+        """Testa que o reverso inverte o sentido e conserva os pesos"""
+        grafo = {1: {2: 4, 3: 1}, 2: {3: 2}}
+
+        assert construir_grafo_reverso(grafo) == {1: {}, 2: {1: 4}, 3: {1: 1, 2: 2}}
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,228 @@
+"""
+Testes para o Algoritmo de Floyd-Warshall
+"""
+
+import math
+import random
+
+import pytest
+from algoritmo_floyd_warshall import (atualizar_aresta, atualizar_aresta_matricial,
+                                      atualizar_arestas, fecho_transitivo, floyd_warshall,
+                                      floyd_warshall_blocado, floyd_warshall_matricial,
+                                      matrizes_para_dicionarios, recuperar_caminho,
+                                      FechoTransitivo, PredecessoresCompactos)
+from geradores_grafos import gerar_aleatorio
+from grafo_csr import GrafoCSR
+
+
+def _grafo_direcionado(n, m, semente, negativos=False):
+    """
+    Grafo direcionado aleatório. Com 'negativos', só há arestas i -> j com
+    i < j (sem ciclos), e os pesos podem ser negativos.
+    """
+    aleatorio = random.Random(semente)
+    grafo = {v: {} for v in range(n)}
+    for _ in range(m):
+        u, v = aleatorio.randrange(n), aleatorio.randrange(n)
+        if u == v:
+            continue
+        if negativos:
+            u, v = min(u, v), max(u, v)
+            grafo[u][v] = aleatorio.randint(-10, 20)
+        else:
+            grafo[u][v] = aleatorio.randint(0, 30)
+    return grafo
+
+
+def _conferir_predecessores(dist, pred, grafo):
+    """Cada caminho reconstruído pelos predecessores custa dist[i][j]"""
+    for i in dist:
+        for j, d in dist[i].items():
+            if d == math.inf or i == j:
+                continue
+            caminho = recuperar_caminho(pred, i, j)
+            assert caminho[0] == i and caminho[-1] == j
+            assert sum(grafo[a][b] for a, b in zip(caminho, caminho[1:])) == d
+
+
+class TestPredecessoresCompactos:
+    """Testes do armazenamento compacto dos predecessores"""
+
+    @pytest.mark.parametrize("em_disco", [False, True])
+    def test_csr_igual_ao_dicionario(self, tmp_path, em_disco):
+        """Testa que o motor CSR grava os mesmos predecessores no modo compacto"""
+        if em_disco:
+            pytest.importorskip("numpy")
+        grafo = GrafoCSR.de_dict(gerar_aleatorio(25, 60, semente=4))
+        arquivo = tmp_path / "pred.bin" if em_disco else None
+
+        dist, pred = floyd_warshall(grafo)
+        dist_compacto, compacto = floyd_warshall(grafo, pred_compacto=True,
+                                                 arquivo_pred=arquivo)
+
+        assert isinstance(compacto, PredecessoresCompactos)
+        assert dist_compacto == dist
+        for i in pred:
+            for j in pred[i]:
+                assert compacto[i][j] == pred[i][j]
+
+    def test_iterar_caminho(self):
+        """Testa a reconstrução do caminho direto no armazenamento compacto"""
+        grafo = {1: {2: 1, 3: 5}, 2: {3: 1}, 3: {}}
+
+        _, compacto = floyd_warshall(GrafoCSR.de_dict(grafo), pred_compacto=True)
+
+        assert list(compacto.iterar_caminho(1, 3)) == [1, 2, 3]
+        assert list(compacto.iterar_caminho(3, 1)) == []
+
+class TestMotoresMatriciais:
+    """Testes dos motores 'numpy' e 'blocado' contra o clássico"""
+
+    @pytest.fixture(autouse=True)
+    def _numpy(self):
+        pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize("negativos", [False, True])
+    @pytest.mark.parametrize("modo", ['numpy', 'blocado'])
+    @pytest.mark.parametrize("semente", range(3))
+    def test_mesmas_distancias_do_classico(self, modo, negativos, semente):
+        """Testa distâncias iguais e predecessores válidos (empates podem diferir)"""
+        grafo = _grafo_direcionado(30, 120, semente, negativos)
+        nos = set(grafo)
+
+        dist, _ = floyd_warshall(grafo, nos)
+        dist_modo, pred_modo = floyd_warshall(grafo, nos, modo=modo)
+
+        assert dist_modo == dist
+        _conferir_predecessores(dist_modo, pred_modo, grafo)
+
+    @pytest.mark.parametrize("negativos", [False, True])
+    def test_blocado_com_processos(self, negativos):
+        """Testa o motor blocado em vários blocos e com memória compartilhada"""
+        np = pytest.importorskip("numpy")
+        grafo = _grafo_direcionado(45, 250, semente=7, negativos=negativos)
+
+        D, _, nos = floyd_warshall_matricial(grafo, set(grafo))
+        D_blocado, P_blocado, nos_blocado = floyd_warshall_blocado(
+            grafo, set(grafo), tamanho_bloco=8, processos=2)
+
+        assert nos_blocado == nos
+        assert np.array_equal(D_blocado, D)
+        dist, pred = matrizes_para_dicionarios(D_blocado, P_blocado, nos, inteiros=True)
+        _conferir_predecessores(dist, pred, grafo)
+
+    def test_blocado_csr(self):
+        """Testa o motor blocado recebendo um GrafoCSR"""
+        grafo = _grafo_direcionado(20, 80, semente=3)
+
+        dist, _ = floyd_warshall(grafo, set(grafo))
+        dist_csr, _ = floyd_warshall(GrafoCSR.de_dict(grafo), modo='blocado')
+
+        assert dist_csr == dist
+
+class TestAtualizacaoIncremental:
+    """Testes de 'atualizar_aresta' contra o Floyd-Warshall recalculado"""
+
+    @pytest.mark.parametrize("negativos", [False, True])
+    @pytest.mark.parametrize("semente", range(3))
+    def test_insercoes_e_reducoes(self, semente, negativos):
+        """Testa uma sequência de inserções e reduções de peso"""
+        aleatorio = random.Random(semente)
+        grafo = _grafo_direcionado(25, 60, semente, negativos)
+        nos = set(grafo)
+        dist, pred = floyd_warshall(grafo, nos)
+
+        for _ in range(30):
+            u, v = aleatorio.randrange(25), aleatorio.randrange(25)
+            if u == v:
+                continue
+            if negativos:
+                u, v = min(u, v), max(u, v)
+            anterior = grafo[u].get(v)
+            peso = aleatorio.randint(-10 if negativos else 0, 30)
+            if anterior is not None:
+                peso = min(peso, anterior)
+
+            alterados = atualizar_aresta(dist, pred, u, v, peso, grafo)
+
+            esperado, _ = floyd_warshall(grafo, nos)
+            assert dist == esperado
+            assert alterados >= 0
+        _conferir_predecessores(dist, pred, grafo)
+
+    def test_lote(self):
+        """Testa 'atualizar_arestas' e a contagem de pares alterados"""
+        grafo = {1: {2: 4}, 2: {3: 4}, 3: {}}
+        dist, pred = floyd_warshall(grafo, {1, 2, 3})
+
+        alterados = atualizar_arestas(dist, pred, [(1, 3, 5), (1, 2, 1)], grafo)
+
+        # 1 -> 3 (inf -> 5), depois 1 -> 2 (4 -> 1)
+        assert alterados == 2
+        assert dist[1] == {1: 0, 2: 1, 3: 5}
+        assert recuperar_caminho(pred, 1, 3) == [1, 3]
+
+    def test_aumento_e_ciclo_negativo(self):
+        """Testa que aumentos e ciclos negativos são rejeitados"""
+        grafo = {1: {2: 3}, 2: {1: 2}}
+        dist, pred = floyd_warshall(grafo, {1, 2})
+
+        with pytest.raises(ValueError):
+            atualizar_aresta(dist, pred, 1, 2, 5, grafo)
+        with pytest.raises(ValueError):
+            atualizar_aresta(dist, pred, 1, 2, -3, grafo)
+        assert grafo[1][2] == 3
+
+    def test_matricial(self):
+        """Testa a versão matricial contra o motor NumPy recalculado"""
+        np = pytest.importorskip("numpy")
+        aleatorio = random.Random(5)
+        grafo = _grafo_direcionado(20, 50, semente=5)
+        nos = set(grafo)
+        D, P, ordem = floyd_warshall_matricial(grafo, nos)
+
+        for _ in range(20):
+            u, v = aleatorio.sample(range(20), 2)
+            peso = min(aleatorio.randint(0, 30), grafo[u].get(v, math.inf))
+            grafo[u][v] = peso
+            atualizar_aresta_matricial(D, P, ordem.index(u), ordem.index(v), peso)
+
+            assert np.array_equal(D, floyd_warshall_matricial(grafo, nos)[0])
+        dist, pred = matrizes_para_dicionarios(D, P, ordem, inteiros=True)
+        _conferir_predecessores(dist, pred, grafo)
+
+class TestFechoTransitivo:
+    """Testes do fecho transitivo em bits contra as distâncias finitas"""
+
+    @pytest.mark.parametrize("csr", [False, True])
+    @pytest.mark.parametrize("motor", ['int', 'numpy'])
+    @pytest.mark.parametrize("n, m", [(12, 15), (70, 110)])
+    def test_igual_as_distancias_finitas(self, motor, csr, n, m):
+        """Testa 'alcanca' e 'alcancaveis' (n = 70 cruza a palavra de 64 bits)"""
+        if motor == 'numpy':
+            pytest.importorskip("numpy")
+        grafo = _grafo_direcionado(n, m, semente=n)
+        nos = set(grafo)
+        dist, _ = floyd_warshall(grafo, nos)
+
+        if csr:
+            fecho = fecho_transitivo(GrafoCSR.de_dict(grafo), motor=motor)
+        else:
+            fecho = fecho_transitivo(grafo, nos, motor=motor)
+
+        assert isinstance(fecho, FechoTransitivo)
+        for i in nos:
+            esperado = {j for j, d in dist[i].items() if d < math.inf}
+            assert set(fecho.alcancaveis(i)) == esperado
+            for j in nos:
+                assert fecho.alcanca(i, j) == (j in esperado)
+
+    def test_motor_invalido(self):
+        """Testa que um motor desconhecido é rejeitado"""
+        with pytest.raises(ValueError):
+            fecho_transitivo({1: {}}, {1}, motor='bitarray')
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""
+Testes para o formato binário de grafos CSR
+"""
+
+import struct
+
+import pytest
+from algoritmo_dijkstra import algoritmo_dijkstra
+from geradores_grafos import gerar_aleatorio
+from grafo_binario import CABECALHO, abrir_grafo_binario, salvar_grafo_binario
+from grafo_csr import GrafoCSR
+
+
+class TestIdaEVolta:
+    """Testes de gravação seguida de abertura"""
+
+    def test_rotulos_e_pesos_inteiros(self, tmp_path):
+        """Testa que o grafo aberto é igual ao gravado"""
+        grafo = gerar_aleatorio(30, 80, semente=1)
+        caminho = tmp_path / "grafo.csr"
+
+        salvar_grafo_binario(GrafoCSR.de_dict(grafo), caminho)
+        with abrir_grafo_binario(caminho) as mapeado:
+            assert mapeado.para_dict() == grafo
+            assert mapeado.pesos.format == 'q'
+            assert algoritmo_dijkstra(mapeado, None, 0, modo='heap') == \
+                algoritmo_dijkstra(grafo, set(grafo), 0)
+
+    def test_rotulos_texto_e_pesos_reais(self, tmp_path):
+        """Testa rótulos str e pesos float"""
+        grafo = {'a': {'b': 1.5}, 'b': {'c': 0.25}, 'c': {}}
+        caminho = tmp_path / "grafo.csr"
+
+        salvar_grafo_binario(GrafoCSR.de_dict(grafo), caminho)
+        with abrir_grafo_binario(caminho) as mapeado:
+            assert mapeado.para_dict() == grafo
+            assert mapeado.indice_de('c') == list(mapeado.rotulos).index('c')
+
+    def test_sem_rotulos(self, tmp_path):
+        """Testa um grafo sem tabela de rótulos (rótulo = índice denso)"""
+        grafo = GrafoCSR([0, 1, 2, 2], [1, 2], [7, 3])
+        caminho = tmp_path / "grafo.csr"
+
+        salvar_grafo_binario(grafo, caminho)
+        with abrir_grafo_binario(caminho) as mapeado:
+            assert list(mapeado.rotulos) == [0, 1, 2]
+            assert mapeado.para_dict() == {0: {1: 7}, 1: {2: 3}, 2: {}}
+
+
+class TestArquivosInvalidos:
+    """Testes da validação do cabeçalho antes do mapeamento"""
+
+    @pytest.fixture
+    def caminho(self, tmp_path):
+        caminho = tmp_path / "grafo.csr"
+        salvar_grafo_binario(GrafoCSR.de_dict(gerar_aleatorio(20, 40, semente=2)), caminho)
+        return caminho
+
+    def test_arquivo_truncado(self, caminho):
+        """Testa que um arquivo cortado no meio é rejeitado"""
+        dados = caminho.read_bytes()
+        for tamanho in (len(dados) - 1, len(dados) // 2, CABECALHO.size):
+            caminho.write_bytes(dados[:tamanho])
+            with pytest.raises(ValueError, match="truncado"):
+                abrir_grafo_binario(caminho)
+
+    def test_cabecalho_menor_que_o_minimo(self, caminho):
+        """Testa um arquivo menor que o próprio cabeçalho"""
+        caminho.write_bytes(b'GRAFOCSR')
+
+        with pytest.raises(ValueError, match="pequeno demais"):
+            abrir_grafo_binario(caminho)
+
+    def test_tamanhos_do_cabecalho(self, caminho):
+        """Testa n e m maiores que o arquivo e tipos de seção inválidos"""
+        dados = bytearray(caminho.read_bytes())
+        campos = list(CABECALHO.unpack_from(dados, 0))
+        casos = [(3, 10 ** 9, "truncado"), (4, -1, "negativos"), (5, b'x', "tipos")]
+
+        for posicao, valor, mensagem in casos:
+            alterados = campos.copy()
+            alterados[posicao] = valor
+            caminho.write_bytes(CABECALHO.pack(*alterados) + dados[CABECALHO.size:])
+            with pytest.raises(ValueError, match=mensagem):
+                abrir_grafo_binario(caminho)
+
+    def test_magic_invalido(self, caminho):
+        """Testa um arquivo que não é um grafo binário"""
+        dados = caminho.read_bytes()
+        caminho.write_bytes(struct.pack('8s', b'NAOCSR!!') + dados[8:])
+
+        with pytest.raises(ValueError, match="magic"):
+            abrir_grafo_binario(caminho)
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""
+Testes para as Hierarquias de Contração
+"""
+
+import math
+
+import pytest
+from algoritmo_dijkstra import algoritmo_dijkstra
+from algoritmo_hierarquias_contracao import construir_hierarquia
+from geradores_grafos import gerar_aleatorio, gerar_geometrico_aleatorio, gerar_grade
+
+
+def _grafos():
+    grade, _ = gerar_grade(9, 9, semente=6)
+    geometrico, _ = gerar_geometrico_aleatorio(120, 0.16, semente=7)
+    aleatorio = gerar_aleatorio(80, 200, semente=8)
+    # Vértice isolado e vértice que só tem arestas de saída
+    for grafo in (grade, geometrico, aleatorio):
+        n = len(grafo)
+        grafo[n] = {}
+        grafo[n + 1] = {0: 1}
+    return [grade, geometrico, aleatorio]
+
+
+class TestConsultas:
+    """Testes das consultas contra o Dijkstra"""
+
+    @pytest.mark.parametrize("max_fixados", [50, 1])
+    @pytest.mark.parametrize("indice_grafo", [0, 1, 2])
+    def test_igual_ao_dijkstra(self, indice_grafo, max_fixados):
+        """Testa custos e caminhos (com atalhos desempacotados)"""
+        grafo = _grafos()[indice_grafo]
+        hierarquia = construir_hierarquia(grafo, max_fixados_testemunha=max_fixados)
+        nos = set(grafo)
+
+        atalhos = sum(m >= 0 for m in hierarquia.frente_meio) + \
+            sum(m >= 0 for m in hierarquia.tras_meio)
+        assert atalhos > 0
+        for origem in (0, 13, len(grafo) - 1):
+            esperado, _ = algoritmo_dijkstra(grafo, nos, origem, modo='heap')
+            for destino in nos:
+                custo, caminho = hierarquia.consultar(origem, destino)
+
+                if esperado[destino] == math.inf:
+                    assert (custo, caminho) == (math.inf, None)
+                    continue
+                assert custo == pytest.approx(esperado[destino])
+                assert caminho[0] == origem and caminho[-1] == destino
+                # Só arestas originais: todo atalho foi desempacotado
+                assert all(b in grafo[a] for a, b in zip(caminho, caminho[1:]))
+                assert sum(grafo[a][b] for a, b in zip(caminho, caminho[1:])) == \
+                    pytest.approx(custo)
+
+    def test_atalho_desempacotado(self):
+        """Testa que o atalho 1 -> 3 (pelo meio 2) volta a ser 1 -> 2 -> 3"""
+        # Linha 0 - 1 - 2 - 3 - 4: o vértice 2 é contraído antes de 1 e 3
+        grafo, _ = gerar_grade(1, 5, peso_min=1, peso_max=1)
+        hierarquia = construir_hierarquia(grafo)
+        meio = hierarquia.indice[2]
+
+        assert meio in hierarquia.frente_meio and meio in hierarquia.tras_meio
+        assert hierarquia.consultar(0, 4) == (4, [0, 1, 2, 3, 4])
+        assert hierarquia.consultar(4, 1) == (3, [4, 3, 2, 1])
+
+    def test_inalcancavel_e_mesmo_vertice(self):
+        """Testa destino inalcançável e s == t"""
+        grafo = {1: {2: 3}, 2: {3: 1}, 3: {}, 4: {1: 1}}
+        hierarquia = construir_hierarquia(grafo)
+
+        assert hierarquia.consultar(1, 4) == (math.inf, None)
+        assert hierarquia.consultar(3, 1) == (math.inf, None)
+        assert hierarquia.consultar(2, 2) == (0, [2])
+        assert hierarquia.consultar(4, 3) == (5, [4, 1, 2, 3])
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""
+Testes para o Algoritmo de Johnson
+"""
+
+import math
+import random
+
+import pytest
+from algoritmo_bellman_ford import reconstruir_caminho
+from algoritmo_floyd_warshall import floyd_warshall
+from algoritmo_johnson import calcular_potenciais, johnson, reponderar
+from grafo_csr import GrafoCSR
+
+
+def _grafo_com_negativos(n, m, semente):
+    """
+    Grafo direcionado aleatório com pesos negativos e sem ciclo negativo:
+    w(u, v) = w'(u, v) - p(u) + p(v), com w' >= 0 e potenciais p
+    aleatórios (todo ciclo custa o mesmo que em w').
+    """
+    aleatorio = random.Random(semente)
+    potencial = [aleatorio.randint(0, 15) for _ in range(n)]
+    grafo = {v: {} for v in range(n)}
+    for _ in range(m):
+        u, v = aleatorio.sample(range(n), 2)
+        grafo[u][v] = aleatorio.randint(0, 10) - potencial[u] + potencial[v]
+    return grafo
+
+
+class TestJohnson:
+    """Testes das linhas do Johnson contra o Floyd-Warshall"""
+
+    @pytest.mark.parametrize("csr", [False, True])
+    @pytest.mark.parametrize("semente", range(3))
+    def test_igual_ao_floyd_warshall(self, semente, csr):
+        """Testa distâncias e caminhos em grafos com pesos negativos"""
+        grafo = _grafo_com_negativos(25, 70, semente)
+        assert any(peso < 0 for vizinhos in grafo.values() for peso in vizinhos.values())
+        dist, _ = floyd_warshall(grafo, set(grafo))
+        entrada = GrafoCSR.de_dict(grafo) if csr else grafo
+
+        linhas = 0
+        for origem, distancias, predecessores in johnson(entrada):
+            linhas += 1
+            assert distancias == dist[origem]
+            for v, d in distancias.items():
+                caminho = reconstruir_caminho(predecessores, origem, v)
+                if d == math.inf:
+                    assert caminho is None
+                else:
+                    assert sum(grafo[a][b] for a, b in zip(caminho, caminho[1:])) == d
+        assert linhas == len(grafo)
+
+    def test_origens_sob_demanda(self):
+        """Testa que só as origens pedidas são calculadas, na ordem dada"""
+        grafo = {'a': {'b': -2, 'c': 4}, 'b': {'c': 1}, 'c': {}, 'd': {'a': 1}}
+
+        linhas = johnson(grafo, origens=['d', 'b'])
+
+        origem, distancias, _ = next(linhas)
+        assert origem == 'd'
+        assert distancias == {'a': 1, 'b': -1, 'c': 0, 'd': 0}
+        origem, distancias, _ = next(linhas)
+        assert origem == 'b' and distancias['a'] == math.inf
+        assert next(linhas, None) is None
+
+    @pytest.mark.parametrize("csr", [False, True])
+    def test_ciclo_negativo(self, csr):
+        """Testa que um ciclo negativo é rejeitado já na chamada"""
+        grafo = {'a': {'b': 1}, 'b': {'c': -3}, 'c': {'a': 1}, 'd': {}}
+        entrada = GrafoCSR.de_dict(grafo) if csr else grafo
+
+        with pytest.raises(ValueError, match="Ciclo de peso negativo"):
+            johnson(entrada)
+
+
+class TestReponderacao:
+    """Testes dos potenciais e da reponderação"""
+
+    @pytest.mark.parametrize("csr", [False, True])
+    @pytest.mark.parametrize("semente", range(3))
+    def test_pesos_nao_negativos(self, semente, csr):
+        """Testa w' >= 0 e w'(u, v) = w(u, v) + h(u) - h(v) em toda aresta"""
+        grafo = _grafo_com_negativos(30, 90, semente)
+        entrada = GrafoCSR.de_dict(grafo) if csr else grafo
+
+        potenciais = calcular_potenciais(entrada)
+        reponderado = reponderar(entrada, potenciais)
+
+        if csr:
+            reponderado = reponderado.para_dict()
+        assert set(potenciais) == set(grafo)
+        for u, vizinhos in grafo.items():
+            for v, peso in vizinhos.items():
+                assert reponderado[u][v] >= 0
+                assert reponderado[u][v] == peso + potenciais[u] - potenciais[v]
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])
@@ -2,8 +2,16 @@
 Testes para o Algoritmo de Kruskal
 """
 
+import random
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
-from algoritmo_kruskal import kruskal, kruskal_direcionado, UnionFind
+import algoritmo_kruskal
+from algoritmo_agm_dinamica import AGMDinamica, _FlorestaDecremental
+from algoritmo_kruskal import (kruskal, kruskal_direcionado, kruskal_externo,
+                               UnionFind, UnionFindDenso)
+from geradores_grafos import gerar_aleatorio
+from grafo_csr import GrafoCSR
 
 
 class TestUnionFind:
@@ -278,6 +286,379 @@ class TestCasosEspeciais:
         assert custo == 1  # 0 + 1
 
 
+
+class TestGrafoCSR:
+    """Testes do Kruskal recebendo um GrafoCSR"""
+    
+    def test_grafo_exemplo_aula_csr(self):
+        """Testa o grafo exemplo da aula convertido para CSR"""
+        grafo = {
+            'a': {'c': 7},
+            'b': {'c': 2, 'e': 8, 'f': 7},
+            'c': {'d': 6, 'f': 1},
+            'd': {'g': 6},
+            'e': {'f': 2, 'h': 1},
+            'f': {'h': 4, 'i': 1, 'g': 5},
+            'g': {'j': 2},
+            'h': {'i': 6},
+            'i': {'j': 5}
+        }
+        
+        arestas, custo = kruskal(GrafoCSR.de_dict(grafo))
+        
+        assert len(arestas) == 9
+        assert custo == 27
+    
+    def test_arestas_duplicadas_csr(self):
+        """Testa que o CSR também mantém a aresta de menor peso"""
+        grafo = {1: {2: 5}, 2: {1: 3}}
+        arestas, custo = kruskal_direcionado(GrafoCSR.de_dict(grafo))
+        
+        assert len(arestas) == 1
+        assert custo == 3
+
+
+class TestUnionFindDenso:
+    """Testes do Union-Find sobre índices densos"""
+    
+    def test_union_e_find(self):
+        """Testa uniões e consultas básicas"""
+        uf = UnionFindDenso(5)
+        
+        assert uf.union(0, 1) == True
+        assert uf.union(3, 4) == True
+        assert uf.union(1, 0) == False
+        assert uf.conectados(0, 1)
+        assert not uf.conectados(1, 3)
+        assert uf.num_conjuntos == 3
+    
+    def test_uniao_por_tamanho(self):
+        """Testa que o conjunto menor passa a apontar para a raiz do maior"""
+        uf = UnionFindDenso(4)
+        uf.union(0, 1)
+        uf.union(0, 2)
+        raiz = uf.find(0)
+        
+        uf.union(3, 0)
+        assert uf.find(3) == raiz
+        assert uf.tamanho[raiz] == 4
+    
+    def test_cadeia_profunda(self):
+        """Testa que find é iterativo: sem RecursionError em cadeias longas"""
+        n = 200000
+        uf = UnionFindDenso(n)
+        # Monta uma cadeia degenerada diretamente no vetor de pais
+        for i in range(1, n):
+            uf.pai[i] = i - 1
+        
+        assert uf.find(n - 1) == 0
+        assert uf.find(n - 1) == 0
+    
+    def test_adicionar(self):
+        """Testa a inclusão de novos elementos"""
+        uf = UnionFindDenso(2)
+        novo = uf.adicionar()
+        
+        assert novo == 2
+        assert uf.find(novo) == novo
+        assert uf.union(0, novo) == True
+        assert uf.conectados(0, 2)
+    
+    def test_find_many(self):
+        """Testa a consulta em lote com lista"""
+        uf = UnionFindDenso(6)
+        uf.union(0, 1)
+        uf.union(1, 2)
+        uf.union(4, 5)
+        
+        raizes = uf.find_many([0, 1, 2, 3, 4, 5])
+        assert raizes == [uf.find(i) for i in range(6)]
+        assert raizes[0] == raizes[1] == raizes[2]
+        assert raizes[4] == raizes[5]
+        assert raizes[3] == 3
+    
+    def test_find_many_numpy(self):
+        """Testa a consulta em lote vetorizada com NumPy"""
+        np = pytest.importorskip("numpy")
+        n = 1000
+        uf = UnionFindDenso(n)
+        for i in range(1, n):
+            uf.pai[i] = i - 1
+        
+        raizes = uf.find_many(np.arange(n))
+        assert (raizes == 0).all()
+        assert all(uf.pai[i] == 0 for i in range(n))
+    
+    def test_fachada_com_rotulos(self):
+        """Testa UnionFind como fachada de rótulos sobre o denso"""
+        uf = UnionFind(['a', 'b', 'c'])
+        uf.union('a', 'b')
+        uf.adicionar('d')
+        uf.union('d', 'c')
+        
+        assert uf.find('a') == uf.find('b')
+        assert uf.find_many(['a', 'b', 'c', 'd']) == [uf.find(v) for v in 'abcd']
+        assert uf.find('c') in ('c', 'd')
+
+
+class TestKruskalExterno:
+    """Testes do Kruskal em memória externa (runs em disco + k-way merge)"""
+    
+    @staticmethod
+    def _gravar(tmp_path, grafo, nome="arestas.tsv"):
+        caminho = tmp_path / nome
+        with open(caminho, 'w') as saida:
+            saida.write("# u\tv\tpeso\n")
+            for u, vizinhos in grafo.items():
+                for v, peso in vizinhos.items():
+                    saida.write(f"{u}\t{v}\t{peso}\n")
+        return caminho
+    
+    @staticmethod
+    def _grafo_aleatorio(n, m, semente):
+        aleatorio = random.Random(semente)
+        grafo = {v: {} for v in range(n)}
+        for v in range(1, n):
+            grafo[aleatorio.randrange(v)][v] = aleatorio.randint(1, 100)
+        for _ in range(m):
+            u, v = aleatorio.randrange(n), aleatorio.randrange(n)
+            if u != v:
+                grafo[u][v] = aleatorio.randint(1, 100)
+        return grafo
+    
+    @pytest.mark.parametrize("arestas_por_run", [7, 50, 1_000_000])
+    def test_mesmo_custo_do_kruskal(self, tmp_path, arestas_por_run):
+        """Testa que o custo é o mesmo do kruskal em memória"""
+        grafo = self._grafo_aleatorio(60, 300, semente=arestas_por_run)
+        caminho = self._gravar(tmp_path, grafo)
+        
+        estatisticas = {}
+        agm, custo = kruskal_externo(caminho, arestas_por_run=arestas_por_run,
+                                     tamanho_bloco=256, estatisticas=estatisticas)
+        _, custo_esperado = kruskal_direcionado(grafo)
+        
+        assert custo == custo_esperado
+        assert len(agm) == 59
+        if arestas_por_run < 300:
+            assert estatisticas['runs'] > 1
+    
+    def test_para_com_n_menos_1_arestas(self, tmp_path):
+        """Testa que a leitura da sequência para ao completar a árvore"""
+        grafo = {1: {2: 1, 3: 2}, 2: {3: 3, 4: 10}, 3: {4: 4}, 4: {}}
+        caminho = self._gravar(tmp_path, grafo)
+        
+        estatisticas = {}
+        agm, custo = kruskal_externo(caminho, arestas_por_run=2, estatisticas=estatisticas)
+        
+        assert custo == 7
+        assert estatisticas['arestas_examinadas'] == 4
+        assert estatisticas['arestas_lidas'] == 5
+    
+    def test_mesmo_vertice_com_grafias_diferentes(self, tmp_path):
+        """Testa que '1' e '01' são tratados como o mesmo vértice"""
+        caminho = tmp_path / "arestas.tsv"
+        caminho.write_text("1 2 5\n01 2 1\n2 3 1\n")
+        
+        agm, custo = kruskal_externo(caminho)
+        
+        assert custo == 2
+        assert sorted((min(u, v), max(u, v)) for u, v, _ in agm) == [(1, 2), (2, 3)]
+    
+    def test_grafo_desconexo(self, tmp_path):
+        """Testa que o resultado é uma floresta em grafos desconexos"""
+        caminho = tmp_path / "floresta.csv"
+        caminho.write_text("a,b,3\nb,c,1\nx,y,2\n")
+        
+        agm, custo = kruskal_externo(caminho, arestas_por_run=1)
+        
+        assert custo == 6
+        assert sorted((u, v) for u, v, _ in agm) == [('a', 'b'), ('b', 'c'), ('x', 'y')]
+
+class TestFiltroKruskal:
+    """Testes do modo 'filtro' (Filter-Kruskal) e da ordenação paralela"""
+    
+    @pytest.fixture
+    def limiares_baixos(self, monkeypatch):
+        """Força o particionamento e a ordenação paralela em grafos pequenos"""
+        monkeypatch.setattr(algoritmo_kruskal, 'LIMIAR_FILTRO', 8)
+        monkeypatch.setattr(algoritmo_kruskal, 'LIMIAR_ORDENACAO_PARALELA', 64)
+    
+    @pytest.mark.parametrize("semente", range(5))
+    def test_mesmo_custo_do_classico(self, limiares_baixos, semente):
+        """Testa que o custo é o mesmo do modo clássico"""
+        grafo = gerar_aleatorio(80, 600, peso_max=50, semente=semente)
+        
+        _, custo_classico = kruskal(grafo)
+        agm, custo = kruskal(grafo, modo='filtro')
+        
+        assert custo == custo_classico
+        assert len(agm) == len(kruskal(grafo)[0])
+    
+    def test_pesos_iguais(self, limiares_baixos):
+        """Testa que pesos todos iguais não impedem o particionamento"""
+        grafo = gerar_aleatorio(40, 300, peso_min=7, peso_max=7, semente=1)
+        
+        agm, custo = kruskal(grafo, modo='filtro')
+        
+        assert len(agm) == 39
+        assert custo == 7 * 39
+    
+    def test_grafo_csr(self, limiares_baixos):
+        """Testa o modo 'filtro' recebendo um GrafoCSR"""
+        grafo = gerar_aleatorio(50, 400, semente=2)
+        
+        agm, custo = kruskal(GrafoCSR.de_dict(grafo), modo='filtro')
+        
+        assert custo == kruskal(grafo)[1]
+        assert all(u in grafo and v in grafo[u] for u, v, _ in agm)
+    
+    @pytest.mark.parametrize("modo", ['classico', 'filtro'])
+    def test_ordenacao_paralela(self, limiares_baixos, monkeypatch, modo):
+        """Testa a ordenação em blocos paralelos + intercalação"""
+        chamadas = []
+        
+        class ExecutorContador(ProcessPoolExecutor):
+            def map(self, funcao, *iteraveis, **opcoes):
+                blocos = [list(iteravel) for iteravel in iteraveis]
+                chamadas.append(len(blocos[0]))
+                return super().map(funcao, *blocos, **opcoes)
+        
+        monkeypatch.setattr(algoritmo_kruskal, 'ProcessPoolExecutor', ExecutorContador)
+        grafo = gerar_aleatorio(60, 500, semente=3)
+        
+        _, custo = kruskal(grafo, modo=modo, processos=2)
+        
+        assert custo == kruskal(grafo)[1]
+        assert chamadas and all(num_blocos == 2 for num_blocos in chamadas)
+    
+    def test_modo_invalido(self):
+        """Testa que um modo desconhecido é rejeitado"""
+        with pytest.raises(ValueError):
+            kruskal({1: {2: 1}, 2: {1: 1}}, modo='inexistente')
+
+class TestAGMDinamica:
+    """Testes da AGM dinâmica (link-cut tree) contra o Kruskal recalculado"""
+    
+    @pytest.mark.parametrize("semente", range(4))
+    def test_operacoes_aleatorias(self, semente):
+        """Testa que o custo acompanha o Kruskal após cada operação"""
+        aleatorio = random.Random(semente)
+        n = 15
+        grafo = gerar_aleatorio(n, 25, peso_max=10, semente=semente)
+        dinamica = AGMDinamica(grafo, kruskal(grafo)[0])
+        
+        for _ in range(150):
+            u, v = aleatorio.randrange(n), aleatorio.randrange(n)
+            if u == v:
+                continue
+            if v in grafo[u] and aleatorio.random() < 0.3:
+                antes = set(dinamica.arestas())
+                saiu, entrou = dinamica.remover_aresta(u, v)
+                del grafo[u][v], grafo[v][u]
+            else:
+                peso = aleatorio.randint(0, 12)
+                antes = set(dinamica.arestas())
+                saiu, entrou = dinamica.atualizar_aresta(u, v, peso)
+                grafo[u][v] = grafo[v][u] = peso
+            
+            agm, custo = kruskal(grafo)
+            assert dinamica.custo_total == custo
+            assert len(dinamica.arestas()) == len(agm)
+            if saiu is None and entrou is None:
+                assert {(a, b) for a, b, _ in antes} == \
+                       {(a, b) for a, b, _ in dinamica.arestas()}
+    
+    def test_insercao_substitui_maior_aresta_do_caminho(self):
+        """Testa que a nova aresta troca a mais pesada do ciclo formado"""
+        grafo = {1: {2: 1}, 2: {3: 5}, 3: {4: 2}, 4: {}}
+        dinamica = AGMDinamica(grafo)
+        
+        assert dinamica.maior_aresta(1, 4) == (2, 3, 5)
+        saiu, entrou = dinamica.atualizar_aresta(1, 4, 3)
+        
+        assert saiu == (2, 3, 5)
+        assert entrou == (1, 4, 3)
+        assert dinamica.custo_total == 6
+        assert not dinamica.pertence(2, 3)
+    
+    def test_remocao_sem_reconexao(self):
+        """Testa que a remoção de uma ponte divide a árvore em duas"""
+        dinamica = AGMDinamica(GrafoCSR.de_dict({'a': {'b': 1, 'c': 2}, 'c': {'d': 4}}))
+        
+        saiu, entrou = dinamica.remover_aresta('c', 'd')
+        
+        assert saiu == ('c', 'd', 4) or saiu == ('d', 'c', 4)
+        assert entrou is None
+        assert not dinamica.conectados('a', 'd')
+        assert dinamica.custo_total == 3
+        with pytest.raises(KeyError):
+            dinamica.remover_aresta('c', 'd')
+    
+    def test_candidatas_limitadas(self):
+        """Testa que o heap de reconexão só guarda arestas de F_D e de B"""
+        aleatorio = random.Random(7)
+        n = 40
+        grafo = gerar_aleatorio(n, 200, peso_max=30, semente=7)
+        dinamica = AGMDinamica(grafo)
+        
+        for _ in range(300):
+            u, v = aleatorio.sample(range(n), 2)
+            if v in grafo[u] and aleatorio.random() < 0.5:
+                dinamica.remover_aresta(u, v)
+                del grafo[u][v], grafo[v][u]
+            else:
+                peso = aleatorio.randint(0, 30)
+                dinamica.atualizar_aresta(u, v, peso)
+                grafo[u][v] = grafo[v][u] = peso
+            
+            assert dinamica.custo_total == kruskal(grafo)[1]
+            assert dinamica._num_fora <= 2 * dinamica._novas <= 2 * dinamica._limite
+    
+    def test_agm_inicial_com_ciclo(self):
+        """Testa que uma AGM inicial com ciclo é rejeitada"""
+        grafo = {1: {2: 1, 3: 1}, 2: {3: 1}}
+        with pytest.raises(ValueError):
+            AGMDinamica(grafo, [(1, 2, 1), (2, 3, 1), (1, 3, 1)])
+
+
+
+class TestFlorestaDecremental:
+    """Testes da estrutura de níveis (só remoções) contra o Kruskal"""
+    
+    @pytest.mark.parametrize("semente", range(4))
+    def test_remocoes_aleatorias(self, semente):
+        """Testa a floresta e as substitutas após cada remoção"""
+        aleatorio = random.Random(semente)
+        n = 30
+        pesos = {}
+        for _ in range(120):
+            i, j = sorted(aleatorio.sample(range(n), 2))
+            pesos[(i, j)] = aleatorio.randint(0, 8)
+        grafo = {v: {} for v in range(n)}
+        for (i, j), peso in pesos.items():
+            grafo[i][j] = peso
+        floresta = {tuple(sorted((u, v))) for u, v, _ in kruskal_direcionado(grafo)[0]}
+        estrutura = _FlorestaDecremental(
+            n, floresta, [(peso,) + chave for chave, peso in pesos.items() if chave not in floresta])
+        
+        ordem = list(pesos)
+        aleatorio.shuffle(ordem)
+        for chave in ordem:
+            substituta = estrutura.remover(chave)
+            del pesos[chave]
+            del grafo[chave[0]][chave[1]]
+            if chave in floresta:
+                floresta.remove(chave)
+                if substituta is not None:
+                    floresta.add(substituta)
+            else:
+                assert substituta is None
+            
+            assert all(estrutura.na_floresta(c) == (c in floresta) for c in pesos)
+            assert sum(pesos[c] for c in floresta) == kruskal_direcionado(grafo)[1]
+            # Cada nível i tem árvores de no máximo n / 2^i vértices
+            assert max(estrutura._nivel.values(), default=0) < n.bit_length()
+
 if __name__ == "__main__":
     # Executa os testes com pytest
     pytest.main([__file__, "-v"])
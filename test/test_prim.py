@@ -0,0 +1,129 @@
+"""
+Testes para o Algoritmo de Prim
+"""
+
+import pytest
+from algoritmo_kruskal import kruskal
+from algoritmo_prim import algoritmo_prim, FilaPrioridadeIndexada
+from geradores_grafos import gerar_aleatorio
+from grafo_csr import GrafoCSR
+
+MODOS = ['classico', 'preguicoso', 'ansioso']
+
+
+class TestMotores:
+    """Testes dos três motores contra o Kruskal"""
+
+    @pytest.mark.parametrize("csr", [False, True])
+    @pytest.mark.parametrize("modo", MODOS)
+    @pytest.mark.parametrize("semente", range(3))
+    def test_mesmo_custo_do_kruskal(self, modo, csr, semente):
+        """Testa custo e número de arestas em grafos conexos"""
+        grafo = gerar_aleatorio(40, 150, peso_max=20, semente=semente)
+        for v in range(1, 40):
+            # Garante a conexidade com um caminho 0 - 1 - ... - 39
+            grafo[v - 1].setdefault(v, 25)
+            grafo[v].setdefault(v - 1, grafo[v - 1][v])
+        entrada = GrafoCSR.de_dict(grafo) if csr else grafo
+
+        agm, custo = algoritmo_prim(entrada, 0, modo=modo)
+
+        assert custo == kruskal(grafo)[1]
+        assert len(agm) == 39
+        assert all(grafo[j][k] == peso for peso, j, k in agm)
+
+    @pytest.mark.parametrize("csr", [False, True])
+    @pytest.mark.parametrize("modo", MODOS)
+    def test_grafo_desconexo(self, modo, csr, capsys):
+        """Testa que só a componente do nó inicial é coberta"""
+        grafo = {
+            1: {2: 3, 3: 1}, 2: {1: 3, 3: 1}, 3: {1: 1, 2: 1},
+            4: {5: 7}, 5: {4: 7},
+        }
+        entrada = GrafoCSR.de_dict(grafo) if csr else grafo
+
+        agm, custo = algoritmo_prim(entrada, 1, modo=modo)
+
+        componente = {v: grafo[v] for v in (1, 2, 3)}
+        assert custo == kruskal(componente)[1] == 2
+        assert len(agm) == 2
+        assert "não ser conexo" in capsys.readouterr().out
+
+
+class TestEstatisticas:
+    """Testes das contagens de operações da fila"""
+
+    @pytest.fixture
+    def grafo(self):
+        return {
+            'a': {'b': 4, 'c': 1},
+            'b': {'a': 4, 'c': 2, 'd': 5},
+            'c': {'a': 1, 'b': 2, 'd': 8},
+            'd': {'b': 5, 'c': 8},
+        }
+
+    def test_preguicoso(self, grafo):
+        """Testa inserções, remoções e arestas descartadas do modo preguiçoso"""
+        estatisticas = {}
+        agm, custo = algoritmo_prim(grafo, 'a', modo='preguicoso', estatisticas=estatisticas)
+
+        assert custo == 8
+        # a: a-b, a-c; c: c-b, c-d; b: b-d
+        assert estatisticas['insercoes'] == 5
+        assert estatisticas['remocoes'] - estatisticas['descartadas'] == len(agm)
+        assert estatisticas['remocoes'] <= estatisticas['insercoes']
+
+    def test_ansioso(self, grafo):
+        """Testa inserções, remoções e diminuições de chave do modo ansioso"""
+        estatisticas = {}
+        _, custo = algoritmo_prim(grafo, 'a', modo='ansioso', estatisticas=estatisticas)
+
+        assert custo == 8
+        assert estatisticas['insercoes'] == 4
+        assert estatisticas['remocoes'] == 4
+        # b: 4 -> 2 (via c); d: 8 -> 5 (via b)
+        assert estatisticas['diminuicoes_chave'] == 2
+
+    def test_classico_nao_preenche(self, grafo):
+        """Testa que o modo clássico não usa fila"""
+        estatisticas = {}
+        algoritmo_prim(grafo, 'a', estatisticas=estatisticas)
+
+        assert estatisticas == {}
+
+    def test_modo_invalido(self, grafo):
+        """Testa que um modo desconhecido é rejeitado"""
+        with pytest.raises(ValueError):
+            algoritmo_prim(grafo, 'a', modo='fibonacci')
+
+
+class TestFilaPrioridadeIndexada:
+    """Testes da fila de prioridade com diminuição de chave"""
+
+    def test_ordem_de_remocao(self):
+        """Testa que as remoções saem em ordem de prioridade"""
+        fila = FilaPrioridadeIndexada()
+        for chave, prioridade in [('a', 5), ('b', 3), ('c', 8), ('d', 1)]:
+            fila.inserir(chave, prioridade)
+        fila.diminuir_chave('c', 2)
+
+        removidos = [fila.remover_minimo() for _ in range(len(fila))]
+
+        assert removidos == [('d', 1), ('c', 2), ('b', 3), ('a', 5)]
+        assert (fila.insercoes, fila.remocoes, fila.diminuicoes) == (4, 4, 1)
+
+    def test_erros(self):
+        """Testa chave repetida e aumento de prioridade"""
+        fila = FilaPrioridadeIndexada()
+        fila.inserir('a', 5)
+
+        assert 'a' in fila and fila.prioridade('a') == 5
+        with pytest.raises(KeyError):
+            fila.inserir('a', 1)
+        with pytest.raises(ValueError):
+            fila.diminuir_chave('a', 9)
+
+
+if __name__ == "__main__":
+    # Executa os testes com pytest
+    pytest.main([__file__, "-v"])